@@ -0,0 +1,38 @@
+"""Building fixtures of wide models by `__init__` against `configure(construct='fast')`"""
+import typing
+import timeit
+import dataclasses
+from fixtures_generator import DataclassFixturesGenerator
+
+FIELDS: typing.List[typing.Tuple[str, typing.Any]] = (
+    [(f'flag_{i}', typing.Optional[bool]) for i in range(8)]
+    + [(f'int_{i}', int) for i in range(4)]
+    + [(f'float_{i}', float) for i in range(4)]
+    + [(f'str_{i}', str) for i in range(4)]
+)
+
+
+def _check(self: typing.Any) -> None:
+    if self.int_0 < 0:
+        raise ValueError('int_0 must not be negative')
+
+
+Wide = dataclasses.make_dataclass('Wide', FIELDS)
+FrozenWide = dataclasses.make_dataclass('FrozenWide', FIELDS, frozen=True, namespace={'__post_init__': _check})
+NUMBER: int = 5
+
+
+def main() -> None:
+    fast: typing.Type[DataclassFixturesGenerator] = DataclassFixturesGenerator.configure(construct='fast')
+    print(f'{"model":<12}{"fixtures":>10}{"init, ms":>10}{"fast, ms":>10}{"speedup":>10}')
+    for model in (Wide, FrozenWide):
+        count: int = DataclassFixturesGenerator.count_fixtures(model)
+        init_ms: float = timeit.timeit(
+            lambda: DataclassFixturesGenerator.generate_fixtures(model), number=NUMBER,
+        ) / NUMBER * 1000
+        fast_ms: float = timeit.timeit(lambda: fast.generate_fixtures(model), number=NUMBER) / NUMBER * 1000
+        print(f'{model.__name__:<12}{count:>10}{init_ms:>10.1f}{fast_ms:>10.1f}{init_ms / fast_ms:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
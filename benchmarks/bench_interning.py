@@ -0,0 +1,47 @@
+"""Memory of a large fixture list with and without interning of repeated immutable values, measured by tracemalloc"""
+import typing
+import dataclasses
+import tracemalloc
+from fixtures_generator import DataclassFixturesGenerator
+
+
+@dataclasses.dataclass(frozen=True)
+class Flags:
+    a: bool
+    b: typing.Optional[bool]
+    c: typing.Optional[bool]
+    tags: typing.FrozenSet[str] = frozenset({'x', 'y'})
+
+
+@dataclasses.dataclass
+class Record:
+    a: typing.Optional[bool]
+    b: typing.Optional[bool]
+    c: typing.Optional[bool]
+    d: typing.Optional[bool]
+    first: Flags  # nested fields are built again for every combination of the preceding ones
+    second: typing.Optional[Flags]
+
+
+def measure(generator: typing.Type[DataclassFixturesGenerator]) -> typing.Tuple[int, int]:
+    """The number of fixtures and the bytes they take"""
+    tracemalloc.start()
+    fixtures: typing.List[Record] = list(generator.iter_fixtures(Record))
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return len(fixtures), size
+
+
+def main() -> None:
+    count: int
+    plain: int
+    interned: int
+    count, plain = measure(DataclassFixturesGenerator)
+    _count, interned = measure(DataclassFixturesGenerator.configure(intern=True))
+    print(f'{count} fixtures')
+    print(f'{"plain":<10}{plain / 2 ** 20:>10.1f} MiB')
+    print(f'{"interned":<10}{interned / 2 ** 20:>10.1f} MiB{plain / interned:>8.1f}x smaller')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+"""Per-value cost of random scalars: calls of the random module against the batched ScalarEngine"""
+import random
+import string
+import timeit
+from fixtures_generator.scalar_engine import ScalarEngine
+
+NUMBER: int = 100000
+
+
+def main() -> None:
+    rng: random.Random = random.Random(1)
+    engine: ScalarEngine = ScalarEngine(rng=random.Random(1))
+    cases = (
+        ('int', lambda: rng.randint(0, 10000), engine.next_int),
+        ('float', lambda: rng.uniform(0.0, 10000.0), engine.next_float),
+        ('str', lambda: ''.join(rng.choices(string.ascii_letters, k=5)), engine.next_str),
+    )
+    print(f'{"type":<8}{"random, ns":>12}{"engine, ns":>12}{"speedup":>10}')
+    for name, per_call, batched in cases:
+        per_call_ns: float = timeit.timeit(per_call, number=NUMBER) / NUMBER * 1e9
+        batched_ns: float = timeit.timeit(batched, number=NUMBER) / NUMBER * 1e9
+        print(f'{name:<8}{per_call_ns:>12.0f}{batched_ns:>12.0f}{per_call_ns / batched_ns:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
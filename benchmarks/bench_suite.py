@@ -0,0 +1,230 @@
+"""
+Speed and memory of fixtures generation of synthetic stress models for dataclasses, attrs and pydantic
+
+Every model is built for every installed backend, fixtures/s is measured by timeit and the peak bytes of a fixture list
+by tracemalloc. Results are saved as JSON, a previous result file given by --compare is reported side by side:
+
+    python benchmarks/bench_suite.py --output before.json
+    python benchmarks/bench_suite.py --compare before.json
+"""
+import enum
+import json
+import time
+import typing
+import timeit
+import argparse
+import platform
+import itertools
+import dataclasses
+import tracemalloc
+import fixtures_generator
+from fixtures_generator import DataclassFixturesGenerator
+
+_Fields = typing.List[typing.Tuple[str, typing.Any]]
+_MakeModel = typing.Callable[[str, _Fields], typing.Type]
+
+LIMIT: int = 10000
+NUMBER: int = 3
+BigEnum = enum.Enum('BigEnum', [f'MEMBER_{i}' for i in range(500)])  # type: ignore[misc]
+
+
+def _make_dataclass(name: str, fields: _Fields) -> typing.Type:
+    return dataclasses.make_dataclass(name, fields)
+
+
+def _make_attrs(name: str, fields: _Fields) -> typing.Type:
+    import attr
+    return attr.make_class(name, {field_name: attr.ib(type=type_) for field_name, type_ in fields})
+
+
+def _make_pydantic(name: str, fields: _Fields) -> typing.Type:
+    import pydantic
+    return pydantic.create_model(name, **{field_name: (type_, ...) for field_name, type_ in fields})  # type: ignore
+
+
+def _get_backends() -> typing.Dict[str, typing.Tuple[typing.Type[DataclassFixturesGenerator], _MakeModel]]:
+    """Generators and model factories of the installed backends"""
+    backends: typing.Dict[str, typing.Tuple[typing.Type[DataclassFixturesGenerator], _MakeModel]] = {
+        'dataclasses': (DataclassFixturesGenerator, _make_dataclass),
+    }
+    try:
+        from fixtures_generator.attrs_fixtures_generator import AttrsFixturesGenerator
+        backends['attrs'] = (AttrsFixturesGenerator, _make_attrs)
+    except ImportError:
+        pass
+
+    try:
+        from fixtures_generator.pydantic_fixtures_generator import PydanticFixturesGenerator
+        backends['pydantic'] = (PydanticFixturesGenerator, _make_pydantic)
+    except ImportError:
+        pass
+
+    return backends
+
+
+def wide_model(make_model: _MakeModel) -> typing.Type:
+    """100 flat fields of scalars"""
+    types: typing.Tuple[typing.Any, ...] = (int, float, str, bool)
+    return make_model('Wide', [(f'field_{i}', types[i % len(types)]) for i in range(100)])
+
+
+def deep_model(make_model: _MakeModel) -> typing.Type:
+    """10 levels of nested models"""
+    model: typing.Type = make_model('Level10', [('x', int), ('flag', typing.Optional[bool])])
+    level: int
+    for level in range(9, 0, -1):
+        model = make_model(f'Level{level}', [('x', int), ('flag', typing.Optional[bool]), ('child', model)])
+
+    return model
+
+
+def union_model(make_model: _MakeModel) -> typing.Type:
+    """Optional and Union fields only"""
+    types: typing.Tuple[typing.Any, ...] = (
+        typing.Optional[int],
+        typing.Union[int, str, None],
+        typing.Optional[bool],
+        typing.Union[float, str, bool],
+    )
+    return make_model('Unions', [(f'field_{i}', types[i % len(types)]) for i in range(24)])
+
+
+def enum_model(make_model: _MakeModel) -> typing.Type:
+    """Fields of a 500 members enum"""
+    types: typing.Tuple[typing.Any, ...] = (BigEnum, typing.Optional[BigEnum])
+    return make_model('Enums', [(f'field_{i}', types[i % len(types)]) for i in range(20)])
+
+
+def collections_model(make_model: _MakeModel) -> typing.Type:
+    """Collections and mappings of models"""
+    item: typing.Type = make_model('Item', [('x', int), ('name', str), ('flag', typing.Optional[bool])])
+    return make_model('Collections', [
+        ('items', typing.List[item]),  # type: ignore[valid-type]
+        ('by_name', typing.Dict[str, item]),  # type: ignore[valid-type]
+        ('best', typing.Optional[item]),
+    ] + [(f'flag_{i}', typing.Optional[bool]) for i in range(4)])
+
+
+MODELS: typing.Dict[str, typing.Callable[[_MakeModel], typing.Type]] = {
+    'wide': wide_model,
+    'deep': deep_model,
+    'unions': union_model,
+    'enums': enum_model,
+    'collections': collections_model,
+}
+
+
+def _generate(generator: typing.Type[DataclassFixturesGenerator], model: typing.Type, limit: int) -> typing.List:
+    return list(itertools.islice(generator.iter_fixtures(model), limit))
+
+
+def measure(
+    generator: typing.Type[DataclassFixturesGenerator],
+    model: typing.Type,
+    limit: int,
+    number: int,
+) -> typing.Dict[str, typing.Any]:
+    """Fixtures/s of the first limit fixtures of the model and the peak bytes of generating them"""
+    count: int = len(_generate(generator=generator, model=model, limit=limit))  # plans are compiled once
+    seconds: float = min(timeit.repeat(lambda: _generate(generator, model, limit), number=1, repeat=number))
+    tracemalloc.start()
+    _generate(generator=generator, model=model, limit=limit)
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'fixtures': count,
+        'total_fixtures': generator.count_fixtures(model),
+        'seconds': seconds,
+        'fixtures_per_second': count / seconds if seconds else 0.0,
+        'peak_bytes': peak,
+    }
+
+
+def run(
+    limit: int = LIMIT,
+    number: int = NUMBER,
+    models: typing.Optional[typing.Sequence[str]] = None,
+    backends: typing.Optional[typing.Sequence[str]] = None,
+) -> typing.Dict[str, typing.Any]:
+    """Results of the benchmarks of the models for the backends, all of them by default"""
+    results: typing.List[typing.Dict[str, typing.Any]] = []
+    backend: str
+    generator: typing.Type[DataclassFixturesGenerator]
+    make_model: _MakeModel
+    for backend, (generator, make_model) in _get_backends().items():
+        if backends and backend not in backends:
+            continue
+
+        name: str
+        for name, model_factory in MODELS.items():
+            if models and name not in models:
+                continue
+
+            result: typing.Dict[str, typing.Any] = {'backend': backend, 'model': name}
+            result.update(measure(generator=generator, model=model_factory(make_model), limit=limit, number=number))
+            results.append(result)
+
+    return {
+        'version': fixtures_generator.__version__,
+        'python': platform.python_version(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'limit': limit,
+        'results': results,
+    }
+
+
+def _format(result: typing.Dict[str, typing.Any], previous: typing.Optional[typing.Dict[str, typing.Any]] = None) -> str:
+    line: str = (
+        f'{result["backend"]:<12}{result["model"]:<12}{result["fixtures"]:>8}'
+        f'{result["fixtures_per_second"]:>14.0f}{result["peak_bytes"] / 2 ** 20:>10.1f}'
+    )
+    if previous is not None:
+        line += (
+            f'{result["fixtures_per_second"] / previous["fixtures_per_second"]:>9.2f}x'
+            f'{result["peak_bytes"] / previous["peak_bytes"]:>9.2f}x'
+        )
+
+    return line
+
+
+def report(report_: typing.Dict[str, typing.Any], previous: typing.Optional[typing.Dict[str, typing.Any]] = None) -> None:
+    """Table of the results, speed and memory ratios to the previous results of the same benchmarks"""
+    previous_results: typing.Dict[typing.Tuple[str, str], typing.Dict[str, typing.Any]] = {
+        (result['backend'], result['model']): result for result in (previous or {}).get('results', ())
+    }
+    header: str = f'{"backend":<12}{"model":<12}{"fixtures":>8}{"fixtures/s":>14}{"peak, MiB":>10}'
+    if previous is not None:
+        header += f'{"speed":>10}{"memory":>10}  against {previous["version"]}'
+
+    print(header)
+    result: typing.Dict[str, typing.Any]
+    for result in report_['results']:
+        print(_format(result=result, previous=previous_results.get((result['backend'], result['model']))))
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-o', '--output', help='save the results as JSON')
+    parser.add_argument('--compare', help='JSON results of a previous run')
+    parser.add_argument('-n', '--limit', type=int, default=LIMIT, help=f'fixtures of every model, {LIMIT} by default')
+    parser.add_argument('--number', type=int, default=NUMBER, help='timing repeats, the best one is reported')
+    parser.add_argument('--model', action='append', choices=tuple(MODELS), help='models to run, all by default')
+    parser.add_argument('--backend', action='append', help='backends to run, all installed by default')
+    arguments: argparse.Namespace = parser.parse_args(argv)
+
+    previous: typing.Optional[typing.Dict[str, typing.Any]] = None
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            previous = json.load(file)
+
+    results: typing.Dict[str, typing.Any] = run(
+        limit=arguments.limit, number=arguments.number, models=arguments.model, backends=arguments.backend,
+    )
+    report(report_=results, previous=previous)
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,7 @@
 from importlib.metadata import version
+from .combination_strategies import *
+from .scalar_engine import *
+from .generation_stats import *
 from .dataclass_fixtures_generator import *
 
 __version__ = version("dataclass-fixtures-generator")
@@ -0,0 +1,98 @@
+"""Helpers shared by the CLI, the SQLite loader, the fixture cache and the pytest plugin"""
+import sys
+import enum
+import typing
+import itertools
+import dataclasses
+from .dataclass_fixtures_generator import FieldInfo, FieldKind, TypePlan, DataclassFixturesGenerator
+
+_BATCH_SIZE: int = 1000
+_Path = typing.Tuple[str, ...]
+
+
+def _get_generator(cls_: typing.Type) -> typing.Type[DataclassFixturesGenerator]:
+    """
+    The generator of the dataclass, attrs class or pydantic model.
+
+    attrs and pydantic are optional, if the module of the class did not import them, the class is not theirs.
+    """
+    if 'attr' in sys.modules and sys.modules['attr'].has(cls_):
+        from .attrs_fixtures_generator import AttrsFixturesGenerator
+        return AttrsFixturesGenerator
+
+    if 'pydantic' in sys.modules and isinstance(cls_, type) and issubclass(cls_, sys.modules['pydantic'].BaseModel):
+        from .pydantic_fixtures_generator import PydanticFixturesGenerator
+        return PydanticFixturesGenerator
+
+    if dataclasses.is_dataclass(cls_):
+        return DataclassFixturesGenerator
+
+    raise TypeError(f'{cls_} is not a dataclass, attrs class or pydantic model')
+
+
+def _get_plan(generator: typing.Type[DataclassFixturesGenerator], cls_: typing.Type) -> TypePlan:
+    return generator._get_plan(field_info=FieldInfo(field_name='-', field_type=cls_, default_value=None, default_factory=None))
+
+
+def _to_data(generator: typing.Type[DataclassFixturesGenerator], value: typing.Any) -> typing.Any:
+    """JSON compatible representation of the fixture value"""
+    if isinstance(value, enum.Enum):
+        return value.value
+
+    if isinstance(value, dict):
+        return {key: _to_data(generator, item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_to_data(generator, item) for item in value]
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    plan: TypePlan = _get_plan(generator=generator, cls_=type(value))
+    if plan.kind is FieldKind.DATACLASS:
+        return {name: _to_data(generator, getattr(value, name)) for name in plan.field_names}
+
+    if dataclasses.is_dataclass(value):  # a plain dataclass nested in an attrs class or a pydantic model
+        return {field.name: _to_data(generator, getattr(value, field.name)) for field in dataclasses.fields(value)}
+
+    return value
+
+
+def _get_column_fields(
+    generator: typing.Type[DataclassFixturesGenerator],
+    cls_: typing.Type,
+    seen: typing.Tuple[typing.Type, ...] = (),
+) -> typing.List[typing.Tuple[_Path, FieldInfo]]:
+    """
+    Paths of the columns and their fields, fields of nested dataclasses are flattened like `generate_columns` does,
+    seen are the dataclasses the class is nested into, dataclasses nested into themselves are not flattened
+    """
+    columns: typing.List[typing.Tuple[_Path, FieldInfo]] = []
+    seen = seen + (cls_,)
+    field: FieldInfo
+    for field in _get_plan(generator=generator, cls_=cls_).fields:
+        plan: TypePlan
+        plan, field = generator._resolve_plan(field_info=field)
+        if (
+            plan.kind is FieldKind.DATACLASS
+            and field.default_value is None
+            and not field.default_factory
+            and field.field_type not in seen
+        ):
+            columns.extend(
+                ((field.field_name,) + path, column_field)
+                for path, column_field in _get_column_fields(generator=generator, cls_=field.field_type, seen=seen)
+            )
+        else:
+            columns.append(((field.field_name,), field))
+
+    return columns
+
+
+def _iter_batches(
+    fixtures: typing.Iterable[typing.Any],
+    batch_size: int = _BATCH_SIZE,
+) -> typing.Iterator[typing.Tuple[typing.Any, ...]]:
+    """Fixtures by batches, every batch is written or inserted at once"""
+    iterator: typing.Iterator[typing.Any] = iter(fixtures)
+    return iter(lambda: tuple(itertools.islice(iterator, batch_size)), ())
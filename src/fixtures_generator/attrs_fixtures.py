@@ -11,6 +11,7 @@ __all__ = (
     'SimpleDefaultsAttrs',
     'SimpleDefaultFactoriesAttrs',
     'OptionalAttrs',
+    'FrozenSlotsAttrs',
 )
 
 
@@ -42,3 +43,11 @@ class OptionalAttrs:
     z: typing.List[typing.Optional[str]] = attr.ib()
     d: typing.Dict[str, int] = attr.ib()
     s: SimpleAttrs = attr.ib()
+
+
+@attr.s(frozen=True, slots=True)
+class FrozenSlotsAttrs:
+    x: int = attr.ib()
+    flag: bool = attr.ib()
+    doubled: int = attr.ib(init=False, default=attr.Factory(lambda self: self.x * 2, takes_self=True))
+    tags: typing.List[str] = attr.ib(init=False, factory=list)
@@ -1,6 +1,7 @@
 import typing
+import functools
 import attr
-from .dataclass_fixtures_generator import FieldInfo, DataclassFixturesGenerator
+from .dataclass_fixtures_generator import FieldInfo, DataclassFixturesGenerator, _make_default, _make_by_factory
 
 __all__ = (
     'IsNotAttrsError',
@@ -25,12 +26,13 @@ class AttrsFixturesGenerator(DataclassFixturesGenerator):
     @classmethod
     def _get_fields(cls, cls_: typing.Type) -> typing.Tuple[FieldInfo, ...]:
         fields: typing.Tuple[attr.Attribute, ...] = attr.fields(cls_)
+        hints: typing.Dict[str, typing.Any] = cls._get_type_hints(cls_=cls_)
 
         field: attr.Attribute
         fields_info: typing.Tuple[FieldInfo, ...] = tuple(
             FieldInfo(
                 field_name=field.name,
-                field_type=typing.cast(type, field.type),
+                field_type=typing.cast(type, hints.get(field.name, field.type)),
                 default_value=(
                     field.default if (
                         field.default != attr.NOTHING
@@ -43,10 +45,29 @@ class AttrsFixturesGenerator(DataclassFixturesGenerator):
                         and isinstance(field.default, typing.cast(typing.Type, attr.Factory))
                     ) else None
                 ),
-            ) for field in fields
+            ) for field in fields if field.init
         )
         return fields_info
 
+    @classmethod
+    def _get_non_init_fields(cls, cls_: typing.Type) -> typing.Tuple[typing.Tuple[str, typing.Callable], ...]:
+        non_init_fields: typing.List[typing.Tuple[str, typing.Callable]] = []
+        field: attr.Attribute
+        for field in attr.fields(cls_):
+            if field.init or field.default is attr.NOTHING:
+                continue
+
+            if isinstance(field.default, typing.cast(typing.Type, attr.Factory)):
+                factory: typing.Callable = getattr(field.default, 'factory')
+                if getattr(field.default, 'takes_self'):
+                    non_init_fields.append((field.name, factory))
+                else:
+                    non_init_fields.append((field.name, functools.partial(_make_by_factory, factory)))
+            else:
+                non_init_fields.append((field.name, functools.partial(_make_default, field.default)))
+
+        return tuple(non_init_fields)
+
     @classmethod
     def _is_dataclass(cls, field_info: FieldInfo) -> bool:
         """True if field is an attrs dataclass"""
@@ -0,0 +1,146 @@
+import sys
+import csv
+import json
+import time
+import typing
+import argparse
+import functools
+import importlib
+import itertools
+from .dataclass_fixtures_generator import DataclassFixturesGenerator
+from ._common import _Path, _get_generator, _to_data, _get_column_fields, _iter_batches
+
+__all__ = (
+    'main',
+)
+
+_BUFFER_SIZE: int = 1 << 20
+
+
+def _load_target(target: str) -> typing.Type:
+    """The class by its `module:Class` path"""
+    module_name: str
+    _colon: str
+    qualified_name: str
+    module_name, _colon, qualified_name = target.partition(':')
+    if not module_name or not qualified_name:
+        raise ValueError(f'target=={target} is not module:Class')
+
+    return typing.cast(
+        typing.Type,
+        functools.reduce(getattr, qualified_name.split('.'), importlib.import_module(module_name)),
+    )
+
+
+def _get_columns(generator: typing.Type[DataclassFixturesGenerator], cls_: typing.Type) -> typing.List[_Path]:
+    """Paths of the CSV columns, see `_get_column_fields`"""
+    return [path for path, _field in _get_column_fields(generator=generator, cls_=cls_)]
+
+
+def _to_cell(generator: typing.Type[DataclassFixturesGenerator], value: typing.Any) -> typing.Any:
+    """CSV cell of the fixture value, nested structures are JSON encoded"""
+    data: typing.Any = _to_data(generator, value)
+    if isinstance(data, (dict, list)):
+        return json.dumps(data, default=str)
+
+    if data is None:
+        return ''
+
+    return data
+
+
+def _write_jsonl(
+    generator: typing.Type[DataclassFixturesGenerator],
+    fixtures: typing.Iterable[typing.Any],
+    output: typing.TextIO,
+) -> int:
+    count: int = 0
+    batch: typing.Tuple[typing.Any, ...]
+    for batch in _iter_batches(fixtures):
+        output.write(''.join(json.dumps(_to_data(generator, fixture), default=str) + '\n' for fixture in batch))
+        count += len(batch)
+
+    return count
+
+
+def _write_csv(
+    generator: typing.Type[DataclassFixturesGenerator],
+    cls_: typing.Type,
+    fixtures: typing.Iterable[typing.Any],
+    output: typing.TextIO,
+) -> int:
+    paths: typing.List[_Path] = _get_columns(generator=generator, cls_=cls_)
+    writer = csv.writer(output)
+    writer.writerow(['.'.join(path) for path in paths])
+    count: int = 0
+    batch: typing.Tuple[typing.Any, ...]
+    for batch in _iter_batches(fixtures):
+        writer.writerows(
+            [_to_cell(generator, functools.reduce(getattr, path, fixture)) for path in paths] for fixture in batch
+        )
+        count += len(batch)
+
+    return count
+
+
+def _parse_seed(seed: str) -> typing.Union[int, str]:
+    try:
+        return int(seed)
+    except ValueError:
+        return seed
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog='python -m fixtures_generator',
+        description='Stream fixtures of a dataclass, attrs class or pydantic model as JSON Lines or CSV',
+    )
+    parser.add_argument('target', help='the class as module:Class')
+    parser.add_argument('-o', '--output', help='the output file, stdout by default')
+    parser.add_argument('-f', '--format', choices=('jsonl', 'csv'), default='jsonl', help='jsonl by default')
+    parser.add_argument('-n', '--limit', type=int, help='the maximal number of fixtures')
+    parser.add_argument('--seed', type=_parse_seed, help='seed of the random values')
+    parser.add_argument('--strategy', choices=('product', 'each_choice', 'pairwise'), help='product by default')
+    return parser
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """Entry point of `python -m fixtures_generator`"""
+    parser: argparse.ArgumentParser = _get_parser()
+    arguments: argparse.Namespace = parser.parse_args(argv)
+    try:
+        cls_: typing.Type = _load_target(target=arguments.target)
+        generator: typing.Type[DataclassFixturesGenerator] = _get_generator(cls_=cls_)
+    except (ImportError, AttributeError, ValueError, TypeError) as e:
+        parser.error(str(e))
+
+    generator = generator.configure(strategy=arguments.strategy, seed=arguments.seed)
+    fixtures: typing.Iterable[typing.Any] = generator.iter_fixtures(cls_=cls_)
+    if arguments.limit is not None:
+        fixtures = itertools.islice(fixtures, arguments.limit)
+
+    started: float = time.perf_counter()
+    output: typing.TextIO
+    if arguments.output is None:
+        output = sys.stdout
+    else:
+        output = open(arguments.output, 'w', buffering=_BUFFER_SIZE, newline='' if arguments.format == 'csv' else None)
+
+    try:
+        count: int
+        if arguments.format == 'csv':
+            count = _write_csv(generator=generator, cls_=cls_, fixtures=fixtures, output=output)
+        else:
+            count = _write_jsonl(generator=generator, fixtures=fixtures, output=output)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        else:
+            output.flush()
+
+    elapsed: float = time.perf_counter() - started
+    print(
+        f'{count} fixtures of {cls_.__name__} in {elapsed:.3f}s, {count / elapsed if elapsed else 0:.0f} fixtures/s',
+        file=sys.stderr,
+    )
+    return 0
@@ -0,0 +1,246 @@
+import abc
+import math
+import typing
+import itertools
+import functools
+
+__all__ = (
+    'UnknownStrategyError',
+    'CombinationStrategy',
+    'ProductStrategy',
+    'EachChoiceStrategy',
+    'TWiseStrategy',
+    'PairwiseStrategy',
+    'get_strategy',
+)
+
+
+class UnknownStrategyError(ValueError):
+    """Provided combination strategy name is unknown"""
+    pass
+
+
+class CombinationStrategy(abc.ABC):
+    """Chooses which combinations of fields values become fixtures"""
+
+    @abc.abstractmethod
+    def indices(self, sizes: typing.Sequence[int]) -> typing.Iterator[typing.Tuple[int, ...]]:
+        """Rows of indices of fields values, sizes are the numbers of values of every field"""
+
+    def count(self, sizes: typing.Sequence[int]) -> int:
+        """The number of rows `indices` yields"""
+        return sum(1 for _row in self.indices(sizes))
+
+    def row(self, sizes: typing.Sequence[int], index: int) -> typing.Tuple[int, ...]:
+        """The row of `indices` by its index"""
+        row: typing.Optional[typing.Tuple[int, ...]] = None
+        if index >= 0:
+            row = next(itertools.islice(self.indices(sizes), index, None), None)
+
+        if row is None:
+            raise IndexError(f'row index=={index} out of range')
+
+        return row
+
+    def combinations(
+        self,
+        values: typing.Sequence[typing.Sequence[typing.Any]],
+    ) -> typing.Iterator[typing.Tuple[typing.Any, ...]]:
+        """Combinations of fields values, one combination per fixture"""
+        row: typing.Tuple[int, ...]
+        for row in self.indices([len(field_values) for field_values in values]):
+            yield tuple(field_values[index] for field_values, index in zip(values, row))
+
+
+class ProductStrategy(CombinationStrategy):
+    """Every combination of fields values, the cartesian product"""
+
+    def indices(self, sizes: typing.Sequence[int]) -> typing.Iterator[typing.Tuple[int, ...]]:
+        return itertools.product(*(range(size) for size in sizes))
+
+    def count(self, sizes: typing.Sequence[int]) -> int:
+        return math.prod(sizes)
+
+    def row(self, sizes: typing.Sequence[int], index: int) -> typing.Tuple[int, ...]:
+        """The row as digits of the index in the mixed radix numeral system of sizes"""
+        if not 0 <= index < self.count(sizes):
+            raise IndexError(f'row index=={index} out of range')
+
+        row: typing.List[int] = [0] * len(sizes)
+        position: int
+        for position in reversed(range(len(sizes))):
+            index, row[position] = divmod(index, sizes[position])
+
+        return tuple(row)
+
+    def combinations(
+        self,
+        values: typing.Sequence[typing.Sequence[typing.Any]],
+    ) -> typing.Iterator[typing.Tuple[typing.Any, ...]]:
+        return itertools.product(*values)
+
+
+class EachChoiceStrategy(CombinationStrategy):
+    """Every value of every field is used at least once"""
+
+    def indices(self, sizes: typing.Sequence[int]) -> typing.Iterator[typing.Tuple[int, ...]]:
+        if 0 in sizes:
+            return
+
+        for row_index in range(max(sizes, default=1)):
+            yield tuple(row_index % size for size in sizes)
+
+    def count(self, sizes: typing.Sequence[int]) -> int:
+        if 0 in sizes:
+            return 0
+
+        return max(sizes, default=1)
+
+    def row(self, sizes: typing.Sequence[int], index: int) -> typing.Tuple[int, ...]:
+        if not 0 <= index < self.count(sizes):
+            raise IndexError(f'row index=={index} out of range')
+
+        return tuple(index % size for size in sizes)
+
+
+class TWiseStrategy(CombinationStrategy):
+    """
+    Every combination of values of every `strength` fields is used at least once.
+
+    Rows are built by the IPOG algorithm: the covering array for the first `strength` fields is
+    their cartesian product, then each next field is added to the existing rows choosing the value
+    covering the most uncovered combinations, and new rows are appended for the rest of them.
+    Rows are built once per strength and sizes, so `row` and `count` take constant time after the first call.
+    """
+
+    def __init__(self, strength: int) -> None:
+        if strength < 1:
+            raise ValueError(f'strength=={strength} must be positive')
+
+        self.strength: int = strength
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(strength={self.strength})'
+
+    def indices(self, sizes: typing.Sequence[int]) -> typing.Iterator[typing.Tuple[int, ...]]:
+        return iter(_get_t_wise_rows(strength=self.strength, sizes=tuple(sizes)))
+
+    def count(self, sizes: typing.Sequence[int]) -> int:
+        return len(_get_t_wise_rows(strength=self.strength, sizes=tuple(sizes)))
+
+    def row(self, sizes: typing.Sequence[int], index: int) -> typing.Tuple[int, ...]:
+        rows: typing.Tuple[typing.Tuple[int, ...], ...] = _get_t_wise_rows(strength=self.strength, sizes=tuple(sizes))
+        if not 0 <= index < len(rows):
+            raise IndexError(f'row index=={index} out of range')
+
+        return rows[index]
+
+    def _build_rows(self, sizes: typing.Tuple[int, ...]) -> typing.Tuple[typing.Tuple[int, ...], ...]:
+        """The covering array of the sizes"""
+        if 0 in sizes:
+            return ()
+
+        strength: int = self.strength
+        if len(sizes) <= strength:
+            return tuple(itertools.product(*(range(size) for size in sizes)))
+
+        rows: typing.List[typing.List[typing.Optional[int]]] = [
+            list(row) for row in itertools.product(*(range(size) for size in sizes[:strength]))
+        ]
+        for column in range(strength, len(sizes)):
+            self._extend(rows=rows, sizes=sizes, column=column)
+
+        return tuple(tuple(0 if index is None else index for index in row) for row in rows)
+
+    def _extend(
+        self,
+        rows: typing.List[typing.List[typing.Optional[int]]],
+        sizes: typing.Sequence[int],
+        column: int,
+    ) -> None:
+        """Add a column to the covering array of the preceding columns, None means any value"""
+        column_sets: typing.List[typing.Tuple[int, ...]] = list(itertools.combinations(range(column), self.strength - 1))
+        uncovered: typing.Set[typing.Tuple[typing.Tuple[int, ...], typing.Tuple[int, ...]]] = {
+            (columns, values + (value,))
+            for columns in column_sets
+            for values in itertools.product(*(range(sizes[c]) for c in columns))
+            for value in range(sizes[column])
+        }
+
+        def covered_by(row: typing.List[typing.Optional[int]], value: int) -> typing.List[typing.Any]:
+            result: typing.List[typing.Any] = []
+            for columns in column_sets:
+                values: typing.Tuple[typing.Optional[int], ...] = tuple(row[c] for c in columns)
+                if None not in values and (columns, values + (value,)) in uncovered:
+                    result.append((columns, values + (value,)))
+
+            return result
+
+        # horizontal growth
+        row: typing.List[typing.Optional[int]]
+        for row in rows:
+            best_value: int = 0
+            best_covered: typing.List[typing.Any] = []
+            for value in range(sizes[column]):
+                covered: typing.List[typing.Any] = covered_by(row=row, value=value)
+                if len(covered) > len(best_covered):
+                    best_value, best_covered = value, covered
+
+            row.append(best_value)
+            uncovered.difference_update(best_covered)
+
+        # vertical growth
+        for columns, values in sorted(uncovered):
+            if (columns, values) not in uncovered:
+                continue
+
+            for row in rows:
+                if row[column] == values[-1] and all(
+                    row[c] is None or row[c] == v for c, v in zip(columns, values)
+                ):
+                    break
+            else:
+                row = [None] * (column + 1)
+                row[column] = values[-1]
+                rows.append(row)
+
+            for c, v in zip(columns, values):
+                row[c] = v
+
+            uncovered.difference_update(covered_by(row=row, value=typing.cast(int, row[column])))
+
+
+class PairwiseStrategy(TWiseStrategy):
+    """Every pair of values of every two fields is used at least once"""
+
+    def __init__(self) -> None:
+        super().__init__(strength=2)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}()'
+
+
+@functools.lru_cache(maxsize=256)
+def _get_t_wise_rows(strength: int, sizes: typing.Tuple[int, ...]) -> typing.Tuple[typing.Tuple[int, ...], ...]:
+    """Rows of `TWiseStrategy`, shared by its instances of the same strength"""
+    return TWiseStrategy(strength=strength)._build_rows(sizes=sizes)
+
+
+_STRATEGIES: typing.Dict[str, typing.Callable[[], CombinationStrategy]] = {
+    'product': ProductStrategy,
+    'each_choice': EachChoiceStrategy,
+    'pairwise': PairwiseStrategy,
+}
+
+
+def get_strategy(strategy: typing.Union[str, CombinationStrategy]) -> CombinationStrategy:
+    """Combination strategy by its name: product, each_choice or pairwise"""
+    if isinstance(strategy, CombinationStrategy):
+        return strategy
+
+    try:
+        return _STRATEGIES[strategy]()
+    except KeyError:
+        raise UnknownStrategyError(
+            f'unknown combination strategy=={strategy}, use one of {", ".join(_STRATEGIES)} or TWiseStrategy'
+        ) from None
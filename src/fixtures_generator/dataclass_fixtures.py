@@ -18,6 +18,13 @@ __all__ = (
     'OneTwo',
     'FirstSecond',
     'SubtypesDataclass',
+    'FlagsDataclass',
+    'WideDataclass',
+    'FrozenDataclass',
+    'FrozenHolderDataclass',
+    'SlotsDataclass',
+    'PostInitDataclass',
+    'TreeDataclass',
 )
 
 
@@ -82,3 +89,69 @@ class SubtypesDataclass:
     first_second: FirstSecond
     simple: SimpleDataclass
 # endregion subclasses
+
+
+@dataclasses.dataclass
+class FlagsDataclass:
+    a: bool
+    b: bool
+    c: bool
+    d: bool
+    e: bool
+    f: typing.Optional[bool]
+
+
+@dataclasses.dataclass
+class WideDataclass:
+    flags: FlagsDataclass
+    optional_flags: typing.Optional[FlagsDataclass]
+    subtypes: SubtypesDataclass
+    a: typing.Optional[bool]
+    b: typing.Optional[bool]
+    c: typing.Optional[bool]
+    d: typing.Optional[bool]
+    e: typing.Optional[bool]
+    f: typing.Optional[bool]
+    g: typing.Optional[bool]
+    h: typing.Optional[bool]
+
+
+@dataclasses.dataclass(frozen=True)
+class FrozenDataclass:
+    a: bool
+    b: typing.Optional[bool]
+    label: str = 'frozen'
+    tags: typing.Tuple[str, ...] = ('x', 'y')
+
+
+@dataclasses.dataclass
+class FrozenHolderDataclass:
+    a: bool
+    b: bool
+    frozen: FrozenDataclass
+    name: typing.Optional[str]
+
+
+@dataclasses.dataclass(frozen=True)
+class SlotsDataclass:
+    __slots__ = ('x', 'flag')
+    x: int
+    flag: typing.Optional[bool]
+
+
+@dataclasses.dataclass
+class PostInitDataclass:
+    x: int
+    z: str
+    tags: typing.List[str] = dataclasses.field(init=False, default_factory=list)
+    total: int = dataclasses.field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self.total = self.x + 1
+
+
+@dataclasses.dataclass
+class TreeDataclass:
+    leaf: bool
+    parent: typing.Optional['TreeDataclass']
+    children: typing.List['TreeDataclass']
@@ -2,14 +2,30 @@ import typing
 import sys
 import enum
 import abc
+import asyncio
 import dataclasses
+import time
+import uuid
+import types
 import random
-import string
+import decimal
+import datetime
+import array
+import math
 import itertools
 import inspect
+import functools
+import weakref
+import collections
+import contextvars
+import concurrent.futures
+from .combination_strategies import CombinationStrategy, ProductStrategy, get_strategy
+from .scalar_engine import ScalarEngine
+from .generation_stats import GenerationStats
 
 __all__ = (
     'FieldTypeIsNoneError',
+    'UnresolvedAnnotationError',
     'DefaultIntError',
     'DefaultIntFactoryError',
     'DefaultFloatError',
@@ -21,6 +37,10 @@ __all__ = (
     'DefaultBoolError',
     'DefaultBoolFactoryError',
     'FieldInfo',
+    'FieldKind',
+    'TypePlan',
+    'FixturesExplanation',
+    'FixtureSpace',
     'DataclassFixturesGenerator',
 )
 
@@ -37,6 +57,11 @@ class FieldTypeIsNoneError(ValueError):
     pass
 
 
+class UnresolvedAnnotationError(ValueError):
+    """provided field annotation is a string or a forward reference which can not be resolved"""
+    pass
+
+
 class DefaultIntError(ValueError):
     """Provided default value for int type is not integer"""
     pass
@@ -86,6 +111,57 @@ class DefaultBoolFactoryError(ValueError):
 
 
 _T = typing.TypeVar('_T')
+_Seed = typing.Union[int, float, str, bytes, bytearray]
+_Column = typing.MutableSequence[typing.Any]
+_BUILD_BATCH_SIZE: int = 1000
+_ANNOTATED: typing.Any = getattr(typing, 'Annotated', None)
+_UNION_TYPE: typing.Any = getattr(types, 'UnionType', None)  # int | None since python 3.10
+_LITERAL: typing.Any = getattr(typing, 'Literal', None)
+_Path = typing.Tuple[typing.Any, ...]
+"""types of the dataclasses being generated, from the outermost one"""
+_PATH: 'contextvars.ContextVar[_Path]' = contextvars.ContextVar('_PATH', default=())
+_MEMO: 'contextvars.ContextVar[typing.Optional[typing.Dict[typing.Any, typing.List[typing.Any]]]]' = (
+    contextvars.ContextVar('_MEMO', default=None)
+)
+"""values of recursive dataclasses by their types and the depths of the path, during one generation"""
+_POOL: 'contextvars.ContextVar[typing.Optional[typing.Dict[typing.Any, typing.Any]]]' = (
+    contextvars.ContextVar('_POOL', default=None)
+)
+"""interned values by the types and the components of the values, during one generation"""
+_UNPOOLED_TYPES: typing.Tuple[type, ...] = (type(None), bool, int, float, bytes)
+"""values which are not pooled, they are small, cached by python already or almost always unique"""
+_EXHAUSTED: typing.Any = object()
+_AWAITED: 'contextvars.ContextVar[typing.Optional[typing.Dict[typing.Callable, typing.Any]]]' = contextvars.ContextVar(
+    '_AWAITED', default=None,
+)
+"""results of async default factories by the factories, while `agenerate_fixtures` builds fixtures"""
+_TYPE_HINTS: 'weakref.WeakKeyDictionary[typing.Type, typing.Dict[str, typing.Any]]' = weakref.WeakKeyDictionary()
+"""resolved annotations of dataclasses, they do not depend on generators"""
+_COLUMN_TYPECODES: typing.Tuple[typing.Tuple[type, str], ...] = ((bool, 'b'), (int, 'q'), (float, 'd'))
+
+
+def _resolve_type_hints(
+    obj: typing.Any,
+    globalns: typing.Optional[typing.Dict[str, typing.Any]],
+    localns: typing.Dict[str, typing.Any],
+) -> typing.Dict[str, typing.Any]:
+    """`typing.get_type_hints` keeping Annotated"""
+    if sys.version_info >= (3, 9):
+        return typing.get_type_hints(obj, globalns=globalns, localns=localns, include_extras=True)
+
+    return typing.get_type_hints(obj, globalns=globalns, localns=localns)
+
+
+def _get_component_key(value: typing.Any) -> typing.Any:
+    """Key of an interned component of a pooled value, 1, 1.0 and True are never mixed up, nor 0.0 and -0.0"""
+    value_type: typing.Type = type(value)
+    if value_type is float:
+        return value_type, value.hex()
+
+    if value_type in _UNPOOLED_TYPES:
+        return value_type, value
+
+    return id(value)  # the pooled value keeps its components alive, so their ids are not reused
 
 
 @dataclasses.dataclass(frozen=True)
@@ -96,8 +172,588 @@ class FieldInfo:
     default_factory: typing.Optional[typing.Any]
 
 
+class FieldKind(enum.Enum):
+    """How values of a field type are generated"""
+    UNION = 'union'
+    COLLECTION = 'collection'
+    DICT = 'dict'
+    DATACLASS = 'dataclass'
+    SCALAR = 'scalar'
+
+
+_Handler = typing.Callable[[typing.Any, FieldInfo], typing.List[typing.Any]]
+"""generates values of a field, gets the generator class and the field"""
+
+
+@dataclasses.dataclass(frozen=True)
+class TypePlan:
+    """
+    Introspection results for a field type.
+
+    Plans are compiled once per type by `DataclassFixturesGenerator._get_plan` and cached,
+    so repeated generation of the same dataclass does not inspect its types again.
+    """
+    field_type: typing.Any
+    """the type itself, NewType is replaced by its supertype"""
+    kind: FieldKind
+    args: typing.Tuple[typing.Any, ...] = ()
+    """union members ordered by `_types_order`, element types of a collection, key and value types of a dict"""
+    origin: typing.Optional[typing.Type] = None
+    """list, tuple, set or frozenset for a collection"""
+    variadic: bool = False
+    """a collection of any length, a list, a set, a frozenset or `Tuple[X, ...]`, unlike a tuple of fixed length"""
+    fields: typing.Tuple[FieldInfo, ...] = ()
+    """fields of a dataclass"""
+    field_names: typing.Tuple[str, ...] = ()
+    enum_members: typing.Tuple[enum.Enum, ...] = ()
+    lazy: bool = False
+    """values contain nested dataclasses"""
+    constructor: typing.Optional[typing.Callable[[typing.Sequence[typing.Any]], typing.Any]] = dataclasses.field(
+        default=None, compare=False,
+    )
+    """builds a dataclass from the values of its fields without calling `__init__`"""
+    handler: typing.Optional[_Handler] = dataclasses.field(default=None, compare=False)
+    """registered generator of values of a scalar type"""
+
+
+class _Plans:
+    """
+    Compiled plans by types.
+
+    A plan refers to its type, so a weak dictionary would keep its keys alive, plans of classes are kept
+    in the `__dict__` of the classes instead and are dropped together with them. Plans of other types,
+    like `List[X]` or `X | None`, and of builtin classes are kept in a bounded cache, like `typing` keeps
+    parameterized generics.
+    """
+    _attribute: str = '__fixtures_generator_plans__'
+    _max_size: int = 1024
+
+    def __init__(self) -> None:
+        self._version: int = 0
+        """incremented by `clear`, plans in classes compiled before are ignored"""
+        self._plans: typing.Dict[typing.Any, TypePlan] = {}
+
+    def get(self, type_: typing.Any) -> typing.Optional[TypePlan]:
+        """The plan of the type or None, TypeError is raised for unhashable types"""
+        if isinstance(type_, type):
+            plans: typing.Optional['weakref.WeakKeyDictionary[_Plans, typing.Tuple[int, TypePlan]]'] = (
+                type_.__dict__.get(self._attribute)
+            )
+            if plans is not None:
+                entry: typing.Optional[typing.Tuple[int, TypePlan]] = plans.get(self)
+                return entry[1] if entry is not None and entry[0] == self._version else None
+
+        return self._plans.get(type_)
+
+    def set(self, type_: typing.Any, plan: TypePlan) -> None:
+        if isinstance(type_, type):
+            plans: typing.Optional['weakref.WeakKeyDictionary[_Plans, typing.Tuple[int, TypePlan]]'] = (
+                type_.__dict__.get(self._attribute)
+            )
+            try:
+                if plans is None:
+                    plans = weakref.WeakKeyDictionary()
+                    setattr(type_, self._attribute, plans)
+
+                plans[self] = (self._version, plan)
+                return
+            except TypeError:  # builtin classes can not be changed
+                pass
+
+        if len(self._plans) >= self._max_size:
+            try:
+                del self._plans[next(iter(self._plans))]  # the oldest one
+            except (KeyError, RuntimeError, StopIteration):  # removed by an other thread
+                pass
+
+        self._plans[type_] = plan
+
+    def clear(self) -> None:
+        self._version += 1
+        self._plans.clear()
+
+
+@dataclasses.dataclass(frozen=True)
+class FixturesExplanation:
+    """The number of values of a field, as a tree of the numbers of values of its parts"""
+    field_name: str
+    field_type: typing.Any
+    kind: FieldKind
+    count: int
+    children: typing.Tuple['FixturesExplanation', ...] = ()
+
+    @property
+    def culprit(self) -> 'FixturesExplanation':
+        """The innermost field on the path of the largest numbers of values"""
+        node: FixturesExplanation = self
+        while node.children:
+            child: FixturesExplanation = max(node.children, key=lambda c: c.count)
+            if child.count <= 1:
+                break
+
+            node = child
+
+        return node
+
+    def render(self, indent: str = '  ') -> str:
+        """The tree as text, one field per line"""
+        lines: typing.List[str] = []
+        stack: typing.List[typing.Tuple[int, FixturesExplanation]] = [(0, self)]
+        while stack:
+            level: int
+            node: FixturesExplanation
+            level, node = stack.pop()
+            type_name: str = node.field_type.__name__ if inspect.isclass(node.field_type) else str(node.field_type)
+            lines.append(f'{indent * level}{node.field_name}: {type_name} ({node.kind.value}) = {node.count}')
+            stack.extend((level + 1, child) for child in reversed(node.children))
+
+        return '\n'.join(lines)
+
+
+def _generate_bool_handler(generator: typing.Any, field_info: FieldInfo) -> typing.List[typing.Any]:
+    return generator._generate_bool_s(field_info=field_info)
+
+
+def _generate_int_handler(generator: typing.Any, field_info: FieldInfo) -> typing.List[typing.Any]:
+    return [generator._generate_int(field_info=field_info)]
+
+
+def _generate_float_handler(generator: typing.Any, field_info: FieldInfo) -> typing.List[typing.Any]:
+    return [generator._generate_float(field_info=field_info)]
+
+
+def _generate_str_handler(generator: typing.Any, field_info: FieldInfo) -> typing.List[typing.Any]:
+    return [generator._generate_str(field_info=field_info)]
+
+
+def _generate_enum_handler(generator: typing.Any, field_info: FieldInfo) -> typing.List[typing.Any]:
+    return [generator._generate_enum(field_info=field_info)]
+
+
+def _generate_literal_handler(generator: typing.Any, field_info: FieldInfo) -> typing.List[typing.Any]:
+    return generator._generate_literal_s(field_info=field_info)
+
+
+def _generate_bytes_handler(generator: typing.Any, field_info: FieldInfo) -> typing.List[typing.Any]:
+    return generator._generate_pooled(field_info=field_info, next_value=generator._scalars.next_bytes)
+
+
+def _generate_uuid_handler(generator: typing.Any, field_info: FieldInfo) -> typing.List[typing.Any]:
+    return generator._generate_pooled(field_info=field_info, next_value=generator._scalars.next_uuid)
+
+
+def _generate_datetime_handler(generator: typing.Any, field_info: FieldInfo) -> typing.List[typing.Any]:
+    return generator._generate_pooled(field_info=field_info, next_value=generator._scalars.next_datetime)
+
+
+def _generate_date_handler(generator: typing.Any, field_info: FieldInfo) -> typing.List[typing.Any]:
+    return generator._generate_pooled(field_info=field_info, next_value=generator._scalars.next_date)
+
+
+def _generate_decimal_handler(generator: typing.Any, field_info: FieldInfo) -> typing.List[typing.Any]:
+    return generator._generate_pooled(field_info=field_info, next_value=generator._scalars.next_decimal)
+
+
+_BUILTIN_HANDLERS: typing.FrozenSet[_Handler] = frozenset({
+    _generate_bool_handler,
+    _generate_int_handler,
+    _generate_float_handler,
+    _generate_str_handler,
+    _generate_enum_handler,
+    _generate_literal_handler,
+    _generate_bytes_handler,
+    _generate_uuid_handler,
+    _generate_datetime_handler,
+    _generate_date_handler,
+    _generate_decimal_handler,
+})
+_SINGLE_VALUE_HANDLERS: typing.FrozenSet[_Handler] = _BUILTIN_HANDLERS - {_generate_bool_handler, _generate_literal_handler}
+_BULK_FILLS: typing.Dict[_Handler, typing.Callable[[ScalarEngine, int], typing.List[typing.Any]]] = {
+    _generate_int_handler: ScalarEngine.take_ints,
+    _generate_float_handler: ScalarEngine.take_floats,
+    _generate_str_handler: ScalarEngine.take_strs,
+    _generate_bytes_handler: ScalarEngine.take_bytes,
+    _generate_uuid_handler: ScalarEngine.take_uuids,
+    _generate_datetime_handler: ScalarEngine.take_datetimes,
+    _generate_date_handler: ScalarEngine.take_dates,
+    _generate_decimal_handler: ScalarEngine.take_decimals,
+}
+"""elements of collections drawn from the buffers of `_scalars` in bulk by the handlers of their types"""
+_LENGTH_ORIGINS: typing.Tuple[type, ...] = (list, tuple, set, frozenset, dict)
+_LengthSampler = typing.Callable[[random.Random], int]
+_Length = typing.Union[int, typing.Tuple[int, int], _LengthSampler]
+_Lengths = typing.Union[_Length, typing.Dict[type, _Length]]
+
+
+def _get_length_sampler(length: _Length) -> _LengthSampler:
+    """sampler(rng) of lengths of collections, a fixed length, an inclusive range (min, max) or a sampler itself"""
+    if callable(length):
+        return length
+
+    if isinstance(length, int):
+        length = (length, length)
+
+    low: int
+    high: int
+    low, high = length
+    if not 0 <= low <= high:
+        raise ValueError(f'lengths=={length} must be non-negative and ordered')
+
+    return lambda rng: rng.randint(low, high)
+
+
+def _get_length_samplers(lengths: _Lengths) -> typing.Dict[type, _LengthSampler]:
+    """Samplers by list, tuple, set, frozenset and dict, one length for all of them or lengths by these types"""
+    if not isinstance(lengths, dict):
+        lengths = dict.fromkeys(_LENGTH_ORIGINS, lengths)
+
+    origin: type
+    for origin in lengths:
+        if origin not in _LENGTH_ORIGINS:
+            raise ValueError(
+                f'lengths of {origin} are not supported, only of {", ".join(t.__name__ for t in _LENGTH_ORIGINS)}'
+            )
+
+    return {origin: _get_length_sampler(length) for origin, length in lengths.items()}
+
+
+def _lazy_product(
+    sources: typing.Sequence[typing.Callable[[], typing.Iterable[typing.Any]]],
+    start_sources: typing.Optional[typing.Sequence[typing.Callable[[], typing.Iterable[typing.Any]]]] = None,
+) -> typing.Iterator[typing.Tuple[typing.Any, ...]]:
+    """
+    The same as `itertools.product`, but without materializing its arguments.
+
+    Each source is a callable returning a fresh iterable of values, it is called again
+    every time the values of the preceding sources change.
+    start_sources -- sources of the first combination and of the rest values of its fields,
+    they are used to start the product from the middle
+    """
+    if not sources:
+        yield ()
+        return
+
+    first_sources: typing.Sequence[typing.Callable[[], typing.Iterable[typing.Any]]] = start_sources or sources
+    last: int = len(sources) - 1
+    values: typing.List[typing.Any] = [None] * len(sources)
+    iterators: typing.List[typing.Iterator[typing.Any]] = [iter(first_sources[0]())]
+    starting: typing.List[bool] = [start_sources is not None]  # the iterator has not passed its first value yet
+    while iterators:
+        index: int = len(iterators) - 1
+        try:
+            values[index] = next(iterators[index])
+        except StopIteration:
+            iterators.pop()
+            starting.pop()
+            continue
+
+        if index == last:
+            yield tuple(values)
+        else:
+            nested_starting: bool = starting[index]
+            starting[index] = False
+            iterators.append(iter((first_sources if nested_starting else sources)[index + 1]()))
+            starting.append(nested_starting)
+
+
+def _path_key(path: _Path) -> typing.FrozenSet[typing.Tuple[typing.Any, int]]:
+    """How many times every type occurs in the path, values of a dataclass depend only on it"""
+    return frozenset(collections.Counter(path).items())
+
+
+def _make_default(default: typing.Any, _instance: typing.Any) -> typing.Any:
+    """The default value of a field `__init__` does not accept"""
+    return default
+
+
+def _make_by_factory(factory: typing.Callable[[], typing.Any], _instance: typing.Any) -> typing.Any:
+    """The value of the default factory of a field `__init__` does not accept"""
+    return factory()
+
+
+def _repeat_column(column: _Column, repeats: int, tiles: int) -> _Column:
+    """Every value of the column repeated `repeats` times, and the result repeated `tiles` times"""
+    values: typing.Iterable[typing.Any] = column
+    if repeats != 1:
+        values = itertools.chain.from_iterable(itertools.repeat(value, repeats) for value in column)
+
+    if isinstance(column, array.array):
+        return array.array(column.typecode, values) * tiles
+
+    return list(values) * tiles
+
+
+def _take_column(column: _Column, indices: typing.Iterable[int]) -> _Column:
+    """Values of the column by the indices"""
+    values: typing.Iterator[typing.Any] = (column[index] for index in indices)
+    if isinstance(column, array.array):
+        return array.array(column.typecode, values)
+
+    return list(values)
+
+
+class FixtureSpace(typing.Sequence[_T]):
+    """
+    Fixtures of `generate_fixtures` by their indices, a fixture is built when it is accessed.
+
+    Slicing returns a space too, like `space[worker_index::workers_count]`.
+    """
+
+    def __init__(
+        self,
+        generator: typing.Type['DataclassFixturesGenerator'],
+        cls_: typing.Type[_T],
+        explanation: FixturesExplanation,
+        indices: typing.Optional[range] = None,
+    ) -> None:
+        self.generator: typing.Type[DataclassFixturesGenerator] = generator
+        self.cls_: typing.Type[_T] = cls_
+        self.explanation: FixturesExplanation = explanation
+        self.indices: range = range(explanation.count) if indices is None else indices
+        self._root: FieldInfo = generator._get_root_field_info(cls_=cls_)
+        self._values: typing.Dict[int, typing.List[typing.Any]] = {}
+        """values of fields which are not decoded by indices, by ids of their explanations, see `_get_value`"""
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.cls_.__name__}, {self.indices})'
+
+    @property
+    def size(self) -> int:
+        """The number of fixtures, unlike `len` it is not limited by sys.maxsize"""
+        start: int = self.indices.start
+        stop: int = self.indices.stop
+        step: int = self.indices.step
+        if step > 0:
+            return max(0, (stop - start + step - 1) // step)
+
+        return max(0, (start - stop - step - 1) // -step)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    @typing.overload
+    def __getitem__(self, index: int) -> _T:
+        ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> 'FixtureSpace[_T]':
+        ...
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Union[_T, 'FixtureSpace[_T]']:
+        if isinstance(index, slice):
+            space: FixtureSpace[_T] = FixtureSpace(
+                generator=self.generator,
+                cls_=self.cls_,
+                explanation=self.explanation,
+                indices=self.indices[index],
+            )
+            space._values = self._values  # the explanation is the same
+            return space
+
+        return self.generator._call_in_pool(
+            self.generator._get_value,
+            field_info=self._root,
+            explanation=self.explanation,
+            index=self.indices[index],
+            values=self._values,
+        )
+
+    def __iter__(self) -> typing.Iterator[_T]:
+        return self.generator._iter_in_pool(self._iter())
+
+    def _iter(self) -> typing.Iterator[_T]:
+        if self.indices.step == 1:
+            # consecutive fixtures share the most of fields values, so they are not decoded one by one
+            yield from itertools.islice(
+                self.generator._iter_dataclass_values(
+                    field_info=self._root,
+                    start=self.indices.start,
+                    explanation=self.explanation,
+                ),
+                self.size,
+            )
+            return
+
+        index: int
+        for index in self.indices:
+            yield self.generator._get_value(
+                field_info=self._root, explanation=self.explanation, index=index, values=self._values,
+            )
+
+
 class DataclassFixturesGenerator(abc.ABC):
     _types_order: typing.Dict[typing.Type, int] = {type(None): 0, bool: 100, int: 200, float: 300, str: 400}
+    _strategy: CombinationStrategy = ProductStrategy()
+    _random: random.Random = typing.cast(random.Random, random)  # functions of the module share the global state
+    _scalars: ScalarEngine = ScalarEngine(rng=_random)
+    """buffers of random ints, floats and strings drawn from `_random` in blocks"""
+    _options: typing.Dict[str, typing.Any] = {}
+    """options of `configure` this generator was created with"""
+    _max_depth: int = 3
+    """how many times a dataclass may be nested into itself, including the outermost one"""
+    _construct: str = 'init'
+    _constructs: typing.Tuple[str, ...] = ('init', 'fast')
+    """ways of creating instances the generator supports"""
+    _intern: bool = False
+    _stats: typing.Optional[GenerationStats] = None
+    _lengths: typing.Dict[type, _LengthSampler] = {}
+    """samplers of lengths of collections by their origins, a collection without one has a single element"""
+    _handlers: typing.Dict[typing.Any, _Handler] = {
+        bool: _generate_bool_handler,
+        int: _generate_int_handler,
+        float: _generate_float_handler,
+        str: _generate_str_handler,
+        enum.Enum: _generate_enum_handler,
+        bytes: _generate_bytes_handler,
+        uuid.UUID: _generate_uuid_handler,
+        datetime.datetime: _generate_datetime_handler,
+        datetime.date: _generate_date_handler,
+        decimal.Decimal: _generate_decimal_handler,
+        **({_LITERAL: _generate_literal_handler} if _LITERAL is not None else {}),
+    }
+    """generators of values by types and generic origins, subclasses are found by their MRO, see `register`"""
+
+    @classmethod
+    def configure(
+        cls,
+        strategy: typing.Optional[typing.Union[str, CombinationStrategy]] = None,
+        seed: typing.Optional[_Seed] = None,
+        rng: typing.Optional[random.Random] = None,
+        intern: typing.Optional[bool] = None,
+        construct: typing.Optional[str] = None,
+        max_depth: typing.Optional[int] = None,
+        stats: typing.Optional[GenerationStats] = None,
+        lengths: typing.Optional[_Lengths] = None,
+    ) -> typing.Type['DataclassFixturesGenerator']:
+        """
+        Subclass of this generator with the given options, the options which are not provided are inherited.
+
+        strategy -- how combinations of fields values become fixtures: product (default), each_choice, pairwise
+        or a CombinationStrategy instance like TWiseStrategy(strength=3)
+        seed -- seed of the own random.Random of the generator, generators configured with the same seed
+        produce the same sequences of fixtures
+        rng -- the own random.Random of the generator, it should not be shared between threads
+        intern -- share equal strings, tuples, frozensets and frozen dataclasses between fixtures
+        to reduce the memory footprint of large fixture lists
+        construct -- init (default) calls `__init__` of dataclasses, fast creates them by `object.__new__`
+        and assigns fields directly, so `__post_init__` and validators are not called,
+        PydanticFixturesGenerator supports batch too, see its `_build_instances`
+        max_depth -- how many times a recursive dataclass is nested into itself, 3 by default,
+        the deepest optional fields are None and the deepest collections are empty
+        stats -- collects the numbers and times of values generations by models and kinds of fields
+        and calls its hooks, values produced lazily by `iter_fixtures` and worker processes are not collected
+        lengths -- lengths of lists, sets, frozensets, `Tuple[X, ...]` and dicts: a fixed length, a range (min, max)
+        or a sampler(rng) of lengths, one for all of them or a dict like {list: (0, 100), dict: 3}.
+        Every value of a field still starts with one of the values of its elements unless its length is 0, then it is
+        empty and that value of the elements is skipped. The rest are drawn at random, so sets and dicts may be shorter
+        when drawn elements are equal. By default collections have one element, samplers should be picklable for `workers`
+        """
+        if seed is not None and rng is not None:
+            raise ValueError('provide either seed or rng')
+
+        if max_depth is not None and max_depth < 1:
+            raise ValueError(f'max_depth=={max_depth} must be positive')
+
+        if construct is not None and construct not in cls._constructs:
+            raise ValueError(f'construct=={construct} must be one of {", ".join(cls._constructs)}')
+
+        options: typing.Dict[str, typing.Any] = {
+            name: value for name, value in {
+                'strategy': strategy,
+                'seed': seed,
+                'rng': rng,
+                'intern': intern,
+                'construct': construct,
+                'max_depth': max_depth,
+                'lengths': lengths,
+            }.items() if value is not None
+        }
+        namespace: typing.Dict[str, typing.Any] = {
+            '__module__': cls.__module__,
+            '_plans': cls._get_plans(),  # options do not change plans, so they are shared
+            '_base_generator': cls._get_base_generator(),
+            '_options': {**cls._options, **options},
+        }
+        if strategy is not None:
+            namespace['_strategy'] = get_strategy(strategy)
+
+        if seed is not None or rng is not None:
+            namespace['_options'].pop('rng' if seed is not None else 'seed', None)
+            namespace['_random'] = random.Random(seed) if rng is None else rng
+            namespace['_scalars'] = ScalarEngine(rng=namespace['_random'])
+
+        if intern is not None:
+            namespace['_intern'] = intern
+
+        if construct is not None:
+            namespace['_construct'] = construct
+
+        if max_depth is not None:
+            namespace['_max_depth'] = max_depth
+
+        if lengths is not None:
+            namespace['_lengths'] = _get_length_samplers(lengths=lengths)
+
+        if stats is not None:  # not an option, stats of worker processes would not come back
+            namespace['_stats'] = stats
+
+        return typing.cast(typing.Type[DataclassFixturesGenerator], type(cls.__name__, (cls,), namespace))
+
+    @classmethod
+    def register(cls, type_: typing.Any, handler: _Handler) -> None:
+        """
+        Generate values of the type and its subclasses by the handler, handler(generator, field_info) returns the list
+        of values, a generic origin like `collections.deque` is registered for all of its parameterizations.
+
+        Generators configured from this one and its subclasses use the handler too, unless they have registered
+        handlers of their own.
+        """
+        setattr(cls, '_handlers', {**cls._handlers, type_: handler})
+        # plans compiled already may have other handlers, configured generators share the plans of this one
+        cls._get_plans().clear()
+        subclasses: typing.List[type] = cls.__subclasses__()
+        while subclasses:
+            subclass: type = subclasses.pop()
+            plans: typing.Optional[_Plans] = subclass.__dict__.get('_plans')
+            if plans is not None:
+                plans.clear()
+
+            subclasses.extend(subclass.__subclasses__())
+
+    @classmethod
+    def _find_handler(cls, field_type: typing.Any) -> typing.Optional[_Handler]:
+        """The handler of the type, its generic origin or the nearest base class, enums are handled as enums"""
+        handlers: typing.Dict[typing.Any, _Handler] = cls._handlers
+        try:
+            return handlers[field_type]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable type
+            return None
+
+        origin: typing.Any = typing.get_origin(field_type)
+        if origin is not None:
+            return handlers.get(origin)
+
+        if not inspect.isclass(field_type):
+            return None
+
+        is_enum: bool = issubclass(field_type, enum.Enum)
+        base: type
+        for base in inspect.getmro(field_type):
+            if base in handlers and (not is_enum or issubclass(base, enum.Enum)):  # IntEnum is not handled as int
+                return handlers[base]
+
+        return None
+
+    @classmethod
+    def _get_base_generator(cls) -> typing.Type['DataclassFixturesGenerator']:
+        """
+        The generator this one was configured from.
+
+        Configured generators can not be pickled, so other processes configure the base generator again.
+        """
+        return cls.__dict__.get('_base_generator', cls)
 
     @classmethod
     def _validate(cls, cls_: typing.Type) -> None:
@@ -110,25 +766,67 @@ class DataclassFixturesGenerator(abc.ABC):
         if field_info.field_type is None:
             raise FieldTypeIsNoneError(f'field name=={field_info.field_name} has None type')
 
+        if isinstance(field_info.field_type, (str, typing.ForwardRef)):
+            raise UnresolvedAnnotationError(
+                f'field name=={field_info.field_name} has annotation {field_info.field_type!r} which can not be resolved'
+            )
+
+    @classmethod
+    def _get_type_hints(cls, cls_: typing.Type) -> typing.Dict[str, typing.Any]:
+        """
+        Annotations of the class with strings and forward references resolved, they are resolved once per class.
+
+        When an annotation can not be resolved, annotations are resolved one by one and the unresolved ones
+        are kept as they are, generating values for them raises UnresolvedAnnotationError.
+        """
+        try:
+            return _TYPE_HINTS[cls_]
+        except KeyError:
+            pass
+
+        localns: typing.Dict[str, typing.Any] = {cls_.__name__: cls_}
+        hints: typing.Dict[str, typing.Any]
+        try:
+            hints = _resolve_type_hints(cls_, globalns=None, localns=localns)
+        except (NameError, TypeError):
+            hints = {}
+            base: type
+            for base in reversed(cls_.__mro__):
+                globalns: typing.Dict[str, typing.Any] = getattr(sys.modules.get(base.__module__), '__dict__', {})
+                name: str
+                annotation: typing.Any
+                for name, annotation in base.__dict__.get('__annotations__', {}).items():
+                    try:
+                        hints[name] = _resolve_type_hints(
+                            types.SimpleNamespace(__annotations__={name: annotation}), globalns=globalns, localns=localns,
+                        )[name]
+                    except (NameError, TypeError):
+                        hints[name] = annotation
+
+        _TYPE_HINTS[cls_] = hints
+        return hints
+
     @classmethod
     def _get_fields(cls, cls_: typing.Type) -> typing.Tuple[FieldInfo, ...]:
         fields: typing.Tuple[dataclasses.Field, ...] = dataclasses.fields(cls_)
+        hints: typing.Dict[str, typing.Any] = cls._get_type_hints(cls_=cls_)
 
         field: dataclasses.Field
         fields_info: typing.Tuple[FieldInfo, ...] = tuple(
             FieldInfo(
                 field_name=field.name,
-                field_type=typing.cast(typing.Type[typing.Any], field.type),
+                field_type=typing.cast(typing.Type[typing.Any], hints.get(field.name, field.type)),
                 default_value=field.default if field.default != dataclasses.MISSING else None,
                 default_factory=field.default_factory if field.default_factory != dataclasses.MISSING else None,
-            ) for field in fields
+            ) for field in fields if field.init
         )
         return fields_info
 
     @classmethod
     def _is_union(cls, field_info: FieldInfo) -> bool:
-        """True if field has Union type"""
-        if typing.get_origin(field_info.field_type) is typing.Union:
+        """True if field has Union type or a union of `|`"""
+        origin: typing.Any = typing.get_origin(field_info.field_type)
+        if origin is typing.Union or (origin is not None and origin is _UNION_TYPE):
             return True
 
         return False
@@ -172,7 +870,7 @@ class DataclassFixturesGenerator(abc.ABC):
 
             raise DefaultIntFactoryError(f'Provided default factory returned not integer value=={value} for int type')
 
-        return field_info.field_type(random.randint(0, 10000))
+        return field_info.field_type(cls._scalars.next_int())
 
     @classmethod
     def _generate_float(cls, field_info: FieldInfo) -> float:
@@ -189,7 +887,7 @@ class DataclassFixturesGenerator(abc.ABC):
 
             raise DefaultFloatFactoryError(f'Provided default factory returned not float value=={value} for float type')
 
-        return field_info.field_type(random.uniform(0.0, 10000.0))
+        return field_info.field_type(cls._scalars.next_float())
 
     @classmethod
     def _generate_str(cls, field_info: FieldInfo) -> str:
@@ -206,8 +904,7 @@ class DataclassFixturesGenerator(abc.ABC):
 
             raise DefaultStrFactoryError(f'Provided default factory returned not string value=={value} for str type')
 
-        value_: str = ''.join(random.choices(string.ascii_letters, k=5))
-        return field_info.field_type(value_)
+        return field_info.field_type(cls._scalars.next_str())
 
     @classmethod
     def _generate_enum(cls, field_info: FieldInfo) -> enum.Enum:
@@ -224,7 +921,7 @@ class DataclassFixturesGenerator(abc.ABC):
 
             raise DefaultEnumFactoryError(f'Provided default factory returned not enum value=={value} for enum type')
 
-        return field_info.field_type(random.choice(list(typing.cast(typing.Iterable, field_info.field_type))))
+        return field_info.field_type(cls._random.choice(cls._get_plan(field_info=field_info).enum_members))
 
     @classmethod
     def _generate_bool_s(cls, field_info: FieldInfo) -> typing.List[bool]:
@@ -244,23 +941,34 @@ class DataclassFixturesGenerator(abc.ABC):
         return [True, False]
 
     @classmethod
-    def _generate_scalar_values(cls, field_info: FieldInfo) -> typing.List[typing.Any]:
-        if inspect.isclass(field_info.field_type) and field_info.field_type is not ...:
-            if issubclass(field_info.field_type, bool):
-                return cls._generate_bool_s(field_info=field_info)
+    def _generate_literal_s(cls, field_info: FieldInfo) -> typing.List[typing.Any]:
+        """Every member of the Literal, the default one goes first"""
+        members: typing.List[typing.Any] = list(
+            {(type(member), member): member for member in typing.get_args(field_info.field_type)}.values(),
+        )
+        default_value: typing.Any = field_info.default_value
+        if default_value is None and field_info.default_factory:
+            default_value = field_info.default_factory()
 
-            if issubclass(field_info.field_type, int) and not issubclass(field_info.field_type, enum.Enum):
-                return [cls._generate_int(field_info=field_info)]
+        if default_value is not None:
+            return [default_value] + [member for member in members if member != default_value]
 
-            if issubclass(field_info.field_type, float):
-                return [cls._generate_float(field_info=field_info)]
+        return members
 
-            if issubclass(field_info.field_type, str):
-                return [cls._generate_str(field_info=field_info)]
+    @classmethod
+    def _generate_pooled(cls, field_info: FieldInfo, next_value: typing.Callable[[], typing.Any]) -> typing.List[typing.Any]:
+        """The default value or a value of the pool of the type"""
+        if field_info.default_value is not None:
+            return [field_info.default_value]
 
-            if issubclass(field_info.field_type, enum.Enum):
-                return [cls._generate_enum(field_info=field_info)]
+        if field_info.default_factory:
+            return [field_info.default_factory()]
 
+        return [next_value()]
+
+    @classmethod
+    def _generate_scalar_values(cls, field_info: FieldInfo) -> typing.List[typing.Any]:
+        """Values of a type without a handler"""
         if field_info.default_value:
             return [field_info.default_value]
 
@@ -270,13 +978,18 @@ class DataclassFixturesGenerator(abc.ABC):
         return [None]
 
     @classmethod
-    def _generate_union_values(cls, field_info: FieldInfo) -> typing.List[typing.Any]:
-        types: typing.List[typing.Type] = sorted(
-            set(typing.get_args(field_info.field_type)),
+    def _get_union_types(cls, field_info: FieldInfo) -> typing.List[typing.Type]:
+        """Union members ordered by `_types_order`"""
+        return sorted(
+            dict.fromkeys(typing.get_args(field_info.field_type)),  # unlike a set, keeps the order of equal keys
             key=lambda type_: cls._types_order.get(type_, 500),
             reverse=True,
         )
 
+    @classmethod
+    def _generate_union_values(cls, field_info: FieldInfo) -> typing.List[typing.Any]:
+        types: typing.Tuple[typing.Type, ...] = cls._get_plan(field_info=field_info).args
+
         return list(
             itertools.chain.from_iterable(
                 cls._generate_values(
@@ -299,11 +1012,9 @@ class DataclassFixturesGenerator(abc.ABC):
             default_value: typing.Any = field_info.default_factory()
             return [default_value]
 
-        origin: typing.Type = typing.cast(type, typing.get_origin(field_info.field_type))  # List|Tuple|Set|Frozenset
-        types: typing.Tuple[typing.Type, ...] = typing.cast(
-            typing.Tuple[typing.Type, ...],
-            typing.get_args(field_info.field_type)
-        )
+        plan: TypePlan = cls._get_plan(field_info=field_info)
+        origin: typing.Type = typing.cast(type, plan.origin)  # List|Tuple|Set|Frozenset
+        types: typing.Tuple[typing.Type, ...] = plan.args
         values: typing.List[typing.Any] = [
             v for v in itertools.chain.from_iterable([
                 cls._generate_values(
@@ -318,12 +1029,91 @@ class DataclassFixturesGenerator(abc.ABC):
             ])
         ]
 
+        unique_values: typing.Iterable[typing.Any] = values
+        # values with nested dataclasses are counted by `_explain` without generating them, so they are not merged
+        if not any(cls._is_lazy(field_info=dataclasses.replace(field_info, field_type=tp)) for tp in types):
+            try:
+                unique_values = dict.fromkeys(values)
+            except TypeError:  # unhashable values
+                pass
+
         sorted_values: typing.List[typing.Any] = sorted(
-            set(values),
+            unique_values,
             key=lambda v: cls._types_order.get(type(v), 500),
             reverse=True,
         )
-        return [origin([v]) for v in sorted_values]
+        if not sorted_values:  # elements have no values, like a recursive dataclass nested max_depth times
+            return [origin()]
+
+        lengths: typing.Optional[typing.List[int]] = (
+            cls._draw_lengths(origin=origin, count=len(sorted_values)) if plan.variadic else None
+        )
+        if lengths is None:
+            return [origin([v]) for v in sorted_values]
+
+        element_info: FieldInfo = FieldInfo(
+            field_name=field_info.field_name, field_type=types[0], default_value=None, default_factory=None,
+        )
+        fill: typing.Iterator[typing.Any] = iter(cls._fill_values(
+            field_info=element_info,
+            count=sum(max(length - 1, 0) for length in lengths),
+            values=values,
+        ))
+        return [
+            origin(itertools.chain((v,), itertools.islice(fill, length - 1))) if length else origin()
+            for v, length in zip(sorted_values, lengths)
+        ]
+
+    @classmethod
+    def _draw_lengths(cls, origin: type, count: int) -> typing.Optional[typing.List[int]]:
+        """count lengths of collections of the origin, None if their lengths are not configured"""
+        sampler: typing.Optional[_LengthSampler] = cls._lengths.get(origin)
+        if sampler is None:
+            return None
+
+        rng: random.Random = cls._random
+        return [sampler(rng) for _index in range(count)]
+
+    @classmethod
+    def _fill_values(
+        cls,
+        field_info: FieldInfo,
+        count: int,
+        values: typing.Optional[typing.List[typing.Any]] = None,
+    ) -> typing.List[typing.Any]:
+        """
+        count random elements of collections, scalars are drawn from `_scalars` in bulk,
+        members of enums and of unions of scalars are chosen at random, other elements are chosen among the values
+
+        values -- values of the field, generated by `_generate_values` if they are needed and not provided
+        """
+        if count <= 0:
+            return []
+
+        plan: TypePlan
+        plan, field_info = cls._resolve_plan(field_info=field_info)
+        rng: random.Random = cls._random
+        if plan.kind is FieldKind.UNION:
+            members: typing.List[FieldInfo] = [
+                dataclasses.replace(field_info, field_type=type_, default_value=None, default_factory=None)
+                for type_ in plan.args
+            ]
+            if all(cls._get_plan(field_info=member).kind is FieldKind.SCALAR for member in members):
+                positions: typing.List[int] = rng.choices(range(len(members)), k=count)
+                fills: typing.List[typing.Iterator[typing.Any]] = [
+                    iter(cls._fill_values(field_info=member, count=positions.count(position)))
+                    for position, member in enumerate(members)
+                ]
+                return [next(fills[position]) for position in positions]
+        elif plan.enum_members:
+            return rng.choices(plan.enum_members, k=count)
+        elif plan.kind is FieldKind.SCALAR and plan.handler in _BULK_FILLS:
+            return _BULK_FILLS[typing.cast(_Handler, plan.handler)](cls._scalars, count)
+
+        if values is None:
+            values = cls._generate_values(field_info=field_info)
+
+        return rng.choices(values, k=count) if values else []
 
     @classmethod
     def _generate_dict_values(cls, field_info: FieldInfo) -> typing.List[typing.Any]:
@@ -335,7 +1125,7 @@ class DataclassFixturesGenerator(abc.ABC):
 
         key_type: typing.Type[typing.Any]
         value_type: typing.Type[typing.Any]
-        key_type, value_type = typing.get_args(field_info.field_type)
+        key_type, value_type = cls._get_plan(field_info=field_info).args
         key_values = cls._generate_values(field_info=FieldInfo(
             field_name=field_info.field_name,
             field_type=key_type,
@@ -348,7 +1138,45 @@ class DataclassFixturesGenerator(abc.ABC):
             default_value=None,
             default_factory=None,
         ))
-        return [{k: v} for k, v in zip(key_values, value_values)]
+        if not key_values or not value_values:  # like a recursive dataclass nested max_depth times
+            return [{}]
+
+        count: int = max(len(key_values), len(value_values))  # the shorter values are repeated
+        pairs: typing.Iterable[typing.Tuple[typing.Any, typing.Any]] = zip(
+            itertools.islice(itertools.cycle(key_values), count),
+            itertools.islice(itertools.cycle(value_values), count),
+        )
+        lengths: typing.Optional[typing.List[int]] = cls._draw_lengths(origin=dict, count=count)
+        if lengths is None:
+            return [{k: v} for k, v in pairs]
+
+        fill_count: int = sum(max(length - 1, 0) for length in lengths)
+        keys: typing.Iterator[typing.Any] = iter(cls._fill_values(
+            field_info=dataclasses.replace(field_info, field_type=key_type),
+            count=fill_count,
+            values=key_values,
+        ))
+        items: typing.Iterator[typing.Any] = iter(cls._fill_values(
+            field_info=dataclasses.replace(field_info, field_type=value_type),
+            count=fill_count,
+            values=value_values,
+        ))
+        values: typing.List[typing.Dict[typing.Any, typing.Any]] = []
+        k: typing.Any
+        v: typing.Any
+        length: int
+        for (k, v), length in zip(pairs, lengths):
+            if not length:
+                values.append({})
+                continue
+
+            value: typing.Dict[typing.Any, typing.Any] = dict(
+                zip(itertools.islice(keys, length - 1), itertools.islice(items, length - 1)),
+            )
+            value.pop(k, None)  # drawn keys do not replace the first value
+            values.append({k: v, **value})
+
+        return values
 
     @classmethod
     def _generate_dataclass_values(cls, field_info: FieldInfo) -> typing.List[typing.Any]:
@@ -358,60 +1186,1030 @@ class DataclassFixturesGenerator(abc.ABC):
             default_value: typing.Any = field_info.default_factory()
             return [default_value]
 
-        fields_values: typing.List[typing.List[typing.Any]] = []
-        fields: typing.Tuple[FieldInfo, ...] = cls._get_fields(cls_=field_info.field_type)
-        field_names: typing.List[str] = [f.field_name for f in fields]
-        field: FieldInfo
-        for field in fields:
-            field_values: typing.List[typing.Any] = cls._generate_values(field_info=field)
-            fields_values.append(field_values)
+        plan: TypePlan = cls._get_plan(field_info=field_info)
+        path: _Path = _PATH.get()
+        if path.count(plan.field_type) >= cls._max_depth:
+            return []  # the recursion ends here, so optional fields get None and collections are empty
+
+        memo: typing.Optional[typing.Dict[typing.Any, typing.List[typing.Any]]] = _MEMO.get()
+        memo_token: typing.Optional[contextvars.Token] = None
+        if memo is None:  # the outermost dataclass owns the memo
+            memo = {}
+            memo_token = _MEMO.set(memo)
+
+        # only dataclasses nested into themselves are memoized, so every level of a tree is generated once
+        key: typing.Any = (plan.field_type, _path_key(path)) if plan.field_type in path else None
+        path_token: contextvars.Token = _PATH.set(path + (plan.field_type,))
+        try:
+            if key is not None and key in memo:
+                return memo[key]
+
+            fields_values: typing.List[typing.List[typing.Any]] = []
+            field: FieldInfo
+            for field in plan.fields:
+                field_values: typing.List[typing.Any] = cls._generate_values(field_info=field)
+                fields_values.append(field_values)
+
+            values: typing.List[typing.Any] = cls._build_instances(plan, cls._strategy.combinations(fields_values))
+            if key is not None:
+                memo[key] = values
 
-        return [
-            field_info.field_type(**dict(zip(field_names, combination)))
-            for combination in itertools.product(*fields_values)
-        ]
+            return values
+        finally:
+            _PATH.reset(path_token)
+            if memo_token is not None:
+                _MEMO.reset(memo_token)
 
     @classmethod
-    def _generate_values(cls, field_info: FieldInfo) -> typing.List[typing.Any]:
-        # region NewType
-        if str(field_info.field_type).startswith('<function NewType.<locals>.new_type'):
-           field_info = dataclasses.replace(field_info, field_type=getattr(field_info.field_type, '__supertype__'))
+    def _generate_values_at(cls, field_info: FieldInfo, path: _Path) -> typing.List[typing.Any]:
+        """`_generate_values` of a field nested into the dataclasses of the path"""
+        token: contextvars.Token = _PATH.set(path)
+        try:
+            return cls._generate_values(field_info=field_info)
+        finally:
+            _PATH.reset(token)
+
+    @classmethod
+    def _build_instance(cls, plan: TypePlan, combination: typing.Sequence[typing.Any]) -> typing.Any:
+        """Create an instance of the dataclass of the plan from the values of its fields"""
+        instance: typing.Any
+        if cls._construct == 'fast':
+            instance = typing.cast(typing.Callable, plan.constructor)(combination)
+        else:
+            instance = plan.field_type(**dict(zip(plan.field_names, combination)))
+
+        if cls._intern:
+            return cls._intern_value(instance)
+
+        return instance
+
+    @classmethod
+    def _build_instances(
+        cls,
+        plan: TypePlan,
+        combinations: typing.Iterable[typing.Sequence[typing.Any]],
+    ) -> typing.List[typing.Any]:
+        """Create instances of the dataclass of the plan from the values of their fields, generators may do it at once"""
+        return [cls._build_instance(plan, combination) for combination in combinations]
+
+    @classmethod
+    def _iter_instances(
+        cls,
+        plan: TypePlan,
+        combinations: typing.Iterable[typing.Sequence[typing.Any]],
+    ) -> typing.Iterator[typing.Any]:
+        """Instances of `_build_instances` one by one, they are built by batches when construct is batch"""
+        if cls._construct != 'batch':
+            for combination in combinations:
+                yield cls._build_instance(plan, combination)
+
+            return
+
+        iterator: typing.Iterator[typing.Sequence[typing.Any]] = iter(combinations)
+        batch: typing.List[typing.Sequence[typing.Any]]
+        for batch in iter(lambda: list(itertools.islice(iterator, _BUILD_BATCH_SIZE)), []):
+            yield from cls._build_instances(plan, batch)
 
-        if sys.version_info >= (3, 10):
-            if isinstance(field_info.field_type, typing.cast(type, typing.NewType)):
-                field_info = dataclasses.replace(field_info, field_type=getattr(field_info.field_type, '__supertype__'))
-        # endregion NewType
+    @classmethod
+    def _get_non_init_fields(cls, cls_: typing.Type) -> typing.Tuple[typing.Tuple[str, typing.Callable], ...]:
+        """Names of fields `__init__` does not accept, which have defaults, and functions of an instance making them"""
+        non_init_fields: typing.List[typing.Tuple[str, typing.Callable]] = []
+        field: dataclasses.Field
+        for field in dataclasses.fields(cls_):
+            if field.init:
+                continue
+
+            if field.default is not dataclasses.MISSING:
+                non_init_fields.append((field.name, functools.partial(_make_default, field.default)))
+            elif field.default_factory is not dataclasses.MISSING:
+                non_init_fields.append((field.name, functools.partial(_make_by_factory, field.default_factory)))
+
+        return tuple(non_init_fields)
+
+    @classmethod
+    def _compile_constructor(
+        cls,
+        cls_: typing.Type,
+        field_names: typing.Tuple[str, ...],
+    ) -> typing.Callable[[typing.Sequence[typing.Any]], typing.Any]:
+        """
+        Function creating an instance of cls_ by `object.__new__` from the values of field_names.
+
+        Values are put into the `__dict__` of the instance, or set by `object.__setattr__` when the class or its bases
+        have slots for them, so frozen classes are handled too.
+        """
+        new: typing.Callable = object.__new__
+        non_init_fields: typing.Tuple[typing.Tuple[str, typing.Callable], ...] = cls._get_non_init_fields(cls_=cls_)
+        set_attribute: typing.Callable = object.__setattr__
+        slot_names: typing.Set[str] = {
+            name for name in itertools.chain(field_names, (name for name, _make in non_init_fields))
+            if isinstance(getattr(cls_, name, None), types.MemberDescriptorType)
+        }
+
+        if cls_.__dictoffset__ and not slot_names:  # instances have __dict__
+            def construct(combination: typing.Sequence[typing.Any]) -> typing.Any:
+                instance: typing.Any = new(cls_)
+                attributes: typing.Dict[str, typing.Any] = instance.__dict__
+                attributes.update(zip(field_names, combination))
+                for name, make in non_init_fields:
+                    attributes[name] = make(instance)
+
+                return instance
+        elif cls_.__dictoffset__:  # a class with __dict__ derived from a class with slots
+            dict_fields: typing.Tuple[typing.Tuple[int, str], ...] = tuple(
+                (position, name) for position, name in enumerate(field_names) if name not in slot_names
+            )
+            slot_fields: typing.Tuple[typing.Tuple[int, str], ...] = tuple(
+                (position, name) for position, name in enumerate(field_names) if name in slot_names
+            )
+
+            def construct(combination: typing.Sequence[typing.Any]) -> typing.Any:
+                instance: typing.Any = new(cls_)
+                instance.__dict__.update((name, combination[position]) for position, name in dict_fields)
+                for position, name in slot_fields:
+                    set_attribute(instance, name, combination[position])
+
+                for name, make in non_init_fields:
+                    set_attribute(instance, name, make(instance))
+
+                return instance
+        else:
+            def construct(combination: typing.Sequence[typing.Any]) -> typing.Any:
+                instance: typing.Any = new(cls_)
+                for name, value in zip(field_names, combination):
+                    set_attribute(instance, name, value)
+
+                for name, make in non_init_fields:
+                    set_attribute(instance, name, make(instance))
+
+                return instance
+
+        return construct
+
+    @classmethod
+    def _intern_value(cls, value: typing.Any) -> typing.Any:
+        """
+        The pooled object equal to the immutable value, the pool lives during one generation, see `_call_in_pool`.
+
+        Strings are pooled by themselves rather than by `sys.intern`, interned strings are never freed on python 3.12.
+        Components of tuples, frozensets and frozen dataclasses are interned before, so these containers
+        are pooled by the identities of their components. Numbers, bytes and values generated out of a pool
+        are not pooled.
+        """
+        value_type: typing.Type = type(value)
+        pool: typing.Optional[typing.Dict[typing.Any, typing.Any]] = _POOL.get()
+        if pool is None or value_type in _UNPOOLED_TYPES:
+            return value
+
+        key: typing.Any
+        if value_type is str:
+            return pool.setdefault(value, value)  # other keys are tuples
+        elif value_type is tuple:
+            value = tuple(cls._intern_value(item) for item in value)
+            key = (value_type, tuple(map(_get_component_key, value)))
+        elif value_type is frozenset:
+            value = frozenset(cls._intern_value(item) for item in value)
+            key = (value_type, frozenset(map(_get_component_key, value)))
+        elif getattr(getattr(value_type, '__dataclass_params__', None), 'frozen', False):
+            key = (value_type, tuple(_get_component_key(getattr(value, field.name)) for field in dataclasses.fields(value)))
+        else:  # mutable or unknown values are not shared
+            return value
+
+        return pool.setdefault(key, value)
+
+    @classmethod
+    def _call_in_pool(cls, function: typing.Callable[..., _T], *args: typing.Any, **kwargs: typing.Any) -> _T:
+        """The result of the function, values it interns share one pool, which is dropped after the call"""
+        if not cls._intern or _POOL.get() is not None:  # an outer call owns the pool
+            return function(*args, **kwargs)
+
+        token: contextvars.Token = _POOL.set({})
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _POOL.reset(token)
+
+    @classmethod
+    def _iter_in_pool(cls, iterator: typing.Iterator[_T]) -> typing.Iterator[_T]:
+        """The values of the iterator, values it interns share one pool, which is dropped with the iterator"""
+        if not cls._intern:
+            return iterator
+
+        context: contextvars.Context = contextvars.copy_context()  # every value is produced in it
+        if context.get(_POOL) is None:
+            context.run(_POOL.set, {})
+
+        return iter(functools.partial(context.run, next, iterator, _EXHAUSTED), _EXHAUSTED)
+
+    @classmethod
+    def _resolve_annotated(cls, field_info: FieldInfo) -> FieldInfo:
+        """Replace Annotated with the type it annotates"""
+        if _ANNOTATED is not None and typing.get_origin(field_info.field_type) is _ANNOTATED:
+            field_info = dataclasses.replace(field_info, field_type=typing.get_args(field_info.field_type)[0])
+
+        return field_info
+
+    @classmethod
+    def _resolve_new_type(cls, field_info: FieldInfo) -> FieldInfo:
+        """Replace NewType with its supertype, a NewType of a NewType too"""
+        while not inspect.isclass(field_info.field_type) and hasattr(field_info.field_type, '__supertype__'):
+            field_info = dataclasses.replace(field_info, field_type=getattr(field_info.field_type, '__supertype__'))
 
+        return field_info
+
+    @classmethod
+    def _compile_plan(cls, field_info: FieldInfo) -> TypePlan:
+        """Inspect the field type"""
+        field_info = cls._resolve_new_type(field_info=cls._resolve_annotated(field_info=field_info))
         cls._validate_field_type(field_info=field_info)
+        field_type: typing.Any = field_info.field_type
+        handler: typing.Optional[_Handler] = cls._find_handler(field_type=field_type)
+
+        if handler is not None and handler not in _BUILTIN_HANDLERS:  # types registered by users are scalars
+            return TypePlan(field_type=field_type, kind=FieldKind.SCALAR, handler=handler)
 
-        values: typing.List[typing.Any]
         if cls._is_union(field_info=field_info):
-            values = cls._generate_union_values(field_info=field_info)
-            return values
+            types: typing.Tuple[typing.Type, ...] = tuple(cls._get_union_types(field_info=field_info))
+            return TypePlan(
+                field_type=field_type,
+                kind=FieldKind.UNION,
+                args=types,
+                lazy=any(
+                    cls._get_plan(field_info=dataclasses.replace(field_info, field_type=type_)).lazy
+                    for type_ in types
+                ),
+            )
 
         if cls._is_collection(field_info=field_info):
-            values = cls._generate_collection_values(field_info=field_info)
-            return values
+            args: typing.Tuple[typing.Any, ...] = typing.get_args(field_type)
+            origin: typing.Any = typing.get_origin(field_type)
+            variadic: bool = origin is not tuple or (len(args) == 2 and args[1] is ...)
+            return TypePlan(
+                field_type=field_type,
+                kind=FieldKind.COLLECTION,
+                args=args[:1] if origin is tuple and variadic else args,  # the element type of Tuple[X, ...]
+                origin=origin,
+                variadic=variadic,
+            )
 
         if cls._is_dict(field_info=field_info):
-            values = cls._generate_dict_values(field_info=field_info)
-            return values
+            return TypePlan(field_type=field_type, kind=FieldKind.DICT, args=typing.get_args(field_type))
 
         if cls._is_dataclass(field_info=field_info):
+            fields: typing.Tuple[FieldInfo, ...] = cls._get_fields(cls_=field_type)
+            field_names: typing.Tuple[str, ...] = tuple(f.field_name for f in fields)
+            return TypePlan(
+                field_type=field_type,
+                kind=FieldKind.DATACLASS,
+                fields=fields,
+                field_names=field_names,
+                lazy=True,
+                constructor=cls._compile_constructor(cls_=field_type, field_names=field_names),
+            )
+
+        enum_members: typing.Tuple[enum.Enum, ...] = ()
+        if inspect.isclass(field_type) and issubclass(field_type, enum.Enum):
+            enum_members = tuple(field_type)
+
+        return TypePlan(field_type=field_type, kind=FieldKind.SCALAR, enum_members=enum_members, handler=handler)
+
+    @classmethod
+    def _get_plans(cls) -> _Plans:
+        """Compiled plans of this generator class, every subclass has its own ones, configured generators share them"""
+        plans: typing.Optional[_Plans] = cls.__dict__.get('_plans')
+        if plans is None:
+            plans = _Plans()
+            setattr(cls, '_plans', plans)
+
+        return plans
+
+    @classmethod
+    def _get_plan(cls, field_info: FieldInfo) -> TypePlan:
+        """Compiled plan of the field type, plans of classes are cached while the classes are alive"""
+        plans: _Plans = cls._get_plans()
+        plan: typing.Optional[TypePlan]
+        try:
+            plan = plans.get(field_info.field_type)
+        except TypeError:  # unhashable type
+            return cls._compile_plan(field_info=field_info)
+
+        if plan is None:
+            plan = cls._compile_plan(field_info=field_info)
+            plans.set(field_info.field_type, plan)
+
+        return plan
+
+    @classmethod
+    def _resolve_plan(cls, field_info: FieldInfo) -> typing.Tuple[TypePlan, FieldInfo]:
+        """
+        Compiled plan of the field type and the field info with NewType replaced by its supertype,
+        an async default factory is replaced by its awaited result
+        """
+        plan: TypePlan = cls._get_plan(field_info=field_info)
+        if plan.field_type is not field_info.field_type:
+            field_info = dataclasses.replace(field_info, field_type=plan.field_type)
+
+        awaited: typing.Optional[typing.Dict[typing.Callable, typing.Any]] = _AWAITED.get()
+        if awaited is not None and field_info.default_factory in awaited:
+            value: typing.Any = awaited[typing.cast(typing.Callable, field_info.default_factory)]
+            field_info = dataclasses.replace(field_info, default_factory=itertools.repeat(value).__next__)
+
+        return plan, field_info
+
+    @classmethod
+    def _generate_values(cls, field_info: FieldInfo) -> typing.List[typing.Any]:
+        plan: TypePlan
+        plan, field_info = cls._resolve_plan(field_info=field_info)
+        if cls._stats is not None:
+            return cls._record_values(plan=plan, field_info=field_info, stats=cls._stats)
+
+        return cls._dispatch_values(plan=plan, field_info=field_info)
+
+    @classmethod
+    def _dispatch_values(cls, plan: TypePlan, field_info: FieldInfo) -> typing.List[typing.Any]:
+        """Values of the resolved field by the kind of its plan"""
+        values: typing.List[typing.Any]
+        if plan.kind is FieldKind.UNION:
+            values = cls._generate_union_values(field_info=field_info)
+            return values  # members are interned already
+
+        if plan.kind is FieldKind.COLLECTION:
+            values = cls._generate_collection_values(field_info=field_info)
+        elif plan.kind is FieldKind.DICT:
+            values = cls._generate_dict_values(field_info=field_info)
+        elif plan.kind is FieldKind.DATACLASS:
             values = cls._generate_dataclass_values(field_info=field_info)
-            return values
+        elif plan.handler is not None:
+            values = plan.handler(cls, field_info)
+        else:
+            values = cls._generate_scalar_values(field_info=field_info)
+
+        if cls._intern:
+            values = [cls._intern_value(value) for value in values]
+
+        return values
 
-        values = cls._generate_scalar_values(field_info=field_info)
+    @classmethod
+    def _record_values(cls, plan: TypePlan, field_info: FieldInfo, stats: GenerationStats) -> typing.List[typing.Any]:
+        """`_dispatch_values` measured by the stats"""
+        path: _Path = _PATH.get()
+        model: typing.Any = plan.field_type if plan.kind is FieldKind.DATACLASS else (path[-1] if path else None)
+        factory_calls: typing.List[int] = [0]
+        if field_info.default_factory and plan.kind is not FieldKind.UNION:  # members of unions call the factory
+            factory: typing.Callable[[], typing.Any] = field_info.default_factory
+
+            def counted_factory() -> typing.Any:
+                factory_calls[0] += 1
+                return factory()
+
+            field_info = dataclasses.replace(field_info, default_factory=counted_factory)
+
+        if stats.before is not None:
+            stats.before(model, plan.kind.value, field_info)
+
+        started: float = time.perf_counter()
+        values: typing.List[typing.Any] = cls._dispatch_values(plan=plan, field_info=field_info)
+        seconds: float = time.perf_counter() - started
+        stats.record(
+            model=model, kind=plan.kind.value, values=len(values), seconds=seconds, default_factory_calls=factory_calls[0],
+        )
+        if stats.after is not None:
+            stats.after(model, plan.kind.value, field_info, values, seconds)
 
         return values
 
     @classmethod
-    def generate_fixtures(cls, cls_: typing.Type[_T]) -> typing.List[_T]:
-        """Generate fixtures for dataclass"""
+    def _is_lazy(cls, field_info: FieldInfo) -> bool:
+        """True if field values contain nested dataclasses, so they are worth producing on demand"""
+        return cls._get_plan(field_info=field_info).lazy
+
+    @classmethod
+    def _iter_values(
+        cls,
+        field_info: FieldInfo,
+        start: int = 0,
+        explanation: typing.Optional[FixturesExplanation] = None,
+        path: _Path = (),
+    ) -> typing.Iterator[typing.Any]:
+        """
+        The same values as `_generate_values` returns, but nested dataclasses are produced one by one.
+
+        start -- index of the first value, the explanation of the field is required to skip values
+        path -- types of the dataclasses the field is nested into
+        """
+        plan: TypePlan
+        plan, field_info = cls._resolve_plan(field_info=field_info)
+
+        if plan.kind is FieldKind.UNION:
+            position: int
+            type_: typing.Any
+            for position, type_ in enumerate(plan.args):
+                child: typing.Optional[FixturesExplanation] = None
+                if start:
+                    child = typing.cast(FixturesExplanation, explanation).children[position]
+                    if start >= child.count:
+                        start -= child.count
+                        continue
+
+                yield from cls._iter_values(
+                    field_info=FieldInfo(
+                        field_name=field_info.field_name,
+                        field_type=type_,
+                        default_value=field_info.default_value if type_ else None,
+                        default_factory=field_info.default_factory if type_ else None,
+                    ),
+                    start=start,
+                    explanation=child,
+                    path=path,
+                )
+                start = 0
+        elif plan.kind is FieldKind.DATACLASS:
+            yield from cls._iter_dataclass_values(field_info=field_info, start=start, explanation=explanation, path=path)
+        else:
+            yield from itertools.islice(cls._generate_values_at(field_info=field_info, path=path), start, None)
+
+    @classmethod
+    def _iter_dataclass_values(
+        cls,
+        field_info: FieldInfo,
+        start: int = 0,
+        explanation: typing.Optional[FixturesExplanation] = None,
+        path: _Path = (),
+    ) -> typing.Iterator[typing.Any]:
+        """Lazy counterpart of `_generate_dataclass_values`, other arguments are the same as `_iter_values` has"""
+        if field_info.default_value is not None:
+            if not start:
+                yield field_info.default_value
+
+            return
+        elif field_info.default_factory:
+            if not start:
+                yield field_info.default_factory()
+
+            return
+
+        plan: TypePlan = cls._get_plan(field_info=field_info)
+        if path.count(plan.field_type) >= cls._max_depth:
+            return
+
+        path = path + (plan.field_type,)
+        field: FieldInfo
+        if not isinstance(cls._strategy, ProductStrategy):
+            # other strategies pick combinations by indices, so nested values are needed in advance
+            fields_values: typing.List[typing.List[typing.Any]] = [
+                cls._generate_values_at(field_info=field, path=path) for field in plan.fields
+            ]
+            yield from cls._iter_instances(plan, itertools.islice(cls._strategy.combinations(fields_values), start, None))
+
+            return
+
+        sources: typing.List[typing.Callable[[], typing.Iterable[typing.Any]]] = []
+        start_sources: typing.Optional[typing.List[typing.Callable[[], typing.Iterable[typing.Any]]]] = None
+        children: typing.Tuple[FixturesExplanation, ...] = ()
+        row: typing.Tuple[int, ...] = ()
+        if start:
+            children = typing.cast(FixturesExplanation, explanation).children
+            row = cls._strategy.row([child.count for child in children], start)
+            start_sources = []
+
+        position: int
+        for position, field in enumerate(plan.fields):
+            if cls._is_lazy(field_info=field):
+                # nested dataclasses are generated again for every combination of the preceding fields
+                sources.append(functools.partial(cls._iter_values, field_info=field, path=path))
+                if start_sources is not None:
+                    start_sources.append(functools.partial(
+                        cls._iter_values,
+                        field_info=field,
+                        start=row[position],
+                        explanation=children[position],
+                        path=path,
+                    ))
+            else:
+                values: typing.List[typing.Any] = cls._generate_values_at(field_info=field, path=path)
+                sources.append(values.__iter__)
+                if start_sources is not None:
+                    start_sources.append(functools.partial(itertools.islice, values, row[position], None))
+
+        yield from cls._iter_instances(plan, _lazy_product(sources, start_sources))
+
+    @classmethod
+    def _get_root_field_info(cls, cls_: typing.Type) -> FieldInfo:
+        """Field info of the dataclass fixtures are generated for"""
+        return FieldInfo(field_name='-', field_type=cls_, default_value=None, default_factory=None)
+
+    @classmethod
+    def _count_scalar_values(cls, field_info: FieldInfo) -> int:
+        """The number of values `_generate_scalar_values` or the handler of the type returns"""
+        handler: typing.Optional[_Handler] = cls._find_handler(field_type=field_info.field_type)
+        if handler is None or handler in _SINGLE_VALUE_HANDLERS:
+            return 1
+
+        return len(handler(cls, field_info))  # bools, literals and registered handlers may return any number of values
+
+    @classmethod
+    def _explain(
+        cls,
+        field_info: FieldInfo,
+        explained: typing.Dict[typing.Any, FixturesExplanation],
+        path: _Path = (),
+    ) -> FixturesExplanation:
+        """
+        Count values of the field without generating them, explained dataclasses are reused
+
+        path -- types of the dataclasses the field is nested into
+        """
+        plan: TypePlan
+        plan, field_info = cls._resolve_plan(field_info=field_info)
+        has_default: bool = field_info.default_value is not None or bool(field_info.default_factory)
+        children: typing.Tuple[FixturesExplanation, ...] = ()
+        count: int
+
+        if plan.kind is FieldKind.UNION:
+            children = tuple(
+                cls._explain(
+                    field_info=FieldInfo(
+                        field_name=field_info.field_name,
+                        field_type=type_,
+                        default_value=field_info.default_value if type_ else None,
+                        default_factory=field_info.default_factory if type_ else None,
+                    ),
+                    explained=explained,
+                    path=path,
+                )
+                for type_ in plan.args
+            )
+            count = sum(child.count for child in children)
+        elif plan.kind is FieldKind.DATACLASS and not has_default:
+            key: typing.Any = (plan.field_type, _path_key(path))
+            if key in explained:
+                return dataclasses.replace(explained[key], field_name=field_info.field_name)
+
+            if path.count(plan.field_type) >= cls._max_depth:
+                count = 0
+            else:
+                children = tuple(
+                    cls._explain(field_info=field, explained=explained, path=path + (plan.field_type,))
+                    for field in plan.fields
+                )
+                count = cls._strategy.count([child.count for child in children])
+            explanation: FixturesExplanation = FixturesExplanation(
+                field_name=field_info.field_name,
+                field_type=plan.field_type,
+                kind=plan.kind,
+                count=count,
+                children=children,
+            )
+            explained[key] = explanation
+            return explanation
+        elif plan.kind in {FieldKind.COLLECTION, FieldKind.DICT} and not has_default:
+            children = tuple(
+                cls._explain(
+                    field_info=FieldInfo(
+                        field_name=field_info.field_name,
+                        field_type=type_,
+                        default_value=None,
+                        default_factory=None,
+                    ),
+                    explained=explained,
+                    path=path,
+                )
+                for type_ in plan.args
+            )
+            if plan.kind is FieldKind.DICT:
+                # the shorter of keys and values are repeated, or the dict is empty
+                count = max(child.count for child in children) if all(child.count for child in children) else 1
+            elif any(cls._is_lazy(field_info=dataclasses.replace(field_info, field_type=t)) for t in plan.args):
+                count = sum(child.count for child in children) or 1  # elements are not merged, or the collection is empty
+            else:
+                # equal elements are merged, so small lists of elements values are generated to count them
+                count = len(cls._generate_values_at(field_info=field_info, path=path))
+        elif plan.kind is FieldKind.SCALAR:
+            count = cls._count_scalar_values(field_info=field_info)
+        else:
+            count = 1  # the default value of a dataclass, a collection or a dict
+
+        return FixturesExplanation(
+            field_name=field_info.field_name,
+            field_type=plan.field_type,
+            kind=plan.kind,
+            count=count,
+            children=children,
+        )
+
+    @classmethod
+    def explain(
+        cls,
+        cls_: typing.Type,
+        strategy: typing.Optional[typing.Union[str, CombinationStrategy]] = None,
+    ) -> FixturesExplanation:
+        """
+        The number of fixtures `generate_fixtures` would produce with the numbers of values of every field.
+
+        Fixtures are not generated, the time is proportional to the size of the dataclass schema.
+        """
+        if strategy is not None:
+            return cls.configure(strategy=strategy).explain(cls_=cls_)
+
         cls._validate(cls_=cls_)
-        return cls._generate_dataclass_values(field_info=FieldInfo(
-            field_name='-',
-            field_type=cls_,
-            default_value=None,
-            default_factory=None,
+        return cls._explain(field_info=cls._get_root_field_info(cls_=cls_), explained={})
+
+    @classmethod
+    def _get_value(
+        cls,
+        field_info: FieldInfo,
+        explanation: FixturesExplanation,
+        index: int,
+        path: _Path = (),
+        values: typing.Optional[typing.Dict[int, typing.List[typing.Any]]] = None,
+    ) -> typing.Any:
+        """
+        The value of the field by its index in the values `_generate_values` would return, path as `_explain` has
+
+        values -- values of scalars, collections, dicts and dataclasses with defaults, which are generated
+        as a whole, by ids of their explanations, they are generated once for all the indices
+        """
+        plan: TypePlan
+        plan, field_info = cls._resolve_plan(field_info=field_info)
+
+        if plan.kind is FieldKind.UNION:
+            type_: typing.Any
+            child: FixturesExplanation
+            for type_, child in zip(plan.args, explanation.children):
+                if index < child.count:
+                    return cls._get_value(
+                        field_info=FieldInfo(
+                            field_name=field_info.field_name,
+                            field_type=type_,
+                            default_value=field_info.default_value if type_ else None,
+                            default_factory=field_info.default_factory if type_ else None,
+                        ),
+                        explanation=child,
+                        index=index,
+                        path=path,
+                        values=values,
+                    )
+
+                index -= child.count
+
+            raise IndexError(f'value index of field name=={field_info.field_name} out of range')
+
+        if plan.kind is FieldKind.DATACLASS and explanation.children:
+            row: typing.Tuple[int, ...] = cls._strategy.row([c.count for c in explanation.children], index)
+            return cls._build_instance(
+                plan,
+                [
+                    cls._get_value(
+                        field_info=field, explanation=child, index=field_index, path=path + (plan.field_type,), values=values,
+                    )
+                    for field, child, field_index in zip(plan.fields, explanation.children, row)
+                ],
+            )
+
+        if values is None:
+            return cls._generate_values_at(field_info=field_info, path=path)[index]
+
+        field_values: typing.Optional[typing.List[typing.Any]] = values.get(id(explanation))
+        if field_values is None:
+            field_values = values.setdefault(id(explanation), cls._generate_values_at(field_info=field_info, path=path))
+
+        return field_values[index]
+
+    @classmethod
+    def sample_fixtures(
+        cls,
+        cls_: typing.Type[_T],
+        k: int,
+        seed: typing.Optional[_Seed] = None,
+        strategy: typing.Optional[typing.Union[str, CombinationStrategy]] = None,
+    ) -> typing.List[_T]:
+        """
+        Uniformly choose k distinct fixtures of `generate_fixtures`, in the same order.
+
+        Only the chosen fixtures are built, each one by decoding its index into indices of fields values.
+        seed -- seed of the choice of the fixtures and of their random values, see `configure`
+        """
+        if strategy is not None or seed is not None:
+            return cls.configure(strategy=strategy, seed=seed).sample_fixtures(cls_=cls_, k=k)
+
+        space: FixtureSpace[_T] = cls.space(cls_=cls_)
+        count: int = space.size
+        if not 0 <= k <= count:
+            raise ValueError(f'k=={k} is negative or larger than the number of fixtures=={count}')
+
+        indices: typing.Iterable[int]
+        if count <= sys.maxsize:
+            indices = cls._random.sample(range(count), k)
+        else:  # len(range) does not support such numbers, and collisions are unlikely
+            chosen: typing.Set[int] = set()
+            while len(chosen) < k:
+                chosen.add(cls._random.randrange(count))
+
+            indices = chosen
+
+        return cls._call_in_pool(lambda: [space[index] for index in sorted(indices)])
+
+    @classmethod
+    def space(
+        cls,
+        cls_: typing.Type[_T],
+        strategy: typing.Optional[typing.Union[str, CombinationStrategy]] = None,
+    ) -> FixtureSpace[_T]:
+        """
+        Fixtures of `generate_fixtures` as a sequence, a fixture is built only when it is accessed.
+
+        `space[i]` takes the time proportional to the number of fields, values of scalar, collection and dict fields
+        are generated on the first access and kept by the space and its slices,
+        so parallel workers can build their own slices like `space[worker_index::workers_count]`.
+        """
+        if strategy is not None:
+            return cls.configure(strategy=strategy).space(cls_=cls_)
+
+        return FixtureSpace(generator=cls, cls_=cls_, explanation=cls.explain(cls_=cls_))
+
+    @classmethod
+    def count_fixtures(
+        cls,
+        cls_: typing.Type,
+        strategy: typing.Optional[typing.Union[str, CombinationStrategy]] = None,
+    ) -> int:
+        """The number of fixtures `generate_fixtures` would produce, without generating them"""
+        return cls.explain(cls_=cls_, strategy=strategy).count
+
+    @classmethod
+    def _iter_fixtures_parallel(
+        cls,
+        cls_: typing.Type[_T],
+        workers: int,
+        chunk_size: typing.Optional[int] = None,
+    ) -> typing.Iterator[_T]:
+        """Build chunks of fixtures in worker processes, the chunks are yielded in order"""
+        size: int = cls.space(cls_=cls_).size
+        if chunk_size is None:
+            chunk_size = max(1, min(_MAX_CHUNK_SIZE, -(-size // (workers * 4))))
+
+        starts: typing.Iterator[int] = iter(range(0, size, chunk_size))
+        pending: typing.Deque[concurrent.futures.Future] = collections.deque()
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            def submit(start: int) -> None:
+                options: typing.Dict[str, typing.Any] = {
+                    name: value for name, value in cls._options.items() if name not in {'seed', 'rng'}
+                }
+                options['seed'] = cls._random.getrandbits(64)  # every chunk has its own random stream
+                pending.append(executor.submit(
+                    _build_fixtures_chunk,
+                    cls._get_base_generator(),
+                    options,
+                    cls_,
+                    start,
+                    min(start + typing.cast(int, chunk_size), size),
+                ))
+
+            start: int
+            for start in itertools.islice(starts, workers * 2):  # the rest chunks wait for the yielded ones
+                submit(start=start)
+
+            try:
+                while pending:
+                    chunk: typing.List[_T] = pending.popleft().result()
+                    for start in itertools.islice(starts, 1):
+                        submit(start=start)
+
+                    yield from chunk
+            finally:
+                future: concurrent.futures.Future
+                for future in pending:
+                    future.cancel()
+
+    @classmethod
+    def iter_fixtures(
+        cls,
+        cls_: typing.Type[_T],
+        strategy: typing.Optional[typing.Union[str, CombinationStrategy]] = None,
+        workers: typing.Optional[int] = None,
+        chunk_size: typing.Optional[int] = None,
+    ) -> typing.Iterator[_T]:
+        """
+        Generate fixtures for dataclass one by one, in the same order as `generate_fixtures` does
+
+        workers -- the number of processes building chunks of chunk_size fixtures,
+        cls_ and default factories have to be importable by the processes
+        """
+        if strategy is not None:
+            return cls.configure(strategy=strategy).iter_fixtures(cls_=cls_, workers=workers, chunk_size=chunk_size)
+
+        if workers is not None:
+            return cls._iter_fixtures_parallel(cls_=cls_, workers=workers, chunk_size=chunk_size)
+
+        cls._validate(cls_=cls_)
+        return cls._iter_in_pool(cls._iter_dataclass_values(field_info=cls._get_root_field_info(cls_=cls_)))
+
+    @classmethod
+    def _iter_default_factories(
+        cls,
+        field_info: FieldInfo,
+        seen: typing.Set[typing.Any],
+    ) -> typing.Iterator[typing.Callable[[], typing.Any]]:
+        """Default factories of the field and of the fields nested into it, seen are dataclasses visited already"""
+        if field_info.default_factory:
+            yield field_info.default_factory
+
+        plan: TypePlan = cls._get_plan(field_info=field_info)
+        if plan.kind is FieldKind.DATACLASS:
+            if plan.field_type in seen or field_info.default_value is not None or field_info.default_factory:
+                return
+
+            seen.add(plan.field_type)
+            field: FieldInfo
+            for field in plan.fields:
+                yield from cls._iter_default_factories(field_info=field, seen=seen)
+        elif plan.kind is not FieldKind.SCALAR:
+            type_: typing.Any
+            for type_ in plan.args:
+                yield from cls._iter_default_factories(
+                    field_info=FieldInfo(
+                        field_name=field_info.field_name,
+                        field_type=type_,
+                        default_value=None,
+                        default_factory=None,
+                    ),
+                    seen=seen,
+                )
+
+    @classmethod
+    async def _await_default_factories(cls, cls_: typing.Type) -> typing.Dict[typing.Callable, typing.Any]:
+        """Results of the async default factories of the dataclass, the factories are awaited concurrently"""
+        factories: typing.List[typing.Callable[[], typing.Any]] = list(dict.fromkeys(
+            factory for factory in cls._iter_default_factories(field_info=cls._get_root_field_info(cls_=cls_), seen=set())
+            if inspect.iscoroutinefunction(factory)
         ))
+        values: typing.List[typing.Any] = await asyncio.gather(*(factory() for factory in factories))
+        return dict(zip(factories, values))
+
+    @classmethod
+    async def agenerate_fixtures(
+        cls,
+        cls_: typing.Type[_T],
+        batch_size: int = 1000,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        strategy: typing.Optional[typing.Union[str, CombinationStrategy]] = None,
+    ) -> typing.AsyncIterator[typing.List[_T]]:
+        """
+        Yield the fixtures of `iter_fixtures` by batches, the event loop runs other tasks between the batches
+
+        executor -- a thread pool building the batches, so the event loop is not blocked while a batch is built.
+        `async def` default factories are awaited concurrently once before generation, their results are the defaults.
+        """
+        if batch_size < 1:
+            raise ValueError(f'batch_size=={batch_size} must be positive')
+
+        generator: typing.Type[DataclassFixturesGenerator] = cls if strategy is None else cls.configure(strategy=strategy)
+        generator._validate(cls_=cls_)
+        context: contextvars.Context = contextvars.copy_context()  # every batch is built in it, in any thread
+        context.run(_AWAITED.set, await generator._await_default_factories(cls_=cls_))
+        fixtures: typing.Iterator[_T] = context.run(generator.iter_fixtures, cls_)
+
+        def build_batch() -> typing.List[_T]:
+            return context.run(list, itertools.islice(fixtures, batch_size))
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while True:
+            batch: typing.List[_T]
+            if executor is None:
+                await asyncio.sleep(0)
+                batch = build_batch()
+            else:
+                batch = await loop.run_in_executor(executor, build_batch)
+
+            if not batch:
+                return
+
+            yield batch
+
+    @classmethod
+    def generate_fixtures(
+        cls,
+        cls_: typing.Type[_T],
+        strategy: typing.Optional[typing.Union[str, CombinationStrategy]] = None,
+        workers: typing.Optional[int] = None,
+    ) -> typing.List[_T]:
+        """
+        Generate fixtures for dataclass
+
+        strategy -- product (default) of all fields values, each_choice, pairwise or a CombinationStrategy instance
+        workers -- the number of processes generating fixtures, see `iter_fixtures`
+        """
+        if strategy is not None:
+            return cls.configure(strategy=strategy).generate_fixtures(cls_=cls_, workers=workers)
+
+        if workers is not None:
+            return list(cls._iter_fixtures_parallel(cls_=cls_, workers=workers))
+
+        cls._validate(cls_=cls_)
+        return cls._call_in_pool(cls._generate_dataclass_values, field_info=cls._get_root_field_info(cls_=cls_))
+
+    @classmethod
+    def _to_column(cls, plan: TypePlan, values: typing.List[typing.Any]) -> _Column:
+        """Values of an int, float or bool field as array.array, values of other fields as they are"""
+        field_type: typing.Any = plan.field_type
+        if plan.kind is FieldKind.SCALAR and inspect.isclass(field_type) and not issubclass(field_type, enum.Enum):
+            type_: type
+            typecode: str
+            for type_, typecode in _COLUMN_TYPECODES:
+                if issubclass(field_type, type_):
+                    try:
+                        return array.array(typecode, values)
+                    except (TypeError, OverflowError):  # default values of other types or out of range
+                        break
+
+        return values
+
+    @classmethod
+    def _generate_columns(
+        cls,
+        field_info: FieldInfo,
+        prefix: str,
+        path: _Path = (),
+    ) -> typing.Tuple[int, typing.Dict[str, _Column]]:
+        """
+        The number of rows and the columns of fields of the dataclass, names of the columns start with prefix
+
+        Dataclasses nested into themselves are not flattened, their columns hold the instances.
+        """
+        plan: TypePlan = cls._get_plan(field_info=field_info)
+        path = path + (plan.field_type,)
+        sizes: typing.List[int] = []
+        fields_columns: typing.List[typing.Dict[str, _Column]] = []
+        field: FieldInfo
+        for field in plan.fields:
+            name: str = prefix + field.field_name
+            field_plan: TypePlan
+            field_plan, field = cls._resolve_plan(field_info=field)
+            if (
+                field_plan.kind is FieldKind.DATACLASS
+                and field.default_value is None
+                and not field.default_factory
+                and field_plan.field_type not in path
+            ):
+                size, columns = cls._generate_columns(field_info=field, prefix=f'{name}.', path=path)
+            else:
+                values: typing.List[typing.Any] = cls._generate_values_at(field_info=field, path=path)
+                size, columns = len(values), {name: cls._to_column(plan=field_plan, values=values)}
+
+            sizes.append(size)
+            fields_columns.append(columns)
+
+        result: typing.Dict[str, _Column] = {}
+        position: int
+        column_name: str
+        column: _Column
+        if isinstance(cls._strategy, ProductStrategy):
+            for position, columns in enumerate(fields_columns):
+                repeats: int = math.prod(sizes[position + 1:])
+                tiles: int = math.prod(sizes[:position])
+                for column_name, column in columns.items():
+                    result[column_name] = _repeat_column(column=column, repeats=repeats, tiles=tiles)
+
+            return math.prod(sizes), result
+
+        rows: typing.List[typing.Tuple[int, ...]] = list(cls._strategy.indices(sizes))
+        for position, columns in enumerate(fields_columns):
+            for column_name, column in columns.items():
+                result[column_name] = _take_column(column=column, indices=(row[position] for row in rows))
+
+        return len(rows), result
+
+    @classmethod
+    def generate_columns(
+        cls,
+        cls_: typing.Type,
+        strategy: typing.Optional[typing.Union[str, CombinationStrategy]] = None,
+    ) -> typing.Dict[str, _Column]:
+        """
+        Values of fields of the fixtures `generate_fixtures` returns by columns, the fixtures are not built
+
+        Columns of int, float and bool fields are array.array of q, d and b typecodes, other columns are lists,
+        fields of nested dataclasses are flattened to dotted names like `s.x`
+        """
+        if strategy is not None:
+            return cls.configure(strategy=strategy).generate_columns(cls_=cls_)
+
+        cls._validate(cls_=cls_)
+        return cls._call_in_pool(cls._generate_columns, field_info=cls._get_root_field_info(cls_=cls_), prefix='')[1]
+
+
+_MAX_CHUNK_SIZE: int = 10000
+
+
+def _build_fixtures_chunk(
+    generator: typing.Type[DataclassFixturesGenerator],
+    options: typing.Dict[str, typing.Any],
+    cls_: typing.Type[_T],
+    start: int,
+    stop: int,
+) -> typing.List[_T]:
+    """Build fixtures by indices from start to stop in a worker process"""
+    if options:
+        generator = generator.configure(**options)
+
+    return list(generator.space(cls_=cls_)[start:stop])
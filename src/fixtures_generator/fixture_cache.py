@@ -0,0 +1,265 @@
+import os
+import lzma
+import zlib
+import pickle
+import types
+import typing
+import hashlib
+import tempfile
+import fixtures_generator
+from .dataclass_fixtures_generator import FieldInfo, FieldKind, TypePlan, DataclassFixturesGenerator
+from ._common import _get_generator
+
+__all__ = (
+    'FixtureCache',
+)
+
+_COMPRESSIONS: typing.Dict[str, typing.Tuple[
+    str,
+    typing.Callable[[bytes], bytes],
+    typing.Callable[[bytes], bytes],
+]] = {
+    'zlib': ('.pkl.zlib', zlib.compress, zlib.decompress),
+    'lzma': ('.pkl.xz', lzma.compress, lzma.decompress),
+}
+_CACHE_ERRORS: typing.Tuple[typing.Type[Exception], ...] = (
+    OSError, EOFError, pickle.UnpicklingError, zlib.error, lzma.LZMAError, AttributeError, ImportError, ValueError,
+)
+"""a missing, corrupt or stale entry is generated again"""
+
+
+def _get_name(value: typing.Any) -> str:
+    """Stable name of a class or a function, reprs of other objects"""
+    if hasattr(value, '__qualname__'):
+        return f'{getattr(value, "__module__", "")}.{value.__qualname__}'
+
+    return repr(value)
+
+
+def _describe_code(code: types.CodeType) -> str:
+    """Bytecode, constants and names of a function, lambdas and nested functions of one scope share their names"""
+    constants: typing.List[str] = [
+        _describe_code(constant) if isinstance(constant, types.CodeType) else _describe_value(constant)
+        for constant in code.co_consts
+    ]
+    return f'code({code.co_code.hex()}, {constants}, {code.co_names!r})'
+
+
+def _describe_value(value: typing.Any) -> str:
+    """
+    Description of an option or a default value which is the same in every process, classes are described
+    by their names, functions by their names and code, ValueError is raised for reprs with memory addresses
+    """
+    if isinstance(value, dict):
+        return '{' + ', '.join(sorted(f'{_describe_value(key)}: {_describe_value(item)}' for key, item in value.items())) + '}'
+
+    if isinstance(value, (set, frozenset)):
+        return f'{type(value).__name__}({sorted(_describe_value(item) for item in value)})'
+
+    if isinstance(value, (list, tuple)):
+        return f'{type(value).__name__}({[_describe_value(item) for item in value]})'
+
+    if isinstance(value, types.FunctionType):
+        closure: typing.List[str] = [
+            # a recursive nested function refers to itself
+            _get_name(cell.cell_contents) if cell.cell_contents is value else _describe_value(cell.cell_contents)
+            for cell in value.__closure__ or ()
+        ]
+        return (
+            f'{_get_name(value)}({_describe_code(value.__code__)}, defaults={_describe_value(value.__defaults__)}, '
+            f'kwdefaults={_describe_value(value.__kwdefaults__)}, closure={closure})'
+        )
+
+    if hasattr(value, '__qualname__'):
+        return _get_name(value)
+
+    description: str = repr(value)
+    if ' at 0x' in description:
+        raise ValueError(f'{description} has no stable representation for a fingerprint')
+
+    return description
+
+
+def _describe_field(
+    generator: typing.Type[DataclassFixturesGenerator],
+    field_info: FieldInfo,
+    seen: typing.Set[typing.Any],
+    lines: typing.List[str],
+) -> None:
+    """Lines describing the structure of the field and of the fields nested into it"""
+    plan: TypePlan = generator._get_plan(field_info=field_info)
+    lines.append(
+        f'{field_info.field_name}: {plan.field_type!r} {plan.kind.value} '
+        f'default={_describe_value(field_info.default_value)} factory={_describe_value(field_info.default_factory)}'
+    )
+    if plan.kind is FieldKind.DATACLASS:
+        if plan.field_type in seen:
+            return
+
+        seen.add(plan.field_type)
+        lines.append(f'dataclass {_get_name(plan.field_type)}')
+        field: FieldInfo
+        for field in plan.fields:
+            _describe_field(generator=generator, field_info=field, seen=seen, lines=lines)
+    elif plan.enum_members:
+        lines.append(f'members {[(member.name, member.value) for member in plan.enum_members]!r}')
+    elif plan.handler is not None:
+        lines.append(f'handler {_describe_value(plan.handler)}')
+    elif plan.kind is not FieldKind.SCALAR:
+        type_: typing.Any
+        for type_ in plan.args:
+            _describe_field(
+                generator=generator,
+                field_info=FieldInfo(field_name='[]', field_type=type_, default_value=None, default_factory=None),
+                seen=seen,
+                lines=lines,
+            )
+
+
+class FixtureCache:
+    """
+    Fixtures of `generate_fixtures` stored in a directory by fingerprints of models and generators.
+
+    The fingerprint covers fields names, resolved types, defaults and nested models of the model, the generator class,
+    its options like the seed and the strategy, and the version of the package, so a changed model is generated again.
+    Entries are pickled and compressed by zlib or lzma, the least recently used ones are removed when the directory
+    grows over max_bytes. Entries are unpickled, so the directory should not be writable by others.
+    """
+
+    def __init__(
+        self,
+        directory: typing.Optional[str] = None,
+        max_bytes: int = 256 * 2 ** 20,
+        compression: str = 'zlib',
+    ) -> None:
+        if compression not in _COMPRESSIONS:
+            raise ValueError(f'compression=={compression} must be one of {", ".join(_COMPRESSIONS)}')
+
+        if directory is None:
+            directory = os.path.join(
+                os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                'dataclass-fixtures-generator',
+            )
+
+        self.directory: str = directory
+        self.max_bytes: int = max_bytes
+        self.compression: str = compression
+
+    def fingerprint(self, cls_: typing.Type, generator: typing.Type[DataclassFixturesGenerator]) -> str:
+        """
+        Hex digest of the structure of the model and of the generator, ValueError is raised for options
+        and defaults which have no stable representation, like objects with default reprs
+        """
+        options: typing.Dict[str, typing.Any] = dict(generator._options)
+        options.pop('strategy', None)
+        strategy: typing.Any = generator._strategy
+        handlers: typing.Iterable[typing.Tuple[typing.Any, typing.Any]] = generator._handlers.items()
+        lines: typing.List[str] = [
+            f'version {fixtures_generator.__version__}',
+            f'generator {_get_name(generator._get_base_generator())} {_describe_value(options)}',
+            f'strategy {_get_name(type(strategy))} {sorted(vars(strategy).items())!r}',
+            f'handlers {sorted((_get_name(type_), _describe_value(handler)) for type_, handler in handlers)!r}',
+        ]
+        _describe_field(generator=generator, field_info=generator._get_root_field_info(cls_=cls_), seen=set(), lines=lines)
+        return hashlib.sha256('\n'.join(lines).encode('utf-8')).hexdigest()
+
+    def _get_path(self, fingerprint: str) -> str:
+        return os.path.join(self.directory, fingerprint + _COMPRESSIONS[self.compression][0])
+
+    def _load(self, path: str) -> typing.List[typing.Any]:
+        with open(path, 'rb') as file:
+            fixtures: typing.List[typing.Any] = pickle.loads(_COMPRESSIONS[self.compression][2](file.read()))
+
+        os.utime(path)  # the entry is used recently
+        return fixtures
+
+    def _store(self, path: str, fixtures: typing.List[typing.Any]) -> None:
+        data: bytes = _COMPRESSIONS[self.compression][1](pickle.dumps(fixtures, protocol=pickle.HIGHEST_PROTOCOL))
+        os.makedirs(self.directory, exist_ok=True)
+        descriptor: int
+        temporary_path: str
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(data)
+
+            os.replace(temporary_path, path)  # readers never see a partial entry
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def _get_entries(self) -> typing.List[os.DirEntry]:
+        suffixes: typing.Tuple[str, ...] = tuple(suffix for suffix, _compress, _decompress in _COMPRESSIONS.values())
+        try:
+            with os.scandir(self.directory) as entries:
+                return [entry for entry in entries if entry.is_file() and entry.name.endswith(suffixes)]
+        except FileNotFoundError:
+            return []
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the directory takes no more than max_bytes"""
+        entries: typing.List[typing.Tuple[float, int, str]] = []
+        entry: os.DirEntry
+        for entry in self._get_entries():
+            stat: os.stat_result = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size: int = sum(entry_size for _mtime, entry_size, _path in entries)
+        entry_size: int
+        path: str
+        for _mtime, entry_size, path in sorted(entries):
+            if size <= self.max_bytes:
+                break
+
+            try:
+                os.unlink(path)
+            except FileNotFoundError:  # removed by an other process
+                pass
+
+            size -= entry_size
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        entry: os.DirEntry
+        for entry in self._get_entries():
+            os.unlink(entry.path)
+
+    def generate_fixtures(
+        self,
+        cls_: typing.Type,
+        generator: typing.Optional[typing.Type[DataclassFixturesGenerator]] = None,
+    ) -> typing.List[typing.Any]:
+        """
+        The cached fixtures of the model, they are generated and stored when the cache has no entry for them,
+        fixtures which can not be stored, like on a full disk, are returned all the same
+
+        generator -- the generator of the class or a configured one, chosen by the class by default,
+        generators configured with an rng are not cached, their random state can not be fingerprinted,
+        nor models and generators `fingerprint` rejects
+        """
+        if generator is None:
+            generator = _get_generator(cls_=cls_)
+
+        if 'rng' in generator._options:
+            return generator.generate_fixtures(cls_=cls_)
+
+        try:
+            path: str = self._get_path(fingerprint=self.fingerprint(cls_=cls_, generator=generator))
+        except ValueError:
+            return generator.generate_fixtures(cls_=cls_)
+
+        try:
+            return self._load(path=path)
+        except _CACHE_ERRORS:
+            pass
+
+        fixtures: typing.List[typing.Any] = generator.generate_fixtures(cls_=cls_)
+        try:
+            self._store(path=path, fixtures=fixtures)
+        except (pickle.PicklingError, AttributeError, TypeError):  # classes defined in functions are not picklable
+            return fixtures
+        except OSError:  # like a full disk or a directory which is not writable, the cache is optional
+            return fixtures
+
+        self.evict()
+        return fixtures
@@ -0,0 +1,69 @@
+import typing
+import threading
+import dataclasses
+
+__all__ = (
+    'DispatchStats',
+    'GenerationStats',
+)
+
+_Before = typing.Callable[[typing.Any, str, typing.Any], None]
+_After = typing.Callable[[typing.Any, str, typing.Any, typing.List[typing.Any], float], None]
+
+
+@dataclasses.dataclass
+class DispatchStats:
+    """Totals of the values generations of one kind of fields of one model"""
+    calls: int = 0
+    values: int = 0
+    seconds: float = 0.0
+    """cumulative, the time of a dataclass includes the time of its fields"""
+    default_factory_calls: int = 0
+
+
+class GenerationStats:
+    """
+    Collects `DispatchStats` by model and kind of fields, the kind is union, collection, dict, dataclass or scalar.
+
+    The model of a dataclass field is the dataclass itself, the model of other fields is the dataclass they belong to.
+    before(model, kind, field_info) and after(model, kind, field_info, values, seconds) are called around
+    every generation of the values of a field.
+    """
+
+    def __init__(self, before: typing.Optional[_Before] = None, after: typing.Optional[_After] = None) -> None:
+        self.before: typing.Optional[_Before] = before
+        self.after: typing.Optional[_After] = after
+        self.records: typing.Dict[typing.Tuple[typing.Any, str], DispatchStats] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(self, model: typing.Any, kind: str, values: int, seconds: float, default_factory_calls: int) -> None:
+        with self._lock:
+            stats: typing.Optional[DispatchStats] = self.records.get((model, kind))
+            if stats is None:
+                stats = self.records[(model, kind)] = DispatchStats()
+
+            stats.calls += 1
+            stats.values += values
+            stats.seconds += seconds
+            stats.default_factory_calls += default_factory_calls
+
+    def reset(self) -> None:
+        with self._lock:
+            self.records.clear()
+
+    def render(self) -> str:
+        """The records as a table, the slowest first"""
+        lines: typing.List[str] = [
+            f'{"model":<32}{"kind":<12}{"calls":>10}{"values":>12}{"seconds":>12}{"factories":>10}',
+        ]
+        model: typing.Any
+        kind: str
+        stats: DispatchStats
+        for (model, kind), stats in sorted(self.records.items(), key=lambda item: item[1].seconds, reverse=True):
+            name: str = getattr(model, '__qualname__', str(model))
+            lines.append(
+                f'{name:<32}{kind:<12}{stats.calls:>10}{stats.values:>12}{stats.seconds:>12.6f}'
+                f'{stats.default_factory_calls:>10}'
+            )
+
+        return '\n'.join(lines)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+import typing
+import dataclasses
+import attr
+import pydantic
+
+# noinspection SpellCheckingInspection
+__all__ = (
+    'PostponedDataclass',
+    'ChildDataclass',
+    'PostponedAttrs',
+    'ChildAttrs',
+    'PostponedPydantic',
+    'ChildPydantic',
+)
+
+
+@dataclasses.dataclass
+class PostponedDataclass:
+    x: int
+    flag: typing.Optional[bool]
+    child: ChildDataclass  # defined below
+    children: typing.Dict[str, typing.Optional[int]]
+
+
+@dataclasses.dataclass
+class ChildDataclass:
+    z: str
+    flag: bool
+
+
+@attr.s
+class PostponedAttrs:
+    x: int = attr.ib()
+    flag: typing.Optional[bool] = attr.ib()
+    child: ChildAttrs = attr.ib()
+
+
+@attr.s
+class ChildAttrs:
+    z: str = attr.ib()
+    flag: bool = attr.ib()
+
+
+# noinspection SpellCheckingInspection
+class PostponedPydantic(pydantic.BaseModel):
+    xxx: int
+    flag: typing.Optional[bool]
+    child: ChildPydantic
+
+
+# noinspection SpellCheckingInspection
+class ChildPydantic(pydantic.BaseModel):
+    zzz: str
+    flag: bool
@@ -12,6 +12,7 @@ __all__ = (
     'SimpleDefaultsPydantic',
     'SimpleDefaultFactoriesPydantic',
     'OptionalPydantic',
+    'ValidatedPydantic',
 )
 
 
@@ -43,3 +44,15 @@ class OptionalPydantic(pydantic.BaseModel):
     zzz: typing.List[typing.Optional[str]]
     ddd: typing.Dict[str, int]
     sss: SimplePydantic
+
+
+# noinspection SpellCheckingInspection
+class ValidatedPydantic(pydantic.BaseModel):
+    name: str
+    flag: bool
+    _secret: int = pydantic.PrivateAttr(default=7)
+
+    @pydantic.field_validator('name')
+    @classmethod
+    def upper_name(cls, value: str) -> str:
+        return value.upper()
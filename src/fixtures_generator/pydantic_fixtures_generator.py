@@ -1,8 +1,9 @@
+import sys
 import typing
 import pydantic
 import pydantic_core
 import inspect
-from .dataclass_fixtures_generator import FieldInfo, DataclassFixturesGenerator
+from .dataclass_fixtures_generator import FieldInfo, TypePlan, DataclassFixturesGenerator
 
 # noinspection SpellCheckingInspection
 __all__ = (
@@ -21,6 +22,8 @@ class IsNotPydanticError(TypeError):
 
 # noinspection SpellCheckingInspection
 class PydanticFixturesGenerator(DataclassFixturesGenerator):
+    _constructs: typing.Tuple[str, ...] = ('init', 'fast', 'batch')
+
     @classmethod
     def _validate(cls, cls_: typing.Type) -> None:
         """validate that cls_ is pydantic model"""
@@ -32,6 +35,9 @@ class PydanticFixturesGenerator(DataclassFixturesGenerator):
 
     @classmethod
     def _get_fields(cls, cls_: typing.Type) -> typing.Tuple[FieldInfo, ...]:
+        if not cls_.__pydantic_complete__:  # forward references were not resolved when the model was defined
+            cls_.model_rebuild()
+
         fields: typing.Dict[str, pydantic.fields.FieldInfo] = typing.cast(pydantic.BaseModel, cls_).model_fields
 
         field: pydantic.fields.FieldInfo
@@ -48,6 +54,69 @@ class PydanticFixturesGenerator(DataclassFixturesGenerator):
         )
         return fields_info
 
+    @classmethod
+    def _compile_constructor(
+        cls,
+        cls_: typing.Type,
+        field_names: typing.Tuple[str, ...],
+    ) -> typing.Callable[[typing.Sequence[typing.Any]], typing.Any]:
+        """
+        Generated values are trusted, so models are created without validation like `model_construct` does,
+        but attributes of the instance are assigned directly, models with private attributes, `model_post_init`
+        or extra fields allowed are created by `model_construct` itself.
+        """
+        model_construct: typing.Callable[..., typing.Any] = cls_.model_construct
+        if cls_.__pydantic_post_init__ or cls_.__private_attributes__ or cls_.model_config.get('extra') == 'allow':
+            def construct_by_model(combination: typing.Sequence[typing.Any]) -> typing.Any:
+                return model_construct(**dict(zip(field_names, combination)))
+
+            return construct_by_model
+
+        new: typing.Callable = object.__new__
+        set_attribute: typing.Callable = object.__setattr__
+        fields_set: typing.FrozenSet[str] = frozenset(field_names)
+
+        def construct(combination: typing.Sequence[typing.Any]) -> typing.Any:
+            instance: typing.Any = new(cls_)
+            set_attribute(instance, '__dict__', dict(zip(field_names, combination)))
+            set_attribute(instance, '__pydantic_fields_set__', set(fields_set))
+            set_attribute(instance, '__pydantic_extra__', None)
+            set_attribute(instance, '__pydantic_private__', None)
+            return instance
+
+        return construct
+
+    @classmethod
+    def _get_adapter(cls, cls_: typing.Type) -> pydantic.TypeAdapter:
+        """
+        Adapter validating lists of the model, its schema is built once per model.
+
+        The adapter refers to the model, so it is kept in the `__dict__` of the model and is dropped together with it.
+        """
+        adapter: typing.Optional[pydantic.TypeAdapter] = cls_.__dict__.get('__fixtures_generator_adapter__')
+        if adapter is None:
+            # typing.List caches its parameterizations, which would keep the model alive
+            list_type: typing.Any = list[cls_] if sys.version_info >= (3, 9) else typing.List[cls_]  # type: ignore
+            adapter = pydantic.TypeAdapter(list_type)
+            setattr(cls_, '__fixtures_generator_adapter__', adapter)
+
+        return adapter
+
+    @classmethod
+    def _build_instances(
+        cls,
+        plan: TypePlan,
+        combinations: typing.Iterable[typing.Sequence[typing.Any]],
+    ) -> typing.List[typing.Any]:
+        """When construct is batch, models are validated by one call of the list adapter instead of one by one"""
+        if cls._construct != 'batch':
+            return super()._build_instances(plan, combinations)
+
+        field_names: typing.Tuple[str, ...] = plan.field_names
+        return cls._get_adapter(cls_=plan.field_type).validate_python(
+            [dict(zip(field_names, combination)) for combination in combinations],
+        )
+
     @classmethod
     def _is_dataclass(cls, field_info: FieldInfo) -> bool:
         """True if field is a pydantic model """
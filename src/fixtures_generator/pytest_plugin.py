@@ -0,0 +1,89 @@
+"""
+pytest plugin parametrizing tests over fixtures of models, registered by the `pytest11` entry point
+
+    @pytest.mark.fixtures_of(Point, strategy='pairwise', limit=100, seed=1)
+    def test_point(fixture):
+        ...
+
+Only indices of fixtures are parametrized while tests are collected, a fixture is built when it is set up.
+"""
+import typing
+import pytest
+from .dataclass_fixtures_generator import FixtureSpace, DataclassFixturesGenerator
+from .combination_strategies import CombinationStrategy
+from ._common import _get_generator
+
+__all__ = (
+    'LazyFixture',
+)
+
+_MARKER: str = 'fixtures_of'
+
+
+class LazyFixture:
+    """The fixture of the space by its index, it is built by `build`"""
+
+    def __init__(self, space: FixtureSpace, index: int, seed: typing.Optional[typing.Any] = None) -> None:
+        self.space: FixtureSpace = space
+        self.index: int = index
+        self.seed: typing.Optional[typing.Any] = seed
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.space.cls_.__name__}, {self.index})'
+
+    def build(self) -> typing.Any:
+        """The fixture, with a seed it does not depend on which fixtures were built before"""
+        if self.seed is None:
+            return self.space[self.index]
+
+        return FixtureSpace(
+            generator=self.space.generator.configure(seed=f'{self.seed}:{self.index}'),
+            cls_=self.space.cls_,
+            explanation=self.space.explanation,
+            indices=self.space.indices,
+        )[self.index]
+
+
+def _get_space(
+    cls_: typing.Type,
+    generator: typing.Optional[typing.Type[DataclassFixturesGenerator]] = None,
+    strategy: typing.Optional[typing.Union[str, CombinationStrategy]] = None,
+    limit: typing.Optional[int] = None,
+) -> FixtureSpace:
+    """The space of the fixtures of the marker, no more than limit of them"""
+    if generator is None:
+        generator = _get_generator(cls_=cls_)
+
+    space: FixtureSpace = generator.space(cls_=cls_, strategy=strategy)
+    return space if limit is None else space[:limit]
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        'markers',
+        f'{_MARKER}(cls_, strategy=None, limit=None, seed=None, generator=None, argname="fixture"): '
+        'parametrize the test over the fixtures of the dataclass, attrs class or pydantic model',
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    marker: pytest.Mark
+    for marker in metafunc.definition.iter_markers(name=_MARKER):
+        options: typing.Dict[str, typing.Any] = dict(marker.kwargs)
+        argname: str = options.pop('argname', 'fixture')
+        seed: typing.Optional[typing.Any] = options.pop('seed', None)
+        space: FixtureSpace = _get_space(*marker.args, **options)
+        name: str = space.cls_.__name__
+        metafunc.parametrize(
+            argname,
+            [LazyFixture(space=space, index=index, seed=seed) for index in range(len(space))],
+            ids=[f'{name}{index}' for index in range(len(space))],
+        )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_fixture_setup(fixturedef: pytest.FixtureDef, request: pytest.FixtureRequest) -> None:
+    """Build the lazy fixture of the parameter right before it is set up, for the test and the fixtures using it"""
+    param: typing.Any = getattr(request, 'param', None)
+    if isinstance(param, LazyFixture):
+        setattr(request, 'param', param.build())
@@ -0,0 +1,178 @@
+import sys
+import uuid
+import array
+import random
+import string
+import typing
+import decimal
+import datetime
+
+__all__ = (
+    'ScalarEngine',
+)
+
+_T = typing.TypeVar('_T')
+
+_INT_RANGE: int = 10001  # integers from 0 to 10000
+_INT_LIMIT: int = 65536 - 65536 % _INT_RANGE  # greater 16-bit numbers are rejected to keep the distribution uniform
+_FLOAT_SCALE: float = 10000.0
+_STR_LENGTH: int = 5
+_LETTERS: bytes = string.ascii_letters.encode('ascii')
+_BYTE_LIMIT: int = 256 - 256 % len(_LETTERS)
+_LETTERS_TABLE: bytes = bytes(_LETTERS[byte % len(_LETTERS)] for byte in range(_BYTE_LIMIT)) + bytes(256 - _BYTE_LIMIT)
+_REJECTED_BYTES: bytes = bytes(range(_BYTE_LIMIT, 256))
+_BYTES_LENGTH: int = 8
+_UUID_LENGTH: int = 16
+_EPOCH: datetime.datetime = datetime.datetime(2000, 1, 1)
+_SECONDS_RANGE: int = int((datetime.datetime(2038, 1, 1) - _EPOCH).total_seconds())  # datetimes from 2000 to 2037
+_DECIMAL_EXPONENT: int = -2  # decimals from 0.00 to 100.00
+
+
+class ScalarEngine:
+    """
+    Random integers, strings, bytes, UUIDs, datetimes, dates and decimals from buffers refilled in bulk,
+    and random floats.
+
+    A block of values takes one `getrandbits` call of the random source, which is translated into values
+    through arrays and a lookup table, so the cost of a value is a `list.pop`.
+    """
+
+    def __init__(self, rng: random.Random, block_size: int = 4096) -> None:
+        self.rng: random.Random = rng
+        self.block_size: int = block_size
+        self._ints: typing.List[int] = []
+        self._strs: typing.List[str] = []
+        self._bytes: typing.List[bytes] = []
+        self._uuids: typing.List[uuid.UUID] = []
+        self._datetimes: typing.List[datetime.datetime] = []
+        self._dates: typing.List[datetime.date] = []
+        self._decimals: typing.List[decimal.Decimal] = []
+
+    def _random_array(self, typecode: str, count: int) -> array.array:
+        """count random numbers of the array type from one call of the random source"""
+        numbers: array.array = array.array(typecode)
+        numbers.frombytes(self.rng.getrandbits(8 * numbers.itemsize * count).to_bytes(numbers.itemsize * count, 'little'))
+        if sys.byteorder == 'big':
+            numbers.byteswap()  # the same values for the same seed on every platform
+
+        return numbers
+
+    def _draw_ints(self) -> typing.List[int]:
+        return [number % _INT_RANGE for number in self._random_array('H', self.block_size) if number < _INT_LIMIT]
+
+    def _draw_strs(self) -> typing.List[str]:
+        size: int = _STR_LENGTH * self.block_size
+        letters: str = (
+            self.rng.getrandbits(8 * size).to_bytes(size, 'little').translate(_LETTERS_TABLE, _REJECTED_BYTES)
+        ).decode('ascii')
+        return [letters[index:index + _STR_LENGTH] for index in range(0, len(letters) - _STR_LENGTH + 1, _STR_LENGTH)]
+
+    def _draw_bytes(self, length: int) -> typing.List[bytes]:
+        size: int = length * self.block_size
+        block: bytes = self.rng.getrandbits(8 * size).to_bytes(size, 'little')
+        return [block[index:index + length] for index in range(0, size, length)]
+
+    def _draw_uuids(self) -> typing.List[uuid.UUID]:
+        return [uuid.UUID(bytes=value, version=4) for value in self._draw_bytes(_UUID_LENGTH)]
+
+    def _draw_datetimes(self) -> typing.List[datetime.datetime]:
+        return [
+            _EPOCH + datetime.timedelta(seconds=number % _SECONDS_RANGE) for number in self._random_array('Q', self.block_size)
+        ]
+
+    def _draw_dates(self) -> typing.List[datetime.date]:
+        return [value.date() for value in self._draw_datetimes()]
+
+    def _draw_decimals(self) -> typing.List[decimal.Decimal]:
+        return [decimal.Decimal(number).scaleb(_DECIMAL_EXPONENT) for number in self._draw_ints()]
+
+    @staticmethod
+    def _next(buffer: typing.List[_T], draw: typing.Callable[[], typing.List[_T]]) -> _T:
+        while True:
+            try:
+                return buffer.pop()
+            except IndexError:
+                buffer.extend(draw())
+
+    @staticmethod
+    def _take(buffer: typing.List[_T], draw: typing.Callable[[], typing.List[_T]], count: int) -> typing.List[_T]:
+        """count values of the buffer by one slice, the buffer is refilled by whole blocks"""
+        while len(buffer) < count:
+            buffer.extend(draw())
+
+        values: typing.List[_T] = buffer[len(buffer) - count:]
+        del buffer[len(buffer) - count:]
+        return values
+
+    def next_int(self) -> int:
+        """Random integer from 0 to 10000"""
+        while True:
+            try:
+                return self._ints.pop()
+            except IndexError:  # the buffer is empty
+                self._ints.extend(self._draw_ints())
+
+    def next_float(self) -> float:
+        """Random float from 0.0 to 10000.0, `random()` is a single C call, so floats are not buffered"""
+        return self.rng.random() * _FLOAT_SCALE
+
+    def next_str(self) -> str:
+        """Random string of 5 ascii letters"""
+        while True:
+            try:
+                return self._strs.pop()
+            except IndexError:
+                self._strs.extend(self._draw_strs())
+
+    def next_bytes(self) -> bytes:
+        """Random 8 bytes"""
+        return self._next(self._bytes, lambda: self._draw_bytes(_BYTES_LENGTH))
+
+    def next_uuid(self) -> uuid.UUID:
+        """Random UUID of version 4"""
+        return self._next(self._uuids, self._draw_uuids)
+
+    def next_datetime(self) -> datetime.datetime:
+        """Random naive datetime from 2000 to 2037 with whole seconds"""
+        return self._next(self._datetimes, self._draw_datetimes)
+
+    def next_date(self) -> datetime.date:
+        """Random date from 2000 to 2037"""
+        return self._next(self._dates, self._draw_dates)
+
+    def next_decimal(self) -> decimal.Decimal:
+        """Random decimal from 0.00 to 100.00 with 2 digits after the point"""
+        return self._next(self._decimals, self._draw_decimals)
+
+    def take_ints(self, count: int) -> typing.List[int]:
+        """count random integers like `next_int` returns"""
+        return self._take(self._ints, self._draw_ints, count)
+
+    def take_floats(self, count: int) -> typing.List[float]:
+        """count random floats like `next_float` returns"""
+        random_: typing.Callable[[], float] = self.rng.random
+        return [random_() * _FLOAT_SCALE for _index in range(count)]
+
+    def take_strs(self, count: int) -> typing.List[str]:
+        """count random strings like `next_str` returns"""
+        return self._take(self._strs, self._draw_strs, count)
+
+    def take_bytes(self, count: int) -> typing.List[bytes]:
+        """count random bytes like `next_bytes` returns"""
+        return self._take(self._bytes, lambda: self._draw_bytes(_BYTES_LENGTH), count)
+
+    def take_uuids(self, count: int) -> typing.List[uuid.UUID]:
+        """count random UUIDs like `next_uuid` returns"""
+        return self._take(self._uuids, self._draw_uuids, count)
+
+    def take_datetimes(self, count: int) -> typing.List[datetime.datetime]:
+        """count random datetimes like `next_datetime` returns"""
+        return self._take(self._datetimes, self._draw_datetimes, count)
+
+    def take_dates(self, count: int) -> typing.List[datetime.date]:
+        """count random dates like `next_date` returns"""
+        return self._take(self._dates, self._draw_dates, count)
+
+    def take_decimals(self, count: int) -> typing.List[decimal.Decimal]:
+        """count random decimals like `next_decimal` returns"""
+        return self._take(self._decimals, self._draw_decimals, count)
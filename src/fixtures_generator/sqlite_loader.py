@@ -0,0 +1,194 @@
+import enum
+import json
+import typing
+import sqlite3
+import inspect
+import operator
+import itertools
+from .dataclass_fixtures_generator import FieldInfo, FieldKind, TypePlan, DataclassFixturesGenerator
+from ._common import _Path, _get_generator, _get_column_fields, _to_data, _iter_batches
+
+__all__ = (
+    'load_into_sqlite',
+)
+
+_AFFINITIES: typing.Tuple[typing.Tuple[type, str], ...] = (
+    (bool, 'INTEGER'),
+    (int, 'INTEGER'),
+    (float, 'REAL'),
+    (str, 'TEXT'),
+    (bytes, 'BLOB'),
+)
+_SQLITE_TYPES: typing.Tuple[type, ...] = (int, float, str, bytes)
+_SAVEPOINT: str = 'load_into_sqlite'
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _member_info(field_info: FieldInfo, type_: typing.Any) -> FieldInfo:
+    """Field info of a union member"""
+    return FieldInfo(field_name=field_info.field_name, field_type=type_, default_value=None, default_factory=None)
+
+
+def _get_type_affinity(type_: typing.Any) -> str:
+    """SQLite type of values of the class, decimals, UUIDs, datetimes and other values are stored as their strings"""
+    if inspect.isclass(type_):
+        base: type
+        affinity: str
+        for base, affinity in _AFFINITIES:
+            if issubclass(type_, base):
+                return affinity
+
+    return 'TEXT'
+
+
+def _get_affinity(generator: typing.Type[DataclassFixturesGenerator], field_info: FieldInfo) -> str:
+    """SQLite type of the column of the field, nested structures are JSON encoded as TEXT"""
+    plan: TypePlan
+    plan, field_info = generator._resolve_plan(field_info=field_info)
+    if plan.kind is FieldKind.UNION:
+        affinities: typing.Set[str] = {
+            _get_affinity(
+                generator=generator,
+                field_info=_member_info(field_info=field_info, type_=type_),
+            )
+            for type_ in plan.args if type_ is not type(None)
+        }
+        return affinities.pop() if len(affinities) == 1 else ''  # a column without a type keeps values of any types
+
+    if plan.kind is not FieldKind.SCALAR:
+        return 'TEXT'
+
+    if plan.enum_members:
+        return _get_type_affinity(type_=type(plan.enum_members[0].value))
+
+    return _get_type_affinity(type_=plan.field_type)
+
+
+def _to_sql(generator: typing.Type[DataclassFixturesGenerator], value: typing.Any) -> typing.Any:
+    """SQLite value of the fixture value, nested structures are JSON encoded"""
+    if value is None or (isinstance(value, _SQLITE_TYPES) and not isinstance(value, enum.Enum)):
+        return value
+
+    data: typing.Any = _to_data(generator, value)
+    if isinstance(data, (dict, list)):
+        return json.dumps(data, default=str)
+
+    if data is None or isinstance(data, _SQLITE_TYPES):
+        return data
+
+    return str(data)
+
+
+def _is_sqlite_value(generator: typing.Type[DataclassFixturesGenerator], field_info: FieldInfo) -> bool:
+    """True if values of the field are stored by SQLite as they are"""
+    plan: TypePlan
+    plan, field_info = generator._resolve_plan(field_info=field_info)
+    if plan.kind is FieldKind.UNION:
+        return all(
+            _is_sqlite_value(
+                generator=generator,
+                field_info=_member_info(field_info=field_info, type_=type_),
+            )
+            for type_ in plan.args if type_ is not type(None)
+        )
+
+    return (
+        plan.kind is FieldKind.SCALAR
+        and inspect.isclass(plan.field_type)
+        and issubclass(plan.field_type, _SQLITE_TYPES)
+        and not issubclass(plan.field_type, enum.Enum)
+    )
+
+
+def _get_row_factory(
+    generator: typing.Type[DataclassFixturesGenerator],
+    columns: typing.Sequence[typing.Tuple[_Path, FieldInfo]],
+) -> typing.Callable[[typing.Any], typing.Sequence[typing.Any]]:
+    """Values of the columns of a fixture, values SQLite does not store as they are are converted by `_to_sql`"""
+    get_values: typing.Callable[[typing.Any], typing.Any] = operator.attrgetter(*('.'.join(path) for path, _field in columns))
+    converted: typing.List[int] = [
+        position for position, (_path, field) in enumerate(columns)
+        if not _is_sqlite_value(generator=generator, field_info=field)
+    ]
+    if len(columns) == 1:
+        get_value: typing.Callable[[typing.Any], typing.Any] = get_values
+        get_values = lambda fixture: (get_value(fixture),)  # noqa: E731
+
+    if not converted:
+        return get_values
+
+    def get_row(fixture: typing.Any) -> typing.List[typing.Any]:
+        row: typing.List[typing.Any] = list(get_values(fixture))
+        position: int
+        for position in converted:
+            row[position] = _to_sql(generator, row[position])
+
+        return row
+
+    return get_row
+
+
+def load_into_sqlite(
+    conn: sqlite3.Connection,
+    cls_: typing.Type,
+    table: typing.Optional[str] = None,
+    generator: typing.Optional[typing.Type[DataclassFixturesGenerator]] = None,
+    limit: typing.Optional[int] = None,
+    batch_size: int = 10000,
+) -> int:
+    """
+    Insert the fixtures of the dataclass, attrs class or pydantic model into the table, the number of rows is returned
+
+    The table is named as the class by default, it is created if it does not exist with a column per field,
+    fields of nested dataclasses are flattened to dotted columns like `s.x`, collections are JSON encoded.
+    Fixtures are streamed by `iter_fixtures` and inserted by one `executemany` per batch in a single transaction,
+    which is committed. When the connection is in a transaction already, the rows are inserted in a savepoint of it,
+    which is rolled back on errors, and committing the transaction is left to the caller.
+
+    generator -- the generator of the class or a configured one, chosen by the class by default
+    limit -- the maximal number of fixtures
+    """
+    if batch_size < 1:
+        raise ValueError(f'batch_size=={batch_size} must be positive')
+
+    if generator is None:
+        generator = _get_generator(cls_=cls_)
+
+    columns: typing.List[typing.Tuple[_Path, FieldInfo]] = _get_column_fields(generator=generator, cls_=cls_)
+    names: str = ', '.join(
+        f'{_quote(".".join(path))} {_get_affinity(generator=generator, field_info=field)}'.rstrip()
+        for path, field in columns
+    )
+    quoted_table: str = _quote(table or cls_.__name__)
+    insert: str = (
+        f'INSERT INTO {quoted_table} ({", ".join(_quote(".".join(path)) for path, _field in columns)}) '
+        f'VALUES ({", ".join("?" for _column in columns)})'
+    )
+    get_row: typing.Callable[[typing.Any], typing.Sequence[typing.Any]] = _get_row_factory(
+        generator=generator, columns=columns,
+    )
+
+    fixtures: typing.Iterable[typing.Any] = generator.iter_fixtures(cls_=cls_)
+    if limit is not None:
+        fixtures = itertools.islice(fixtures, limit)
+
+    # outside of a transaction the savepoint begins one and its release commits it, a transaction of the caller
+    # is neither committed nor rolled back here
+    conn.execute(f'SAVEPOINT {_SAVEPOINT}')
+    count: int = 0
+    try:
+        conn.execute(f'CREATE TABLE IF NOT EXISTS {quoted_table} ({names})')
+        batch: typing.Tuple[typing.Any, ...]
+        for batch in _iter_batches(fixtures=fixtures, batch_size=batch_size):
+            conn.executemany(insert, map(get_row, batch))
+            count += len(batch)
+    except BaseException:
+        conn.execute(f'ROLLBACK TO {_SAVEPOINT}')
+        raise
+    finally:
+        conn.execute(f'RELEASE {_SAVEPOINT}')
+
+    return count
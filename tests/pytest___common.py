@@ -0,0 +1,35 @@
+import pytest
+import fixtures_generator._common as tm
+from fixtures_generator.dataclass_fixtures_generator import DataclassFixturesGenerator
+from fixtures_generator.attrs_fixtures_generator import AttrsFixturesGenerator
+from fixtures_generator.pydantic_fixtures_generator import PydanticFixturesGenerator
+from fixtures_generator.dataclass_fixtures import OptionalDataclass, SubtypesDataclass, TreeDataclass, SimpleDataclass, XID
+from fixtures_generator.attrs_fixtures import OptionalAttrs
+from fixtures_generator.pydantic_fixtures import OptionalPydantic
+
+
+class TestCommon:
+    def test_get_generator(self):
+        assert tm._get_generator(OptionalDataclass) is DataclassFixturesGenerator
+        assert tm._get_generator(OptionalAttrs) is AttrsFixturesGenerator
+        assert tm._get_generator(OptionalPydantic) is PydanticFixturesGenerator
+
+        with pytest.raises(TypeError):
+            tm._get_generator(XID)
+
+    def test_to_data(self):
+        fixture = DataclassFixturesGenerator.generate_fixtures(cls_=SubtypesDataclass)[0]
+        data = tm._to_data(DataclassFixturesGenerator, fixture)
+        assert data['one_two'] == fixture.one_two.value
+        assert data['simple'] == {'x': fixture.simple.x, 'y': fixture.simple.y, 'z': fixture.simple.z}
+        assert tm._to_data(DataclassFixturesGenerator, {'a': (1, {2})}) == {'a': [1, [2]]}
+        assert tm._to_data(PydanticFixturesGenerator, SimpleDataclass(x=1, y=1.5, z='a')) == {'x': 1, 'y': 1.5, 'z': 'a'}
+
+    def test_get_column_fields(self):
+        columns = tm._get_column_fields(DataclassFixturesGenerator, TreeDataclass)
+        assert [(path, field.field_name) for path, field in columns] == [
+            (('leaf',), 'leaf'), (('parent',), 'parent'), (('children',), 'children'),
+        ]
+
+    def test_iter_batches(self):
+        assert list(tm._iter_batches(range(5), batch_size=2)) == [(0, 1), (2, 3), (4,)]
@@ -7,11 +7,13 @@ from fixtures_generator.factory_fixtures import (
     float_factory,
     str_factory,
 )
+from fixtures_generator.postponed_fixtures import PostponedAttrs, ChildAttrs
 from fixtures_generator.attrs_fixtures import (
     SimpleAttrs,
     SimpleDefaultsAttrs,
     SimpleDefaultFactoriesAttrs,
     OptionalAttrs,
+    FrozenSlotsAttrs,
 )
 
 
@@ -95,3 +97,36 @@ class TestAttrsFixturesGenerator:
 
         result = tm.AttrsFixturesGenerator.generate_fixtures(cls_=SimpleDefaultFactoriesAttrs)
         assert result == [SimpleDefaultFactoriesAttrs()]
+
+    @patch.object(
+        tm.DataclassFixturesGenerator, tm.DataclassFixturesGenerator._generate_int.__name__, Mock(return_value=33)
+    )
+    @patch.object(
+        tm.DataclassFixturesGenerator, tm.DataclassFixturesGenerator._generate_float.__name__, Mock(return_value=.3)
+    )
+    @patch.object(
+        tm.DataclassFixturesGenerator, tm.DataclassFixturesGenerator._generate_str.__name__, Mock(return_value='x')
+    )
+    def test_iter_fixtures(self):
+        result = tm.AttrsFixturesGenerator.iter_fixtures(cls_=OptionalAttrs)
+        assert list(result) == tm.AttrsFixturesGenerator.generate_fixtures(cls_=OptionalAttrs)
+
+    def test__get_non_init_fields(self):
+        non_init_fields = dict(tm.AttrsFixturesGenerator._get_non_init_fields(FrozenSlotsAttrs))
+        assert list(non_init_fields) == ['doubled', 'tags']
+        assert non_init_fields['doubled'](FrozenSlotsAttrs(x=2, flag=True)) == 4
+        assert non_init_fields['tags'](None) == []
+
+    def test_generate_fixtures__construct(self):
+        assert [f.field_name for f in tm.AttrsFixturesGenerator._get_fields(FrozenSlotsAttrs)] == ['x', 'flag']
+        generator = tm.AttrsFixturesGenerator.configure(construct='fast', seed=1)
+        result = generator.generate_fixtures(cls_=FrozenSlotsAttrs)
+        assert result == tm.AttrsFixturesGenerator.configure(seed=1).generate_fixtures(cls_=FrozenSlotsAttrs)
+        assert result[0].doubled == result[0].x * 2
+
+    def test_generate_fixtures__postponed(self):
+        assert tm.AttrsFixturesGenerator._get_fields(PostponedAttrs)[2].field_type is ChildAttrs
+        result = tm.AttrsFixturesGenerator.generate_fixtures(cls_=PostponedAttrs)
+        assert [(r.flag, r.child.flag) for r in result] == [
+            (True, True), (True, False), (False, True), (False, False), (None, True), (None, False),
+        ]
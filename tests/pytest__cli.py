@@ -0,0 +1,60 @@
+import csv
+import json
+import pytest
+import fixtures_generator.cli as tm
+from fixtures_generator._common import _to_data
+from fixtures_generator.dataclass_fixtures_generator import DataclassFixturesGenerator
+from fixtures_generator.dataclass_fixtures import OptionalDataclass, TreeDataclass
+
+
+class TestCli:
+    def test_load_target(self):
+        assert tm._load_target('fixtures_generator.dataclass_fixtures:OptionalDataclass') is OptionalDataclass
+
+        with pytest.raises(ValueError):
+            tm._load_target('fixtures_generator.dataclass_fixtures')
+
+        with pytest.raises(AttributeError):
+            tm._load_target('fixtures_generator.dataclass_fixtures:Foo')
+
+    def test_get_columns(self):
+        assert tm._get_columns(DataclassFixturesGenerator, OptionalDataclass) == [
+            ('x',), ('y',), ('z',), ('d',), ('s', 'x'), ('s', 'y'), ('s', 'z'),
+        ]
+        assert tm._get_columns(DataclassFixturesGenerator, TreeDataclass) == [('leaf',), ('parent',), ('children',)]
+
+    def test_main__jsonl(self, capsys):
+        assert tm.main(['fixtures_generator.dataclass_fixtures:OptionalDataclass', '--seed', '1']) == 0
+        captured = capsys.readouterr()
+        rows = [json.loads(line) for line in captured.out.splitlines()]
+        fixtures = DataclassFixturesGenerator.configure(seed=1).iter_fixtures(cls_=OptionalDataclass)
+        assert rows == [_to_data(DataclassFixturesGenerator, f) for f in fixtures]
+        assert captured.err.startswith('4 fixtures of OptionalDataclass in ')
+
+    def test_main__seed(self, capsys):
+        assert tm._parse_seed('7') == 7
+        assert tm._parse_seed('fixtures') == 'fixtures'
+
+        assert tm.main(['fixtures_generator.dataclass_fixtures:OptionalDataclass', '--seed', 'fixtures']) == 0
+        rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        fixtures = DataclassFixturesGenerator.configure(seed='fixtures').iter_fixtures(cls_=OptionalDataclass)
+        assert rows == [_to_data(DataclassFixturesGenerator, f) for f in fixtures]
+
+    def test_main__csv(self, tmp_path, capsys):
+        path = tmp_path / 'fixtures.csv'
+        assert tm.main([
+            'fixtures_generator.attrs_fixtures:OptionalAttrs', '-f', 'csv', '-o', str(path), '-n', '3',
+        ]) == 0
+        with open(path, newline='') as file:
+            rows = list(csv.reader(file))
+
+        assert rows[0] == ['x', 'y', 'z', 'd', 's.xx', 's.yy', 's.zz']
+        assert len(rows) == 4
+        assert rows[3][1] == ''  # None
+        assert capsys.readouterr().out == ''
+
+    def test_main__error(self, capsys):
+        with pytest.raises(SystemExit):
+            tm.main(['fixtures_generator.dataclass_fixtures:XID'])
+
+        assert 'is not a dataclass' in capsys.readouterr().err
@@ -0,0 +1,120 @@
+import itertools
+import pytest
+from unittest.mock import patch
+import fixtures_generator.combination_strategies as tm
+
+
+def assert_covers(rows, sizes, strength):
+    for columns in itertools.combinations(range(len(sizes)), strength):
+        covered = {tuple(row[c] for c in columns) for row in rows}
+        assert covered == set(itertools.product(*(range(sizes[c]) for c in columns))), columns
+
+
+class TestProductStrategy:
+    def test_indices(self):
+        assert list(tm.ProductStrategy().indices([2, 1, 3])) == list(itertools.product(range(2), range(1), range(3)))
+        assert list(tm.ProductStrategy().indices([])) == [()]
+
+    def test_combinations(self):
+        assert list(tm.ProductStrategy().combinations([[1, 2], 'ab'])) == [(1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')]
+
+
+class TestEachChoiceStrategy:
+    def test_indices(self):
+        assert list(tm.EachChoiceStrategy().indices([2, 1, 3])) == [(0, 0, 0), (1, 0, 1), (0, 0, 2)]
+        assert list(tm.EachChoiceStrategy().indices([2, 0])) == []
+        assert list(tm.EachChoiceStrategy().indices([])) == [()]
+
+    def test_combinations(self):
+        assert list(tm.EachChoiceStrategy().combinations([[1, 2], 'abc'])) == [(1, 'a'), (2, 'b'), (1, 'c')]
+
+
+class TestTWiseStrategy:
+    def test_init(self):
+        assert tm.TWiseStrategy(strength=3).strength == 3
+        assert repr(tm.TWiseStrategy(strength=3)) == 'TWiseStrategy(strength=3)'
+
+        with pytest.raises(ValueError):
+            tm.TWiseStrategy(strength=0)
+
+    def test_indices(self):
+        assert list(tm.TWiseStrategy(strength=2).indices([2, 3])) == list(itertools.product(range(2), range(3)))
+        assert list(tm.TWiseStrategy(strength=2).indices([2, 0, 3])) == []
+
+        for strength, sizes in [
+            (1, [2, 3, 1, 4]),
+            (2, [2] * 30),
+            (2, [3, 2, 4, 1, 3, 2, 2]),
+            (3, [2] * 10),
+            (3, [3, 2, 3, 2, 2]),
+            (3, [3, 3, 3, 3]),  # pairs covered by rows added for other pairs are skipped
+        ]:
+            rows = list(tm.TWiseStrategy(strength=strength).indices(sizes))
+            assert all(len(row) == len(sizes) for row in rows)
+            assert_covers(rows=rows, sizes=sizes, strength=strength)
+
+        assert len(list(tm.TWiseStrategy(strength=2).indices([2] * 30))) < 20  # instead of 2 ** 30
+
+    def test_pairwise(self):
+        assert tm.PairwiseStrategy().strength == 2
+        assert repr(tm.PairwiseStrategy()) == 'PairwiseStrategy()'
+
+
+class TestGetStrategy:
+    def test_get_strategy(self):
+        assert isinstance(tm.get_strategy('product'), tm.ProductStrategy)
+        assert isinstance(tm.get_strategy('each_choice'), tm.EachChoiceStrategy)
+        assert isinstance(tm.get_strategy('pairwise'), tm.PairwiseStrategy)
+
+        strategy = tm.TWiseStrategy(strength=3)
+        assert tm.get_strategy(strategy) is strategy
+
+        with pytest.raises(tm.UnknownStrategyError):
+            tm.get_strategy('foo')
+
+
+class DiagonalStrategy(tm.CombinationStrategy):
+    """Only the rows every index of which is the same, it relies on the default count and row"""
+
+    def indices(self, sizes):
+        return ((index,) * len(sizes) for index in range(min(sizes, default=1)))
+
+
+class TestCount:
+    def test_count__default(self):
+        strategy = DiagonalStrategy()
+        assert strategy.count([3, 2, 4]) == 2
+        assert strategy.count([3, 0]) == 0
+        assert [strategy.row([3, 2, 4], index) for index in range(2)] == [(0, 0, 0), (1, 1, 1)]
+
+        with pytest.raises(IndexError):
+            strategy.row([3, 2, 4], 2)
+
+        with pytest.raises(IndexError):
+            strategy.row([3, 2, 4], -1)
+
+    def test_count(self):
+        for strategy in [tm.ProductStrategy(), tm.EachChoiceStrategy(), tm.PairwiseStrategy()]:
+            for sizes in [[2, 3, 1], [2, 0, 1], [], [3, 2, 2, 2]]:
+                assert strategy.count(sizes) == len(list(strategy.indices(sizes)))
+
+    def test_row(self):
+        for strategy in [tm.ProductStrategy(), tm.EachChoiceStrategy(), tm.PairwiseStrategy()]:
+            sizes = [3, 2, 2, 3]
+            rows = list(strategy.indices(sizes))
+            assert [strategy.row(sizes, index) for index in range(len(rows))] == rows
+
+            with pytest.raises(IndexError):
+                strategy.row(sizes, len(rows))
+
+            with pytest.raises(IndexError):
+                strategy.row(sizes, -1)
+
+    def test_row__t_wise_rows_are_built_once(self):
+        sizes = [3, 2, 2, 3, 2]
+        with patch.object(tm.TWiseStrategy, tm.TWiseStrategy._build_rows.__name__, wraps=tm.TWiseStrategy(2)._build_rows) as m:
+            tm._get_t_wise_rows.cache_clear()
+            rows = list(tm.PairwiseStrategy().indices(sizes))
+            assert [tm.PairwiseStrategy().row(sizes, index) for index in range(len(rows))] == rows
+            assert tm.TWiseStrategy(strength=2).count(sizes) == len(rows)
+            assert m.call_count == 1
@@ -1,6 +1,21 @@
 import typing
 import pytest
 import dataclasses
+import itertools
+import functools
+import array
+import random
+import threading
+import sys
+import gc
+import weakref
+import decimal
+import fractions
+import datetime
+import uuid
+import asyncio
+import concurrent.futures
+import collections
 import fixtures_generator.dataclass_fixtures_generator as tm
 from fixtures_generator.factory_fixtures import (
     int_factory,
@@ -18,7 +33,16 @@ from fixtures_generator.dataclass_fixtures import (
     OneTwo,
     SubtypesDataclass,
     FirstSecond,
+    FlagsDataclass,
+    WideDataclass,
+    FrozenDataclass,
+    FrozenHolderDataclass,
+    SlotsDataclass,
+    PostInitDataclass,
+    TreeDataclass,
 )
+from fixtures_generator.postponed_fixtures import PostponedDataclass, ChildDataclass
+from fixtures_generator.combination_strategies import EachChoiceStrategy, PairwiseStrategy, UnknownStrategyError
 from unittest.mock import patch, Mock
 from one_patch import Op
 
@@ -349,19 +373,7 @@ class TestDataclassFixturesGenerator:
             )
 
     def test__generate_scalar_values(self):
-        with Op(tm.DataclassFixturesGenerator._generate_scalar_values, exclude_set={'enum'}) as op:
-            op.args.field_info.field_type = bool
-            assert op.c(*op.args) == op.args.cls._generate_bool_s.return_value
-
-            op.args.field_info.field_type = int
-            assert op.c(*op.args) == [op.args.cls._generate_int.return_value]
-
-            op.args.field_info.field_type = float
-            assert op.c(*op.args) == [op.args.cls._generate_float.return_value]
-
-            op.args.field_info.field_type = str
-            assert op.c(*op.args) == [op.args.cls._generate_str.return_value]
-
+        with Op(tm.DataclassFixturesGenerator._generate_scalar_values) as op:
             op.args.field_info.field_type = ...
             op.args.field_info.default_value = ...
             assert op.c(*op.args) == [...]
@@ -603,3 +615,957 @@ class TestDataclassFixturesGenerator:
         result = tm.DataclassFixturesGenerator.generate_fixtures(cls_=SimpleDefaultFactoriesDataclass)
         assert result == [SimpleDefaultFactoriesDataclass()]
 
+    def test__lazy_product(self):
+        sources = [[1, 2].__iter__, lambda: iter('ab'), [None].__iter__]
+        assert list(tm._lazy_product(sources)) == list(itertools.product([1, 2], 'ab', [None]))
+        assert list(tm._lazy_product([])) == [()]
+        assert list(tm._lazy_product([[1].__iter__, [].__iter__])) == []
+
+    def test__is_lazy(self):
+        assert tm.DataclassFixturesGenerator._is_lazy(
+            tm.FieldInfo(field_name='f', field_type=SimpleDataclass, default_value=None, default_factory=None)
+        ) is True
+        assert tm.DataclassFixturesGenerator._is_lazy(
+            tm.FieldInfo(
+                field_name='f',
+                field_type=typing.Optional[SimpleDataclass],
+                default_value=None,
+                default_factory=None,
+            )
+        ) is True
+        assert tm.DataclassFixturesGenerator._is_lazy(
+            tm.FieldInfo(field_name='f', field_type=typing.Optional[int], default_value=None, default_factory=None)
+        ) is False
+        assert tm.DataclassFixturesGenerator._is_lazy(
+            tm.FieldInfo(field_name='f', field_type=YID, default_value=None, default_factory=None)
+        ) is False
+
+    @patch.object(
+        tm.DataclassFixturesGenerator, tm.DataclassFixturesGenerator._generate_int.__name__, Mock(return_value=33)
+    )
+    @patch.object(
+        tm.DataclassFixturesGenerator, tm.DataclassFixturesGenerator._generate_float.__name__, Mock(return_value=.3)
+    )
+    @patch.object(
+        tm.DataclassFixturesGenerator, tm.DataclassFixturesGenerator._generate_str.__name__, Mock(return_value='x')
+    )
+    def test_iter_fixtures(self):
+        result = tm.DataclassFixturesGenerator.iter_fixtures(cls_=OptionalDataclass)
+        assert not isinstance(result, list)
+        assert list(result) == tm.DataclassFixturesGenerator.generate_fixtures(cls_=OptionalDataclass)
+
+        with pytest.raises(tm.IsNotDataclassError):
+            tm.DataclassFixturesGenerator.iter_fixtures(cls_=NotDataclass)
+
+    def test_iter_fixtures__lazy(self):
+        with patch.object(
+            tm.DataclassFixturesGenerator,
+            tm.DataclassFixturesGenerator._build_instance.__name__,
+            side_effect=lambda plan, combination: combination,
+        ) as m_build_instance:
+            result = tm.DataclassFixturesGenerator.iter_fixtures(cls_=OptionalDataclass)
+            assert m_build_instance.call_count == 0
+            next(result)
+            assert m_build_instance.call_count == 2  # the first nested SimpleDataclass and the first OptionalDataclass
+
+    def test_iter_fixtures__defaults(self):
+        result = tm.DataclassFixturesGenerator.iter_fixtures(cls_=SimpleDefaultsDataclass)
+        assert list(result) == [SimpleDefaultsDataclass()]
+
+        field_info = tm.FieldInfo(
+            field_name='fn',
+            field_type=SimpleDataclass,
+            default_value=None,
+            default_factory=lambda: SimpleDataclass(x=1, y=1.1, z='_z'),
+        )
+        assert list(tm.DataclassFixturesGenerator._iter_values(field_info=field_info)) == [
+            SimpleDataclass(x=1, y=1.1, z='_z'),
+        ]
+        field_info = dataclasses.replace(field_info, default_value=SimpleDataclass(x=2, y=2.2, z='_z'))
+        assert list(tm.DataclassFixturesGenerator._iter_values(field_info=field_info)) == [
+            SimpleDataclass(x=2, y=2.2, z='_z'),
+        ]
+
+    def test__compile_plan(self):
+        def plan(field_type):
+            return tm.DataclassFixturesGenerator._compile_plan(
+                tm.FieldInfo(field_name='f', field_type=field_type, default_value=None, default_factory=None)
+            )
+
+        assert plan(YID) == tm.TypePlan(field_type=float, kind=tm.FieldKind.SCALAR)
+        assert plan(OneTwo) == tm.TypePlan(
+            field_type=OneTwo, kind=tm.FieldKind.SCALAR, enum_members=(OneTwo.ONE, OneTwo.TWO),
+        )
+        assert plan(typing.Union[None, int, str]) == tm.TypePlan(
+            field_type=typing.Union[None, int, str], kind=tm.FieldKind.UNION, args=(str, int, type(None)),
+        )
+        assert plan(typing.Optional[SimpleDataclass]).lazy is True
+        assert plan(typing.Tuple[int, float]) == tm.TypePlan(
+            field_type=typing.Tuple[int, float], kind=tm.FieldKind.COLLECTION, args=(int, float), origin=tuple,
+        )
+        assert plan(typing.Dict[str, int]) == tm.TypePlan(
+            field_type=typing.Dict[str, int], kind=tm.FieldKind.DICT, args=(str, int),
+        )
+        assert plan(SimpleDataclass) == tm.TypePlan(
+            field_type=SimpleDataclass,
+            kind=tm.FieldKind.DATACLASS,
+            fields=tm.DataclassFixturesGenerator._get_fields(SimpleDataclass),
+            field_names=('x', 'y', 'z'),
+            lazy=True,
+        )
+
+        with pytest.raises(tm.FieldTypeIsNoneError):
+            plan(None)
+
+    def test__get_plan(self):
+        class Generator(tm.DataclassFixturesGenerator):
+            pass
+
+        field_info = tm.FieldInfo(field_name='f', field_type=OptionalDataclass, default_value=None, default_factory=None)
+        plan = Generator._get_plan(field_info=field_info)
+        assert Generator._get_plan(field_info=field_info) is plan
+        assert Generator._get_plans() is not tm.DataclassFixturesGenerator._get_plans()
+
+        field_info = dataclasses.replace(field_info, field_type=...)
+        assert Generator._get_plan(field_info=field_info) == tm.TypePlan(field_type=..., kind=tm.FieldKind.SCALAR)
+
+        with patch.object(Generator, Generator._get_fields.__name__, wraps=Generator._get_fields) as m_get_fields:
+            Generator.generate_fixtures(cls_=SubtypesDataclass)
+            Generator.generate_fixtures(cls_=SubtypesDataclass)
+            assert m_get_fields.call_count == 2  # SubtypesDataclass and nested SimpleDataclass, only once
+
+    def test__get_plan__collected(self):
+        def make_model():
+            @dataclasses.dataclass
+            class Child:
+                flag: bool
+
+            @dataclasses.dataclass
+            class Model:
+                x: int
+                child: Child
+                children: typing.Tuple[Child, ...]
+
+            return Model
+
+        generator = tm.DataclassFixturesGenerator.configure(construct='fast')
+        for generator in (tm.DataclassFixturesGenerator, generator):
+            model = make_model()
+            assert len(generator.generate_fixtures(cls_=model)) == 4
+            assert generator._get_plans().get(model) is not None
+            reference = weakref.ref(model)
+            del model
+            gc.collect()
+            assert reference() is None
+
+        model = make_model()
+        plan = tm.DataclassFixturesGenerator._get_plan(
+            field_info=tm.FieldInfo(field_name='f', field_type=model, default_value=None, default_factory=None),
+        )
+        assert tm.DataclassFixturesGenerator._get_plans().get(model) is plan
+        tm.DataclassFixturesGenerator._get_plans().clear()
+        assert tm.DataclassFixturesGenerator._get_plans().get(model) is None
+
+        plans = tm._Plans()
+        with patch.object(tm._Plans, '_max_size', 2):
+            for type_ in (typing.List[int], typing.List[str], typing.List[bool]):
+                plans.set(type_, tm.TypePlan(field_type=type_, kind=tm.FieldKind.COLLECTION))
+
+        assert [plans.get(type_) is None for type_ in (typing.List[int], typing.List[str], typing.List[bool])] == [
+            True, False, False,
+        ]
+
+    def test_configure(self):
+        generator = tm.DataclassFixturesGenerator.configure(strategy='pairwise')
+        assert issubclass(generator, tm.DataclassFixturesGenerator)
+        assert generator is not tm.DataclassFixturesGenerator
+        assert isinstance(generator._strategy, PairwiseStrategy)
+        assert generator._get_plans() is tm.DataclassFixturesGenerator._get_plans()
+        assert isinstance(tm.DataclassFixturesGenerator._strategy, tm.ProductStrategy)
+
+        assert generator.configure()._strategy is generator._strategy
+
+        with pytest.raises(UnknownStrategyError):
+            tm.DataclassFixturesGenerator.configure(strategy='foo')
+
+    def test_generate_fixtures__strategy(self):
+        assert len(tm.DataclassFixturesGenerator.generate_fixtures(cls_=FlagsDataclass)) == 2 ** 5 * 3
+
+        result = tm.DataclassFixturesGenerator.generate_fixtures(cls_=FlagsDataclass, strategy='each_choice')
+        assert len(result) == 3
+        assert {r.f for r in result} == {True, False, None}
+
+        result = tm.DataclassFixturesGenerator.generate_fixtures(cls_=FlagsDataclass, strategy=PairwiseStrategy())
+        assert len(result) < 2 ** 5 * 3
+        field_names = [f.name for f in dataclasses.fields(FlagsDataclass)]
+        for first, second in itertools.combinations(field_names, 2):
+            assert {(getattr(r, first), getattr(r, second)) for r in result} == set(itertools.product(
+                [True, False, None] if first == 'f' else [True, False],
+                [True, False, None] if second == 'f' else [True, False],
+            ))
+
+        generator = tm.DataclassFixturesGenerator.configure(strategy=EachChoiceStrategy())
+        assert len(generator.generate_fixtures(cls_=FlagsDataclass)) == 3
+        assert list(generator.iter_fixtures(cls_=FlagsDataclass)) == generator.generate_fixtures(cls_=FlagsDataclass)
+        assert list(
+            tm.DataclassFixturesGenerator.iter_fixtures(cls_=FlagsDataclass, strategy='pairwise')
+        ) == result
+
+    def test_count_fixtures(self):
+        for cls_ in [
+            SimpleDataclass,
+            SimpleDefaultsDataclass,
+            SimpleDefaultFactoriesDataclass,
+            OptionalDataclass,
+            SubtypesDataclass,
+            FlagsDataclass,
+        ]:
+            for strategy in [None, 'each_choice', 'pairwise']:
+                assert tm.DataclassFixturesGenerator.count_fixtures(cls_=cls_, strategy=strategy) == len(
+                    tm.DataclassFixturesGenerator.generate_fixtures(cls_=cls_, strategy=strategy)
+                )
+
+        with pytest.raises(tm.IsNotDataclassError):
+            tm.DataclassFixturesGenerator.count_fixtures(cls_=NotDataclass)
+
+    def test_count_fixtures__equal_elements(self):
+        @dataclasses.dataclass(frozen=True)
+        class Single:
+            label: str = 'single'
+
+        @dataclasses.dataclass
+        class Model:
+            pair: typing.Tuple[Single, Single]
+            items: typing.List[typing.Optional[Single]]
+
+        count = tm.DataclassFixturesGenerator.count_fixtures(cls_=Model)
+        assert count == len(tm.DataclassFixturesGenerator.generate_fixtures(cls_=Model)) == 4
+        space = tm.DataclassFixturesGenerator.space(cls_=Model)
+        assert [space[index] for index in range(count)] == tm.DataclassFixturesGenerator.generate_fixtures(cls_=Model)
+
+    def test__explain(self):
+        def explain(field_type, default_value=None):
+            return tm.DataclassFixturesGenerator._explain(
+                field_info=tm.FieldInfo(
+                    field_name='f', field_type=field_type, default_value=default_value, default_factory=None,
+                ),
+                explained={},
+            )
+
+        assert explain(typing.Optional[bool]).count == 3
+        assert explain(typing.Optional[bool], default_value=True).count == 3
+        assert explain(typing.Tuple[bool, bool, None]).count == 3  # equal elements are merged
+        assert explain(typing.List[int], default_value=[1]).count == 1
+        assert explain(typing.Dict[bool, int]).count == 2  # the value is repeated for both keys
+        assert explain(typing.List[typing.Optional[FlagsDataclass]]).count == 2 ** 5 * 3 + 1
+        assert explain(FlagsDataclass, default_value=FlagsDataclass(True, True, True, True, True, None)).count == 1
+
+    def test_explain(self):
+        explanation = tm.DataclassFixturesGenerator.explain(cls_=OptionalDataclass)
+        assert explanation.count == 4
+        assert explanation.kind is tm.FieldKind.DATACLASS
+        assert [(child.field_name, child.count) for child in explanation.children] == [
+            ('x', 1), ('y', 2), ('z', 2), ('d', 1), ('s', 1),
+        ]
+        assert explanation.culprit.field_name == 'y'
+        assert explanation.render().splitlines()[:4] == [
+            '-: OptionalDataclass (dataclass) = 4',
+            '  x: int (scalar) = 1',
+            '  y: typing.Optional[float] (union) = 2',
+            '    y: float (scalar) = 1',
+        ]
+
+        explanation = tm.DataclassFixturesGenerator.explain(cls_=SimpleDataclass)
+        assert explanation.culprit is explanation
+
+        explanation = tm.DataclassFixturesGenerator.explain(cls_=FlagsDataclass, strategy='each_choice')
+        assert explanation.count == 3
+        assert explanation.culprit.field_name == 'f'
+
+    def test_sample_fixtures(self):
+        fixtures = tm.DataclassFixturesGenerator.generate_fixtures(cls_=FlagsDataclass)
+        assert tm.DataclassFixturesGenerator.sample_fixtures(cls_=FlagsDataclass, k=len(fixtures)) == fixtures
+
+        result = tm.DataclassFixturesGenerator.sample_fixtures(cls_=FlagsDataclass, k=10, seed=1)
+        assert len(result) == 10
+        assert result == tm.DataclassFixturesGenerator.sample_fixtures(cls_=FlagsDataclass, k=10, seed=1)
+        assert all(r in fixtures for r in result)
+        assert sorted(fixtures.index(r) for r in result) == [fixtures.index(r) for r in result]
+
+        fixtures = tm.DataclassFixturesGenerator.generate_fixtures(cls_=FlagsDataclass, strategy='pairwise')
+        assert tm.DataclassFixturesGenerator.sample_fixtures(
+            cls_=FlagsDataclass, k=len(fixtures), strategy='pairwise',
+        ) == fixtures
+
+        assert tm.DataclassFixturesGenerator.sample_fixtures(cls_=FlagsDataclass, k=0) == []
+
+        with pytest.raises(ValueError):
+            tm.DataclassFixturesGenerator.sample_fixtures(cls_=FlagsDataclass, k=len(fixtures) * 100)
+
+        with pytest.raises(tm.IsNotDataclassError):
+            tm.DataclassFixturesGenerator.sample_fixtures(cls_=NotDataclass, k=1)
+
+    def test_sample_fixtures__large(self):
+        generator = tm.DataclassFixturesGenerator.configure(strategy='product')
+        count = generator.count_fixtures(cls_=WideDataclass)
+        assert count == 2 ** 5 * 3 * (2 ** 5 * 3 + 1) * 3 ** 8
+
+        result = generator.sample_fixtures(cls_=WideDataclass, k=20, seed=2)
+        assert len(result) == 20
+        assert all(isinstance(r, WideDataclass) for r in result)
+
+        with patch.object(tm.sys, 'maxsize', 10):
+            result = generator.sample_fixtures(cls_=WideDataclass, k=3, seed=2)
+            assert len(result) == 3
+            assert result[0] != result[1]
+
+    @patch.object(
+        tm.DataclassFixturesGenerator, tm.DataclassFixturesGenerator._generate_int.__name__, Mock(return_value=33)
+    )
+    @patch.object(
+        tm.DataclassFixturesGenerator, tm.DataclassFixturesGenerator._generate_float.__name__, Mock(return_value=.3)
+    )
+    @patch.object(
+        tm.DataclassFixturesGenerator, tm.DataclassFixturesGenerator._generate_str.__name__, Mock(return_value='x')
+    )
+    def test__get_value(self):
+        fixtures = tm.DataclassFixturesGenerator.generate_fixtures(cls_=OptionalDataclass)
+        explanation = tm.DataclassFixturesGenerator.explain(cls_=OptionalDataclass)
+        root = tm.DataclassFixturesGenerator._get_root_field_info(cls_=OptionalDataclass)
+        assert [
+            tm.DataclassFixturesGenerator._get_value(field_info=root, explanation=explanation, index=index)
+            for index in range(explanation.count)
+        ] == fixtures
+
+        field_info = tm.FieldInfo(
+            field_name='f', field_type=typing.Optional[FlagsDataclass], default_value=None, default_factory=None,
+        )
+        explanation = tm.DataclassFixturesGenerator._explain(field_info=field_info, explained={})
+        assert tm.DataclassFixturesGenerator._get_value(
+            field_info=field_info, explanation=explanation, index=explanation.count - 1,
+        ) is None
+
+        with pytest.raises(IndexError):
+            tm.DataclassFixturesGenerator._get_value(
+                field_info=field_info, explanation=explanation, index=explanation.count,
+            )
+
+    def test_space(self):
+        fixtures = tm.DataclassFixturesGenerator.generate_fixtures(cls_=FlagsDataclass)
+        space = tm.DataclassFixturesGenerator.space(cls_=FlagsDataclass)
+        assert isinstance(space, typing.Sequence)
+        assert repr(space) == 'FixtureSpace(FlagsDataclass, range(0, 96))'
+        assert len(space) == space.size == len(fixtures)
+        assert list(space) == fixtures
+        assert space[0] == fixtures[0]
+        assert space[-1] == fixtures[-1]
+        assert list(space[10:20:3]) == fixtures[10:20:3]
+        assert list(space[::-7]) == fixtures[::-7]
+        assert list(space[1::4][2:5]) == fixtures[1::4][2:5]
+        assert space[20:10].size == 0
+        assert space[::-1].size == len(fixtures)
+
+        with pytest.raises(IndexError):
+            _r = space[len(fixtures)]
+
+        space = tm.DataclassFixturesGenerator.space(cls_=FlagsDataclass, strategy='each_choice')
+        assert list(space) == tm.DataclassFixturesGenerator.generate_fixtures(
+            cls_=FlagsDataclass, strategy='each_choice',
+        )
+
+    def test_space__values(self):
+        @dataclasses.dataclass
+        class Model:
+            flag: bool
+            x: int
+            items: typing.List[FlagsDataclass]
+
+        space = tm.DataclassFixturesGenerator.space(cls_=Model)
+        generate_values_at = tm.DataclassFixturesGenerator._generate_values_at
+        with patch.object(
+            tm.DataclassFixturesGenerator, generate_values_at.__name__, wraps=generate_values_at,
+        ) as m_generate_values_at:
+            indices = list(range(0, space.size, 7)) + list(range(space.size))[::-5] + [3]
+            fixtures = [space[index] for index in range(0, space.size, 7)] + list(space[::-5]) + [space[3:][0]]
+            assert m_generate_values_at.call_count == 3  # once for every field
+
+        assert len({fixture.x for fixture in fixtures}) == 1
+        expected = tm.DataclassFixturesGenerator.generate_fixtures(cls_=Model)
+        assert [(fixture.flag, fixture.items) for fixture in fixtures] == [
+            (expected[index].flag, expected[index].items) for index in indices
+        ]
+
+    def test_space__large(self):
+        space = tm.DataclassFixturesGenerator.space(cls_=WideDataclass)
+        workers = 4
+        shards = [space[worker::workers] for worker in range(workers)]
+        assert sum(shard.size for shard in shards) == space.size
+        assert isinstance(shards[3][-1], WideDataclass)
+        assert shards[3][-1].h is None  # the last index
+
+    def test_configure__options(self):
+        generator = tm.DataclassFixturesGenerator.configure(strategy='pairwise')
+        assert generator._options == {'strategy': 'pairwise'}
+        assert generator._get_base_generator() is tm.DataclassFixturesGenerator
+        assert generator.configure()._get_base_generator() is tm.DataclassFixturesGenerator
+        assert generator.configure()._options == {'strategy': 'pairwise'}
+        assert tm.DataclassFixturesGenerator._options == {}
+
+    def test_generate_fixtures__workers(self):
+        fixtures = tm.DataclassFixturesGenerator.generate_fixtures(cls_=FlagsDataclass)
+        assert tm.DataclassFixturesGenerator.generate_fixtures(cls_=FlagsDataclass, workers=2) == fixtures
+        assert list(
+            tm.DataclassFixturesGenerator.iter_fixtures(cls_=FlagsDataclass, workers=2, chunk_size=7)
+        ) == fixtures
+
+        generator = tm.DataclassFixturesGenerator.configure(strategy='pairwise')
+        assert generator.generate_fixtures(cls_=FlagsDataclass, workers=2) == generator.generate_fixtures(
+            cls_=FlagsDataclass,
+        )
+        assert tm.DataclassFixturesGenerator.generate_fixtures(
+            cls_=FlagsDataclass, strategy='each_choice', workers=2,
+        ) == tm.DataclassFixturesGenerator.generate_fixtures(cls_=FlagsDataclass, strategy='each_choice')
+
+        result = tm.DataclassFixturesGenerator.iter_fixtures(cls_=WideDataclass, workers=2, chunk_size=100)
+        fixture = [next(result) for _x in range(150)][-1]
+        expected = tm.DataclassFixturesGenerator.space(WideDataclass)[149]
+        assert (fixture.flags, fixture.optional_flags, fixture.h) == (expected.flags, expected.optional_flags, expected.h)
+        result.close()
+
+    def test__build_fixtures_chunk(self):
+        fixtures = tm.DataclassFixturesGenerator.generate_fixtures(cls_=FlagsDataclass, strategy='pairwise')
+        assert tm._build_fixtures_chunk(
+            tm.DataclassFixturesGenerator, {'strategy': 'pairwise'}, FlagsDataclass, 2, 5,
+        ) == fixtures[2:5]
+        assert tm._build_fixtures_chunk(tm.DataclassFixturesGenerator, {}, FlagsDataclass, 2, 5) == list(
+            tm.DataclassFixturesGenerator.space(cls_=FlagsDataclass)[2:5]
+        )
+
+    def test_space__iter(self):
+        space = tm.DataclassFixturesGenerator.space(cls_=OptionalDataclass)
+        for start in range(space.size):
+            assert [(f.y is None, f.z == [None]) for f in space[start:]] == [
+                (space[i].y is None, space[i].z == [None]) for i in range(start, space.size)
+            ]
+
+        space = tm.DataclassFixturesGenerator.space(cls_=WideDataclass)
+        start = space.size // 3 + 12345
+        assert [f.flags for f in space[start:start + 500]] == [space[i].flags for i in range(start, start + 500)]
+        assert [f.optional_flags for f in space[start:start + 500]] == [
+            space[i].optional_flags for i in range(start, start + 500)
+        ]
+
+    def test_space__iter__union(self):
+        @dataclasses.dataclass
+        class Model:
+            flag: bool
+            child: typing.Optional[FlagsDataclass]
+
+        fixtures = tm.DataclassFixturesGenerator.generate_fixtures(cls_=Model)
+        space = tm.DataclassFixturesGenerator.space(cls_=Model)
+        for start in (1, 95, 96, 97, 98, len(fixtures) - 1):  # the first member of the union is skipped or not
+            assert list(space[start:start + 3]) == fixtures[start:start + 3], start
+
+    def test_configure__seed(self):
+        generator = tm.DataclassFixturesGenerator.configure(seed=1)
+        assert isinstance(generator._random, random.Random)
+        assert generator._options == {'seed': 1}
+        assert generator.generate_fixtures(cls_=SubtypesDataclass) == tm.DataclassFixturesGenerator.configure(
+            seed=1,
+        ).generate_fixtures(cls_=SubtypesDataclass)
+        assert generator.generate_fixtures(cls_=SubtypesDataclass) != tm.DataclassFixturesGenerator.configure(
+            seed=2,
+        ).generate_fixtures(cls_=SubtypesDataclass)
+        assert tm.DataclassFixturesGenerator._random is random
+
+        rng = random.Random(3)
+        generator = generator.configure(rng=rng)
+        assert generator._random is rng
+        assert generator._options == {'rng': rng}
+        assert generator.configure(seed=4)._options == {'seed': 4}
+
+        with pytest.raises(ValueError):
+            tm.DataclassFixturesGenerator.configure(seed=1, rng=rng)
+
+    def test_configure__seed__threads(self):
+        results = {}
+
+        def generate(number, seed):
+            generator = tm.DataclassFixturesGenerator.configure(seed=seed)
+            results[number] = [
+                generator.generate_fixtures(cls_=OptionalDataclass) for _x in range(200)
+            ]
+
+        threads = [threading.Thread(target=generate, args=(number, 5)) for number in range(4)]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        expected = tm.DataclassFixturesGenerator.configure(seed=5)
+        assert list(results.values()) == [[expected.generate_fixtures(OptionalDataclass) for _x in range(200)]] * 4
+
+    def test_sample_fixtures__seed(self):
+        result = tm.DataclassFixturesGenerator.sample_fixtures(cls_=WideDataclass, k=5, seed=7)
+        assert result == tm.DataclassFixturesGenerator.sample_fixtures(cls_=WideDataclass, k=5, seed=7)
+        assert result != tm.DataclassFixturesGenerator.sample_fixtures(cls_=WideDataclass, k=5, seed=8)
+
+    def test_generate_fixtures__workers__seed(self):
+        generator = tm.DataclassFixturesGenerator.configure(seed=9)
+        result = generator.generate_fixtures(cls_=OptionalDataclass, workers=2)
+        assert result == tm.DataclassFixturesGenerator.configure(seed=9).generate_fixtures(
+            cls_=OptionalDataclass, workers=2,
+        )
+        assert len({fixture.x for fixture in result}) > 1  # chunks have their own random streams
+
+    def test_intern_value(self):
+        generator = tm.DataclassFixturesGenerator.configure(intern=True)
+        assert generator._options == {'intern': True}
+        assert not tm.DataclassFixturesGenerator._intern
+
+        value = ''.join(['ab', 'cd'])
+        assert generator._intern_value(value) is not generator._intern_value(''.join(['abc', 'd']))  # no pool yet
+        assert generator._intern_value(tuple([1, 'x'])) is not generator._intern_value(tuple([1, 'x']))
+
+        def intern_values():
+            assert generator._intern_value(''.join(['ab', 'cd'])) is generator._intern_value(''.join(['abc', 'd']))
+            assert generator._intern_value(''.join(['ab', 'cd'])) is not sys.intern('abcd')
+            assert generator._intern_value(tuple([1, 'x'])) is generator._intern_value(tuple([1, 'x']))
+            assert generator._intern_value(tuple([5000.5])) is generator._intern_value(tuple([5000.5]))
+            assert type(generator._intern_value((True,))[0]) is bool
+            assert type(generator._intern_value((1.0,))[0]) is float
+            assert type(generator._intern_value((1,))[0]) is int
+            assert str(generator._intern_value((-0.0,))[0]) == '-0.0'
+            assert generator._intern_value(frozenset({1, 2})) is generator._intern_value(frozenset({2, 1}))
+            assert generator._intern_value(FrozenDataclass(a=True, b=None)) is generator._intern_value(
+                FrozenDataclass(a=True, b=None),
+            )
+
+            mutable = [1]
+            assert generator._intern_value(mutable) is mutable
+            assert generator._intern_value((mutable,)) is not generator._intern_value(([1],))
+            simple = SimpleDataclass(x=1, y=1.0, z='a')
+            assert generator._intern_value(simple) is simple
+            return len(tm._POOL.get())
+
+        assert generator._call_in_pool(intern_values) == generator._call_in_pool(intern_values) == 12  # not growing
+        assert tm._POOL.get() is None
+
+    def test_iter_fixtures__intern(self):
+        fixtures = list(tm.DataclassFixturesGenerator.iter_fixtures(cls_=FrozenHolderDataclass))
+        assert len({id(f.frozen) for f in fixtures}) == 2 * 2 * 6  # built again for every combination of a and b
+
+        generator = tm.DataclassFixturesGenerator.configure(intern=True)
+        for fixtures in [
+            list(generator.iter_fixtures(cls_=FrozenHolderDataclass)),
+            list(generator.space(cls_=FrozenHolderDataclass)),
+            generator.generate_fixtures(cls_=FrozenHolderDataclass),
+        ]:
+            assert len({id(f.frozen) for f in fixtures}) == 6
+            assert len({id(f.name) for f in fixtures[:48]}) == 2  # None and the string
+
+        assert len({id(f.frozen) for f in generator.sample_fixtures(cls_=FrozenHolderDataclass, k=48)}) == 6
+
+        first = generator.generate_fixtures(cls_=FrozenHolderDataclass)
+        assert first[0].frozen is not generator.generate_fixtures(cls_=FrozenHolderDataclass)[0].frozen  # pools are dropped
+        assert tm._POOL.get() is None
+
+    def test_generate_columns(self):
+        generator = tm.DataclassFixturesGenerator.configure(seed=1)
+        columns = generator.generate_columns(cls_=OptionalDataclass)
+        fixtures = tm.DataclassFixturesGenerator.configure(seed=1).generate_fixtures(cls_=OptionalDataclass)
+        assert list(columns) == ['x', 'y', 'z', 'd', 's.x', 's.y', 's.z']
+        assert columns['x'].typecode == 'q'
+        assert columns['s.y'].typecode == 'd'
+        assert isinstance(columns['y'], list)
+        for name, column in columns.items():
+            assert list(column) == [functools.reduce(getattr, name.split('.'), f) for f in fixtures], name
+
+        columns = tm.DataclassFixturesGenerator.generate_columns(cls_=FlagsDataclass)
+        assert columns['a'].typecode == 'b'
+        assert [tuple(row) for row in zip(*columns.values())] == [
+            dataclasses.astuple(f) for f in tm.DataclassFixturesGenerator.generate_fixtures(cls_=FlagsDataclass)
+        ]
+
+        columns = tm.DataclassFixturesGenerator.generate_columns(cls_=FrozenHolderDataclass, strategy='pairwise')
+        fixtures = tm.DataclassFixturesGenerator.generate_fixtures(cls_=FrozenHolderDataclass, strategy='pairwise')
+        assert [(a, b, f_a, f_b, n is None) for a, b, f_a, f_b, _l, _t, n in zip(*columns.values())] == [
+            (f.a, f.b, f.frozen.a, f.frozen.b, f.name is None) for f in fixtures
+        ]
+        assert tm.DataclassFixturesGenerator.generate_columns(cls_=SimpleDefaultsDataclass) == {
+            'x': array.array('q', [1]), 'y': array.array('d', [1.1]), 'z': ['hello'],
+        }
+
+    def test_configure__construct(self):
+        generator = tm.DataclassFixturesGenerator.configure(construct='fast')
+        assert generator._construct == 'fast'
+        assert generator._options == {'construct': 'fast'}
+        assert tm.DataclassFixturesGenerator._construct == 'init'
+
+        with pytest.raises(ValueError):
+            tm.DataclassFixturesGenerator.configure(construct='foo')
+
+    def test__get_non_init_fields(self):
+        assert tm.DataclassFixturesGenerator._get_non_init_fields(SimpleDataclass) == ()
+        non_init_fields = dict(tm.DataclassFixturesGenerator._get_non_init_fields(PostInitDataclass))
+        assert list(non_init_fields) == ['tags', 'total']
+        assert non_init_fields['tags'](None) == []
+        assert non_init_fields['tags'](None) is not non_init_fields['tags'](None)
+        assert non_init_fields['total'](None) == 0
+
+    def test__compile_constructor(self):
+        construct = tm.DataclassFixturesGenerator._compile_constructor(SimpleDataclass, ('x', 'y', 'z'))
+        assert construct((1, 1.1, 'a')) == SimpleDataclass(x=1, y=1.1, z='a')
+
+        construct = tm.DataclassFixturesGenerator._compile_constructor(SlotsDataclass, ('x', 'flag'))
+        instance = construct((1, None))
+        assert instance == SlotsDataclass(x=1, flag=None)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            instance.x = 2
+
+        construct = tm.DataclassFixturesGenerator._compile_constructor(PostInitDataclass, ('x', 'z'))
+        instance = construct((1, 'a'))
+        assert (instance.x, instance.z, instance.tags, instance.total) == (1, 'a', [], 0)  # __post_init__ is not called
+
+        @dataclasses.dataclass
+        class Slots:
+            __slots__ = ('x',)
+            x: int
+
+        @dataclasses.dataclass
+        class Derived(Slots):
+            flag: typing.Optional[bool]
+            tags: typing.List[str] = dataclasses.field(init=False, default_factory=list)
+
+        construct = tm.DataclassFixturesGenerator._compile_constructor(Derived, ('x', 'flag'))
+        instance = construct((1, True))
+        assert (instance.x, instance.flag, instance.tags) == (1, True, [])
+        assert instance.__dict__ == {'flag': True, 'tags': []}
+        generator = tm.DataclassFixturesGenerator.configure(construct='fast', seed=1)
+        assert generator.generate_fixtures(cls_=Derived) == tm.DataclassFixturesGenerator.configure(
+            seed=1,
+        ).generate_fixtures(cls_=Derived)
+
+    def test_generate_fixtures__construct(self):
+        generator = tm.DataclassFixturesGenerator.configure(construct='fast', seed=1)
+        expected = tm.DataclassFixturesGenerator.configure(seed=1)
+        for cls_ in (OptionalDataclass, SubtypesDataclass, FlagsDataclass, FrozenHolderDataclass, SlotsDataclass):
+            assert generator.generate_fixtures(cls_=cls_) == expected.generate_fixtures(cls_=cls_)
+            assert list(generator.iter_fixtures(cls_=cls_)) == list(expected.iter_fixtures(cls_=cls_))
+
+        fixture = generator.generate_fixtures(cls_=PostInitDataclass)[0]
+        assert fixture.total == 0
+        assert tm.DataclassFixturesGenerator.generate_fixtures(cls_=PostInitDataclass)[0].total > 0
+
+    def test__get_type_hints(self):
+        with patch.object(tm.typing, 'get_type_hints', wraps=typing.get_type_hints) as m_get_type_hints:
+            hints = tm.DataclassFixturesGenerator._get_type_hints(PostponedDataclass)
+            assert hints['child'] is ChildDataclass
+            assert hints['flag'] == typing.Optional[bool]
+            assert tm.DataclassFixturesGenerator._get_type_hints(PostponedDataclass) is hints
+            assert m_get_type_hints.call_count <= 1  # the hints may be resolved by an other test before
+
+        @dataclasses.dataclass
+        class Unresolved:
+            x: 'Missing'  # noqa: F821
+            y: 'typing.Optional[int]'
+            z: typing.List['Missing'] = dataclasses.field(default_factory=list)  # noqa: F821
+
+        hints = tm.DataclassFixturesGenerator._get_type_hints(Unresolved)
+        assert hints['x'] == 'Missing'
+        assert hints['y'] == typing.Optional[int]  # the other annotations are resolved
+        assert tm.DataclassFixturesGenerator._get_fields(Unresolved)[0].field_type == 'Missing'
+
+        with pytest.raises(tm.UnresolvedAnnotationError, match="field name==x has annotation 'Missing'"):
+            tm.DataclassFixturesGenerator.generate_fixtures(cls_=Unresolved)
+
+    def test_generate_fixtures__postponed(self):
+        result = tm.DataclassFixturesGenerator.generate_fixtures(cls_=PostponedDataclass)
+        assert len(result) == 3 * 2 * 2
+        assert {(r.flag, r.child.flag) for r in result} == set(itertools.product([True, False, None], [True, False]))
+        assert {next(iter(r.children.values())) is None for r in result} == {True, False}
+        assert all(isinstance(r.x, int) and isinstance(r.child.z, str) for r in result)
+
+    @pytest.mark.skipif(sys.version_info < (3, 9), reason='typing.Annotated appeared in python 3.9')
+    def test_generate_fixtures__annotated(self):
+        @dataclasses.dataclass
+        class Annotated:
+            x: 'typing.Annotated[int, "x"]'
+            flag: typing.Annotated[typing.Optional[bool], 'flag']
+
+        assert tm.DataclassFixturesGenerator._get_fields(Annotated)[0].field_type == typing.Annotated[int, 'x']
+        result = tm.DataclassFixturesGenerator.generate_fixtures(cls_=Annotated)
+        assert [r.flag for r in result] == [True, False, None]
+        assert isinstance(result[0].x, int)
+
+    def test_generate_fixtures__recursive(self):
+        with pytest.raises(ValueError):
+            tm.DataclassFixturesGenerator.configure(max_depth=0)
+
+        for max_depth, expected_count in ((1, 2), (2, 12), (3, 312)):
+            generator = tm.DataclassFixturesGenerator.configure(max_depth=max_depth)
+            result = generator.generate_fixtures(cls_=TreeDataclass)
+            assert len(result) == generator.count_fixtures(cls_=TreeDataclass) == expected_count
+            assert list(generator.iter_fixtures(cls_=TreeDataclass)) == result
+            space = generator.space(cls_=TreeDataclass)
+            assert [space[index] for index in range(len(space))] == result
+            assert len(generator.generate_columns(cls_=TreeDataclass)['children']) == expected_count
+
+        result = tm.DataclassFixturesGenerator.configure(max_depth=1).generate_fixtures(cls_=TreeDataclass)
+        assert {(r.leaf, r.parent, tuple(r.children)) for r in result} == {(True, None, ()), (False, None, ())}
+
+    def test_generate_fixtures__recursive_memo(self):
+        generator = tm.DataclassFixturesGenerator.configure(max_depth=3)
+        with patch.object(generator, '_build_instances', wraps=generator._build_instances) as m_build_instances:
+            generator.generate_fixtures(cls_=TreeDataclass)
+
+        assert m_build_instances.call_count == 3  # parents and children of a level share the values
+        assert tm._MEMO.get() is None
+        assert tm._PATH.get() == ()
+
+    def test_generate_fixtures__stats(self):
+        calls = []
+        stats = tm.GenerationStats(
+            before=lambda model, kind, field_info: calls.append(('before', model, kind)),
+            after=lambda model, kind, field_info, values, seconds: calls.append(('after', model, kind, len(values))),
+        )
+        generator = tm.DataclassFixturesGenerator.configure(stats=stats)
+        assert generator.configure(seed=1)._stats is stats
+        assert 'stats' not in generator._options
+        assert tm.DataclassFixturesGenerator._stats is None
+
+        result = generator.generate_fixtures(cls_=OptionalDataclass)
+        assert len(result) == 4
+        assert stats.records[(OptionalDataclass, 'union')].calls == 2  # y and elements of z
+        assert stats.records[(OptionalDataclass, 'dict')].values == 1
+        assert stats.records[(SimpleDataclass, 'dataclass')].values == 1
+        assert stats.records[(SimpleDataclass, 'scalar')].calls == 3
+        assert len(calls) == 2 * sum(record.calls for record in stats.records.values())
+        assert calls[0][0] == 'before' and calls[-1][0] == 'after'
+
+        generator.generate_fixtures(cls_=SimpleDefaultFactoriesDataclass)
+        assert stats.records[(SimpleDefaultFactoriesDataclass, 'scalar')].default_factory_calls == 3
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason='unions of | appeared in python 3.10')
+    def test__is_union__pep604(self):
+        field_info = tm.FieldInfo(field_name='f', field_type=eval('int | None'), default_value=None, default_factory=None)
+        assert tm.DataclassFixturesGenerator._is_union(field_info=field_info)
+        assert tm.DataclassFixturesGenerator._generate_values(field_info=field_info)[1:] == [None]
+        assert tm.DataclassFixturesGenerator._get_plan(field_info) is tm.DataclassFixturesGenerator._get_plan(field_info)
+
+    def test__find_handler(self):
+        find_handler = tm.DataclassFixturesGenerator._find_handler
+        assert find_handler(bool) is tm._generate_bool_handler
+        assert find_handler(XID) is tm._generate_int_handler  # by the MRO
+        assert find_handler(ZS) is tm._generate_str_handler
+        assert find_handler(FirstSecond) is tm._generate_enum_handler  # IntEnum is not an int
+        assert find_handler(typing.List[int]) is None
+        assert find_handler(SimpleDataclass) is None
+        assert find_handler(...) is None
+
+    def test__resolve_new_type(self):
+        nested = typing.NewType('nested', YID)
+        field_info = tm.FieldInfo(field_name='f', field_type=nested, default_value=None, default_factory=None)
+        assert tm.DataclassFixturesGenerator._resolve_new_type(field_info=field_info).field_type is float
+
+    def test_register(self):
+        class Generator(tm.DataclassFixturesGenerator):
+            pass
+
+        @dataclasses.dataclass
+        class Domain:
+            amount: fractions.Fraction
+            queue: typing.Deque[int]
+            x: int
+
+        class SubGenerator(Generator):
+            pass
+
+        configured = Generator.configure(seed=1)
+        for generator in [Generator, SubGenerator, configured]:
+            generator.generate_fixtures(cls_=SimpleDataclass)  # plans compiled before registration are dropped
+
+        Generator.register(fractions.Fraction, lambda generator, field_info: [fractions.Fraction(0), fractions.Fraction(1, 2)])
+        Generator.register(collections.deque, lambda generator, field_info: [collections.deque([1])])
+        Generator.register(int, lambda generator, field_info: [-1])
+        result = Generator.generate_fixtures(cls_=Domain)
+        assert [(r.amount, r.queue, r.x) for r in result] == [
+            (fractions.Fraction(0), collections.deque([1]), -1),
+            (fractions.Fraction(1, 2), collections.deque([1]), -1),
+        ]
+        assert Generator.generate_fixtures(cls_=SimpleDataclass)[0].x == -1
+        assert Generator.configure(seed=1).generate_fixtures(cls_=SimpleDataclass)[0].x == -1
+        assert configured.generate_fixtures(cls_=SimpleDataclass)[0].x == -1
+        assert SubGenerator.generate_fixtures(cls_=SimpleDataclass)[0].x == -1
+        assert Generator.count_fixtures(cls_=Domain) == 2
+        assert fractions.Fraction not in tm.DataclassFixturesGenerator._handlers
+        assert tm.DataclassFixturesGenerator.generate_fixtures(cls_=SimpleDataclass)[0].x >= 0
+
+    def test_register__counted(self):
+        class Generator(tm.DataclassFixturesGenerator):
+            pass
+
+        @dataclasses.dataclass
+        class Flags:
+            flag: bool
+            color: OneTwo
+
+        assert Generator.count_fixtures(cls_=Flags) == len(Generator.generate_fixtures(cls_=Flags)) == 2
+
+        Generator.register(bool, lambda generator, field_info: [True])
+        Generator.register(OneTwo, lambda generator, field_info: list(OneTwo))
+        assert Generator.count_fixtures(cls_=Flags) == len(Generator.generate_fixtures(cls_=Flags)) == len(OneTwo)
+
+    def test_generate_fixtures__pooled_types(self):
+        @dataclasses.dataclass
+        class Pooled:
+            when: datetime.datetime
+            day: datetime.date
+            amount: decimal.Decimal
+            id: uuid.UUID
+            raw: bytes
+            flag: bool
+            amount_default: decimal.Decimal = decimal.Decimal('1.5')
+
+        first = tm.DataclassFixturesGenerator.configure(seed=1).generate_fixtures(cls_=Pooled)
+        assert first == tm.DataclassFixturesGenerator.configure(seed=1).generate_fixtures(cls_=Pooled)
+        assert len(first) == 2
+        fixture = first[0]
+        assert type(fixture.when) is datetime.datetime
+        assert type(fixture.day) is datetime.date
+        assert fixture.amount.as_tuple().exponent == -2
+        assert fixture.id.version == 4
+        assert isinstance(fixture.raw, bytes) and len(fixture.raw) == 8
+        assert fixture.amount_default == decimal.Decimal('1.5')
+
+    @pytest.mark.skipif(sys.version_info < (3, 8), reason='typing.Literal appeared in python 3.8')
+    def test_generate_fixtures__literal(self):
+        @dataclasses.dataclass
+        class Literals:
+            status: typing.Literal['new', 'done']
+            level: typing.Optional[typing.Literal[1, True]]
+            size: typing.Literal['s', 'm'] = 'm'
+
+        result = tm.DataclassFixturesGenerator.generate_fixtures(cls_=Literals)
+        assert len(result) == tm.DataclassFixturesGenerator.count_fixtures(cls_=Literals) == 2 * 3 * 2
+        assert {r.status for r in result} == {'new', 'done'}
+        assert [r.level for r in result[:6:2]] == [1, True, None]
+        assert [r.size for r in result[:2]] == ['m', 's']  # the default goes first
+
+    def test_configure__lengths(self):
+        @dataclasses.dataclass
+        class Payload:
+            ids: typing.List[int]
+            tags: typing.FrozenSet[typing.Optional[str]]
+            flags: typing.Tuple[bool, ...]
+            pair: typing.Tuple[int, str]
+            scores: typing.Dict[str, typing.Optional[float]]
+            nested: typing.List[SimpleDataclass]
+
+        assert tm.DataclassFixturesGenerator.count_fixtures(cls_=Payload) == 2 * 2 * 2 * 2
+
+        generator = tm.DataclassFixturesGenerator.configure(seed=1, lengths=(50, 100))
+        result = generator.generate_fixtures(cls_=Payload)
+        assert len(result) == generator.count_fixtures(cls_=Payload) == 2 * 2 * 2 * 2
+        assert result == tm.DataclassFixturesGenerator.configure(seed=1, lengths=(50, 100)).generate_fixtures(cls_=Payload)
+        assert all(50 <= len(r.ids) <= 100 and len(set(r.ids)) > 10 for r in result)
+        assert all(len(r.tags) > 10 for r in result) and any(None in r.tags for r in result)
+        assert all(len(r.flags) >= 50 and set(r.flags) == {True, False} for r in result)
+        assert {r.flags[0] for r in result} == {True, False}  # every value starts with a value of the elements
+        assert all(len(r.pair) == 1 for r in result)  # tuples of fixed lengths are not resized
+        assert {next(iter(r.scores.values())) is None for r in result} == {True, False}
+        assert all(10 < len(r.scores) <= 100 for r in result)
+        assert all(isinstance(value, SimpleDataclass) for r in result for value in r.nested)
+
+        result = tm.DataclassFixturesGenerator.configure(lengths={list: 0, dict: 3}).generate_fixtures(cls_=Payload)
+        assert all(r.ids == [] and r.nested == [] and len(r.scores) == 3 and len(r.tags) == 1 for r in result)
+
+        generator = tm.DataclassFixturesGenerator.configure(lengths=0)
+        result = generator.generate_fixtures(cls_=Payload)
+        assert len(result) == generator.count_fixtures(cls_=Payload) == 2 * 2 * 2 * 2
+        assert all(not r.ids and not r.tags and not r.flags and not r.scores and not r.nested for r in result)
+        assert all(len(r.pair) == 1 for r in result)
+
+        result = tm.DataclassFixturesGenerator.configure(lengths=lambda rng: 2).generate_fixtures(cls_=Payload)
+        assert all(len(r.ids) == len(r.flags) == 2 for r in result)
+
+        with pytest.raises(ValueError):
+            tm.DataclassFixturesGenerator.configure(lengths=(3, 1))
+
+        with pytest.raises(ValueError):
+            tm.DataclassFixturesGenerator.configure(lengths={str: 3})
+
+    def test__fill_values(self):
+        generator = tm.DataclassFixturesGenerator.configure(seed=1)
+
+        def fill(field_type, count=100, values=None):
+            return generator._fill_values(
+                field_info=tm.FieldInfo(field_name='f', field_type=field_type, default_value=None, default_factory=None),
+                count=count,
+                values=values,
+            )
+
+        assert fill(int, count=0) == []
+        assert len(set(fill(int))) > 90
+        assert set(fill(OneTwo)) == {OneTwo.ONE, OneTwo.TWO}
+        assert set(fill(typing.Optional[bool])) == {True, False, None}
+        assert {type(value) for value in fill(typing.Union[int, str])} == {int, str}
+        assert set(fill(SimpleDataclass, values=['a', 'b'])) == {'a', 'b'}
+
+    def test_agenerate_fixtures(self):
+        async def collect(**kwargs):
+            return [batch async for batch in tm.DataclassFixturesGenerator.agenerate_fixtures(**kwargs)]
+
+        expected = list(tm.DataclassFixturesGenerator.iter_fixtures(cls_=FlagsDataclass))
+        batches = asyncio.run(collect(cls_=FlagsDataclass, batch_size=5))
+        assert [len(batch) for batch in batches] == [5] * (len(expected) // 5) + [len(expected) % 5] * bool(len(expected) % 5)
+        assert list(itertools.chain.from_iterable(batches)) == expected
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            batches = asyncio.run(collect(cls_=FlagsDataclass, batch_size=len(expected), executor=executor))
+        assert batches == [expected]
+
+        batches = asyncio.run(collect(cls_=FlagsDataclass, strategy='each_choice'))
+        assert batches == [tm.DataclassFixturesGenerator.generate_fixtures(cls_=FlagsDataclass, strategy='each_choice')]
+
+        with pytest.raises(ValueError):
+            asyncio.run(collect(cls_=FlagsDataclass, batch_size=0))
+
+    def test_agenerate_fixtures__async_default_factories(self):
+        started = []
+
+        async def load_name():
+            started.append('name')
+            await asyncio.sleep(0)
+            assert started == ['name', 'tags']  # both factories are awaited concurrently
+            return 'loaded'
+
+        async def load_tags():
+            started.append('tags')
+            return ['a']
+
+        @dataclasses.dataclass
+        class Child:
+            tags: typing.List[str] = dataclasses.field(default_factory=load_tags)
+
+        @dataclasses.dataclass
+        class Parent:
+            flag: bool
+            name: str = dataclasses.field(default_factory=load_name)
+            child: typing.Optional[Child] = None
+            children: typing.List[Child] = dataclasses.field(default_factory=list)
+
+        @dataclasses.dataclass
+        class Root:
+            parent: Parent
+            child: Child
+
+        async def collect():
+            return [batch async for batch in tm.DataclassFixturesGenerator.agenerate_fixtures(cls_=Root)]
+
+        result = list(itertools.chain.from_iterable(asyncio.run(collect())))
+        assert len(result) == tm.DataclassFixturesGenerator.count_fixtures(cls_=Root)
+        assert {r.parent.name for r in result} == {'loaded'}
+        assert {tuple(r.child.tags) for r in result} == {('a',)}
+        assert tm._AWAITED.get() is None
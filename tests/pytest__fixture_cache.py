@@ -0,0 +1,204 @@
+import os
+import random
+import typing
+import functools
+import dataclasses
+import pytest
+import fixtures_generator.fixture_cache as tm
+from unittest.mock import patch
+from fixtures_generator.dataclass_fixtures_generator import DataclassFixturesGenerator
+from fixtures_generator.pydantic_fixtures_generator import PydanticFixturesGenerator
+from fixtures_generator.dataclass_fixtures import OptionalDataclass, FlagsDataclass, TreeDataclass, SubtypesDataclass
+from fixtures_generator.pydantic_fixtures import OptionalPydantic
+
+
+def sample_length(rng):
+    return rng.randint(1, 3)
+
+
+class Marker:
+    pass
+
+
+class TestFixtureCache:
+    def test_fingerprint(self, tmp_path):
+        cache = tm.FixtureCache(directory=str(tmp_path))
+        fingerprint = cache.fingerprint(cls_=OptionalDataclass, generator=DataclassFixturesGenerator)
+        assert fingerprint == cache.fingerprint(cls_=OptionalDataclass, generator=DataclassFixturesGenerator)
+        assert len({
+            fingerprint,
+            cache.fingerprint(cls_=OptionalDataclass, generator=DataclassFixturesGenerator.configure(seed=1)),
+            cache.fingerprint(cls_=OptionalDataclass, generator=DataclassFixturesGenerator.configure(seed=2)),
+            cache.fingerprint(cls_=OptionalDataclass, generator=DataclassFixturesGenerator.configure(strategy='pairwise')),
+            cache.fingerprint(cls_=SubtypesDataclass, generator=DataclassFixturesGenerator),
+            cache.fingerprint(cls_=TreeDataclass, generator=DataclassFixturesGenerator),
+        }) == 6
+
+        def make_model(type_, default):
+            @dataclasses.dataclass
+            class Model:
+                x: type_ = default
+
+            return Model
+
+        assert len({
+            cache.fingerprint(cls_=make_model(int, 1), generator=DataclassFixturesGenerator),
+            cache.fingerprint(cls_=make_model(int, 2), generator=DataclassFixturesGenerator),
+            cache.fingerprint(cls_=make_model(typing.Optional[int], 1), generator=DataclassFixturesGenerator),
+        }) == 3
+
+    def test_fingerprint__stable(self, tmp_path):
+        cache = tm.FixtureCache(directory=str(tmp_path))
+
+        def fingerprint(**options):
+            return cache.fingerprint(cls_=OptionalDataclass, generator=DataclassFixturesGenerator.configure(**options))
+
+        assert fingerprint(lengths={list: sample_length, dict: 3}) == fingerprint(lengths={dict: 3, list: sample_length})
+        assert fingerprint(lengths={list: sample_length}) != fingerprint(lengths={list: 3})
+        assert tm._describe_value({1: (OptionalDataclass, 'x')}) == (
+            "{1: tuple(['fixtures_generator.dataclass_fixtures.OptionalDataclass', \"'x'\"])}"
+        )
+        assert tm._describe_value(sample_length).startswith(f'{__name__}.sample_length(code(')
+
+        with pytest.raises(ValueError):
+            fingerprint(lengths={list: functools.partial(sample_length)})
+
+        @dataclasses.dataclass
+        class Model:
+            x: typing.Any = Marker()
+
+        with pytest.raises(ValueError):
+            cache.fingerprint(cls_=Model, generator=DataclassFixturesGenerator)
+
+    def test_fingerprint__lambdas(self, tmp_path):
+        cache = tm.FixtureCache(directory=str(tmp_path))
+        short, long = lambda rng: 1, lambda rng: 5  # noqa: E731
+        offset = 2
+
+        def make_sampler(length):
+            return lambda rng: length + offset
+
+        fingerprints = {
+            cache.fingerprint(cls_=OptionalDataclass, generator=DataclassFixturesGenerator.configure(lengths=sampler))
+            for sampler in (short, long, make_sampler(1), make_sampler(2), lambda rng: rng.randint(1, 3))
+        }
+        assert len(fingerprints) == 5
+
+        generator = DataclassFixturesGenerator.configure(lengths=short)
+        fixtures = cache.generate_fixtures(cls_=OptionalDataclass, generator=generator)
+        assert {len(fixture.z) for fixture in fixtures} == {1}
+        generator = DataclassFixturesGenerator.configure(lengths=long)
+        fixtures = cache.generate_fixtures(cls_=OptionalDataclass, generator=generator)
+        assert {len(fixture.z) for fixture in fixtures} == {5}
+        assert len(os.listdir(tmp_path)) == 2
+
+    def test_describe_value(self):
+        assert tm._describe_value(frozenset({2, 1})) == "frozenset(['1', '2'])"
+        assert tm._describe_value({'b': None, 'a': 1.5}) == "{'a': 1.5, 'b': None}"
+        assert tm._get_name(1) == '1'
+        assert tm._get_name(OptionalDataclass) == 'fixtures_generator.dataclass_fixtures.OptionalDataclass'
+
+    def test_directory(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg'))
+        assert tm.FixtureCache().directory == str(tmp_path / 'xdg' / 'dataclass-fixtures-generator')
+        monkeypatch.delenv('XDG_CACHE_HOME')
+        monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+        assert tm.FixtureCache().directory == str(tmp_path / 'home' / '.cache' / 'dataclass-fixtures-generator')
+        assert tm.FixtureCache(directory=str(tmp_path)).directory == str(tmp_path)
+
+    def test_generate_fixtures(self, tmp_path):
+        cache = tm.FixtureCache(directory=str(tmp_path / 'cache'))
+        generator = DataclassFixturesGenerator.configure(seed=1)
+        fixtures = cache.generate_fixtures(cls_=OptionalDataclass, generator=generator)
+        assert fixtures == DataclassFixturesGenerator.configure(seed=1).generate_fixtures(cls_=OptionalDataclass)
+        assert len(os.listdir(tmp_path / 'cache')) == 1
+
+        with patch.object(generator, 'generate_fixtures') as m_generate_fixtures:
+            assert cache.generate_fixtures(cls_=OptionalDataclass, generator=generator) == fixtures
+            m_generate_fixtures.assert_not_called()
+
+        count = PydanticFixturesGenerator.count_fixtures(cls_=OptionalPydantic)
+        assert len(cache.generate_fixtures(cls_=OptionalPydantic)) == count
+        assert len(os.listdir(tmp_path / 'cache')) == 2
+
+        cache.clear()
+        assert os.listdir(tmp_path / 'cache') == []
+
+    def test_generate_fixtures__not_cached(self, tmp_path):
+        cache = tm.FixtureCache(directory=str(tmp_path))
+
+        @dataclasses.dataclass
+        class Local:
+            flag: bool
+
+        assert len(cache.generate_fixtures(cls_=Local)) == 2  # can not be pickled
+        generator = DataclassFixturesGenerator.configure(lengths={list: functools.partial(sample_length)})
+        assert len(cache.generate_fixtures(cls_=OptionalDataclass, generator=generator)) == 4  # no stable fingerprint
+        generator = DataclassFixturesGenerator.configure(rng=random.Random(1))
+        assert len(cache.generate_fixtures(cls_=FlagsDataclass, generator=generator)) > 1
+        assert os.listdir(tmp_path) == []
+
+    def test_generate_fixtures__corrupt(self, tmp_path):
+        cache = tm.FixtureCache(directory=str(tmp_path), compression='lzma')
+        fixtures = cache.generate_fixtures(cls_=FlagsDataclass)
+        path, = tmp_path.iterdir()
+        assert path.name.endswith('.pkl.xz')
+        path.write_bytes(b'corrupt')
+        assert cache.generate_fixtures(cls_=FlagsDataclass)
+        assert path.read_bytes() != b'corrupt'
+        assert len(fixtures) == DataclassFixturesGenerator.count_fixtures(cls_=FlagsDataclass)
+
+        with pytest.raises(ValueError):
+            tm.FixtureCache(directory=str(tmp_path), compression='gzip')
+
+    def test_generate_fixtures__store_failure(self, tmp_path):
+        cache = tm.FixtureCache(directory=str(tmp_path))
+        with patch.object(tm.os, 'replace', side_effect=OSError('disk full')):
+            with pytest.raises(OSError):
+                cache._store(path=str(tmp_path / 'entry.pkl.zlib'), fixtures=[1])
+
+            assert os.listdir(tmp_path) == []  # the temporary file is removed
+            fixtures = cache.generate_fixtures(cls_=FlagsDataclass)
+
+        assert len(fixtures) == DataclassFixturesGenerator.count_fixtures(cls_=FlagsDataclass)
+        assert os.listdir(tmp_path) == []
+
+    def test_clear(self, tmp_path):
+        cache = tm.FixtureCache(directory=str(tmp_path / 'missing'))
+        cache.clear()
+        cache.evict()
+        assert not (tmp_path / 'missing').exists()
+
+        cache = tm.FixtureCache(directory=str(tmp_path))
+        cache.generate_fixtures(cls_=FlagsDataclass)
+        (tmp_path / 'other.txt').write_text('kept')
+        cache.clear()
+        assert os.listdir(tmp_path) == ['other.txt']
+
+    def test_evict__removed(self, tmp_path):
+        cache = tm.FixtureCache(directory=str(tmp_path), max_bytes=0)
+        cache.generate_fixtures(cls_=FlagsDataclass)
+        cache.generate_fixtures(cls_=OptionalDataclass)
+        assert os.listdir(tmp_path) == []
+
+        cache.max_bytes = 2 ** 20
+        cache.generate_fixtures(cls_=FlagsDataclass)
+        cache.max_bytes = 0
+        with patch.object(tm.os, 'unlink', side_effect=FileNotFoundError) as m_unlink:
+            cache.evict()  # removed by an other process
+            m_unlink.assert_called_once()
+
+    def test_evict(self, tmp_path):
+        cache = tm.FixtureCache(directory=str(tmp_path))
+        cache.generate_fixtures(cls_=OptionalDataclass)
+        cache.generate_fixtures(cls_=FlagsDataclass)
+        first, second = (
+            tmp_path / os.path.basename(cache._get_path(cache.fingerprint(cls_=cls_, generator=DataclassFixturesGenerator)))
+            for cls_ in (OptionalDataclass, FlagsDataclass)
+        )
+        os.utime(first, (1, 1))
+        os.utime(second, (2, 2))
+        cache.generate_fixtures(cls_=OptionalDataclass)  # a hit makes the entry recent
+        cache.max_bytes = max(first.stat().st_size, second.stat().st_size)
+        cache.evict()
+        assert [p.name for p in tmp_path.iterdir()] == [first.name]
@@ -0,0 +1,19 @@
+import fixtures_generator.generation_stats as tm
+
+
+class TestGenerationStats:
+    def test_record(self):
+        stats = tm.GenerationStats()
+        stats.record(model=int, kind='scalar', values=1, seconds=0.5, default_factory_calls=1)
+        stats.record(model=int, kind='scalar', values=2, seconds=0.25, default_factory_calls=0)
+        stats.record(model=None, kind='union', values=3, seconds=1.0, default_factory_calls=0)
+        assert stats.records[(int, 'scalar')] == tm.DispatchStats(calls=2, values=3, seconds=0.75, default_factory_calls=1)
+        assert stats.records[(None, 'union')].calls == 1
+
+        lines = stats.render().splitlines()
+        assert len(lines) == 3
+        assert lines[1].startswith('None')  # the slowest first
+        assert lines[2].startswith('int')
+
+        stats.reset()
+        assert stats.records == {}
@@ -1,5 +1,8 @@
+import gc
 import typing
+import weakref
 import pytest
+import pydantic
 from unittest.mock import patch, Mock
 import fixtures_generator.pydantic_fixtures_generator as tm
 from fixtures_generator.factory_fixtures import (
@@ -7,11 +10,13 @@ from fixtures_generator.factory_fixtures import (
     float_factory,
     str_factory,
 )
+from fixtures_generator.postponed_fixtures import PostponedPydantic, ChildPydantic
 from fixtures_generator.pydantic_fixtures import (
     SimplePydantic,
     SimpleDefaultsPydantic,
     SimpleDefaultFactoriesPydantic,
     OptionalPydantic,
+    ValidatedPydantic,
 )
 
 
@@ -97,3 +102,74 @@ class TestPydanticFixtureGenerator:
 
         result = tm.PydanticFixturesGenerator.generate_fixtures(cls_=SimpleDefaultFactoriesPydantic)
         assert result == [SimpleDefaultFactoriesPydantic()]
+
+    @patch.object(
+        tm.DataclassFixturesGenerator, tm.DataclassFixturesGenerator._generate_int.__name__, Mock(return_value=33)
+    )
+    @patch.object(
+        tm.DataclassFixturesGenerator, tm.DataclassFixturesGenerator._generate_float.__name__, Mock(return_value=.3)
+    )
+    @patch.object(
+        tm.DataclassFixturesGenerator, tm.DataclassFixturesGenerator._generate_str.__name__, Mock(return_value='x')
+    )
+    def test_iter_fixtures(self):
+        result = tm.PydanticFixturesGenerator.iter_fixtures(cls_=OptionalPydantic)
+        assert list(result) == tm.PydanticFixturesGenerator.generate_fixtures(cls_=OptionalPydantic)
+
+    def test_configure__construct(self):
+        assert tm.PydanticFixturesGenerator.configure(construct='batch')._construct == 'batch'
+
+        with pytest.raises(ValueError):
+            tm.DataclassFixturesGenerator.configure(construct='batch')
+
+    def test__compile_constructor(self):
+        construct = tm.PydanticFixturesGenerator._compile_constructor(SimplePydantic, ('xxx', 'yyy', 'zzz'))
+        instance = construct((1, 1.1, 'a'))
+        assert instance == SimplePydantic(xxx=1, yyy=1.1, zzz='a')
+        assert instance.model_fields_set == {'xxx', 'yyy', 'zzz'}
+        assert instance.model_dump() == {'xxx': 1, 'yyy': 1.1, 'zzz': 'a'}
+
+        construct = tm.PydanticFixturesGenerator._compile_constructor(ValidatedPydantic, ('name', 'flag'))
+        instance = construct(('a', True))
+        assert instance.name == 'a'  # not validated
+        assert instance._secret == 7
+
+    def test__get_adapter(self):
+        adapter = tm.PydanticFixturesGenerator._get_adapter(SimplePydantic)
+        assert adapter is tm.PydanticFixturesGenerator._get_adapter(SimplePydantic)
+        assert adapter.validate_python([{'xxx': 1, 'yyy': 1.1, 'zzz': 'a'}]) == [SimplePydantic(xxx=1, yyy=1.1, zzz='a')]
+
+        class Model(pydantic.BaseModel):
+            flag: bool
+
+        generator = tm.PydanticFixturesGenerator.configure(construct='batch')
+        assert len(generator.generate_fixtures(cls_=Model)) == 2
+        reference = weakref.ref(Model)
+        del Model
+        gc.collect()
+        assert reference() is None
+
+    def test_generate_fixtures__construct(self):
+        expected = tm.PydanticFixturesGenerator.configure(seed=1).generate_fixtures(cls_=OptionalPydantic)
+        for construct in ('fast', 'batch'):
+            generator = tm.PydanticFixturesGenerator.configure(construct=construct, seed=1)
+            assert generator.generate_fixtures(cls_=OptionalPydantic) == expected
+            assert list(tm.PydanticFixturesGenerator.configure(construct=construct, seed=1).iter_fixtures(
+                cls_=OptionalPydantic,
+            )) == list(tm.PydanticFixturesGenerator.configure(seed=1).iter_fixtures(cls_=OptionalPydantic))
+
+        validated = tm.PydanticFixturesGenerator.configure(construct='batch', seed=1).generate_fixtures(
+            cls_=ValidatedPydantic,
+        )
+        trusted = tm.PydanticFixturesGenerator.configure(construct='fast', seed=1).generate_fixtures(
+            cls_=ValidatedPydantic,
+        )
+        assert [f.name for f in validated] == [f.name.upper() for f in trusted]
+        assert validated[0]._secret == 7
+
+    def test_generate_fixtures__postponed(self):
+        assert tm.PydanticFixturesGenerator._get_fields(PostponedPydantic)[2].field_type is ChildPydantic
+        result = tm.PydanticFixturesGenerator.generate_fixtures(cls_=PostponedPydantic)
+        assert [(r.flag, r.child.flag) for r in result] == [
+            (True, True), (True, False), (False, True), (False, False), (None, True), (None, False),
+        ]
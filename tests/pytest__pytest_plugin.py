@@ -0,0 +1,93 @@
+import fixtures_generator.pytest_plugin as tm
+from fixtures_generator.dataclass_fixtures_generator import DataclassFixturesGenerator
+from fixtures_generator.dataclass_fixtures import FlagsDataclass, OptionalDataclass
+
+pytest_plugins = ('pytester',)
+PLUGIN_OPTIONS = ('-p', 'no:fixtures_generator', '-p', 'fixtures_generator.pytest_plugin')
+
+
+class TestPytestPlugin:
+    def test_lazy_fixture(self):
+        space = DataclassFixturesGenerator.space(cls_=FlagsDataclass)
+        fixture = tm.LazyFixture(space=space, index=3)
+        assert repr(fixture) == 'LazyFixture(FlagsDataclass, 3)'
+        assert fixture.build() == space[3]
+
+        seeded = tm.LazyFixture(space=DataclassFixturesGenerator.space(cls_=OptionalDataclass), index=1, seed=1)
+        assert seeded.build() == seeded.build()
+
+    def test_get_space(self):
+        assert len(tm._get_space(FlagsDataclass)) == DataclassFixturesGenerator.count_fixtures(cls_=FlagsDataclass)
+        assert len(tm._get_space(FlagsDataclass, limit=2)) == 2
+        space = tm._get_space(FlagsDataclass, strategy='each_choice')
+        assert list(space) == DataclassFixturesGenerator.generate_fixtures(cls_=FlagsDataclass, strategy='each_choice')
+
+    def test_marker(self, pytester):
+        pytester.makepyfile('''
+            import pytest
+            from fixtures_generator.dataclass_fixtures import FlagsDataclass, OptionalDataclass
+
+
+            @pytest.fixture
+            def other():
+                return 1
+
+
+            @pytest.mark.fixtures_of(FlagsDataclass, limit=3)
+            def test_flags(fixture, other):
+                assert isinstance(fixture, FlagsDataclass)
+
+
+            @pytest.mark.fixtures_of(OptionalDataclass, argname='optional', seed=1)
+            @pytest.mark.fixtures_of(FlagsDataclass, strategy='each_choice')
+            def test_two(fixture, optional):
+                assert isinstance(fixture, FlagsDataclass)
+                assert isinstance(optional, OptionalDataclass)
+        ''')
+        result = pytester.runpytest('-v', *PLUGIN_OPTIONS)
+        result.assert_outcomes(passed=3 + 3 * 4)
+        result.stdout.fnmatch_lines([
+            '*test_flags?FlagsDataclass0? PASSED*',
+            '*test_two?FlagsDataclass1-OptionalDataclass3? PASSED*',
+        ])
+
+    def test_marker__dependent_fixture(self, pytester):
+        pytester.makepyfile('''
+            import pytest
+            from fixtures_generator.dataclass_fixtures import FlagsDataclass
+
+
+            @pytest.fixture
+            def flags(fixture):
+                assert isinstance(fixture, FlagsDataclass)
+                return fixture
+
+
+            @pytest.mark.fixtures_of(FlagsDataclass, limit=2, seed=1)
+            def test_flags(flags, fixture):
+                assert flags is fixture
+        ''')
+        result = pytester.runpytest(*PLUGIN_OPTIONS)
+        result.assert_outcomes(passed=2)
+
+    def test_marker__collection(self, pytester):
+        pytester.makepyfile('''
+            import pytest
+            from fixtures_generator.dataclass_fixtures_generator import DataclassFixturesGenerator
+            from fixtures_generator.dataclass_fixtures import OptionalDataclass
+
+
+            class Generator(DataclassFixturesGenerator):
+                @classmethod
+                def _get_value(cls, *args, **kwargs):
+                    raise AssertionError('built')
+
+
+            @pytest.mark.fixtures_of(OptionalDataclass, generator=Generator)
+            def test_optional(fixture):
+                pass
+        ''')
+        result = pytester.runpytest(*PLUGIN_OPTIONS, '--collect-only', '-q')
+        result.stdout.fnmatch_lines(['*4 tests collected*'])
+        result = pytester.runpytest(*PLUGIN_OPTIONS)
+        result.assert_outcomes(errors=4)  # built while the fixture is set up
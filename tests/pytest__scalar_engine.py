@@ -0,0 +1,90 @@
+import random
+import datetime
+import decimal
+import fixtures_generator.scalar_engine as tm
+from unittest.mock import patch
+
+
+class TestScalarEngine:
+    def test_next_int(self):
+        engine = tm.ScalarEngine(rng=random.Random(1), block_size=16)
+        values = [engine.next_int() for _ in range(1000)]
+        assert all(isinstance(value, int) and 0 <= value <= 10000 for value in values)
+        assert len(set(values)) > 900
+
+    def test_next_float(self):
+        engine = tm.ScalarEngine(rng=random.Random(1), block_size=16)
+        values = [engine.next_float() for _ in range(1000)]
+        assert all(isinstance(value, float) and 0.0 <= value < 10000.0 for value in values)
+        assert len(set(values)) == 1000
+
+    def test_next_str(self):
+        engine = tm.ScalarEngine(rng=random.Random(1), block_size=16)
+        values = [engine.next_str() for _ in range(1000)]
+        assert all(len(value) == 5 and value.isascii() and value.isalpha() for value in values)
+        assert len(set(values)) == 1000
+        assert set(''.join(values)) == set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+    def test_seed(self):
+        first = tm.ScalarEngine(rng=random.Random(7))
+        second = tm.ScalarEngine(rng=random.Random(7))
+        assert [first.next_int() for _ in range(10)] == [second.next_int() for _ in range(10)]
+        assert [first.next_float() for _ in range(10)] == [second.next_float() for _ in range(10)]
+        assert [first.next_str() for _ in range(10)] == [second.next_str() for _ in range(10)]
+
+    def test_draw_ints(self):
+        engine = tm.ScalarEngine(rng=random.Random(1), block_size=1000)
+        values = engine._draw_ints()
+        assert 900 < len(values) <= 1000  # numbers above the limit are rejected
+        assert engine._ints == []
+
+    def test_pools(self):
+        engine = tm.ScalarEngine(rng=random.Random(1), block_size=16)
+        raw = [engine.next_bytes() for _ in range(100)]
+        assert all(len(value) == 8 for value in raw) and len(set(raw)) == 100
+        values = [engine.next_uuid() for _ in range(100)]
+        assert all(value.version == 4 for value in values) and len(set(values)) == 100
+        values = [engine.next_datetime() for _ in range(100)]
+        assert all(datetime.datetime(2000, 1, 1) <= value < datetime.datetime(2038, 1, 1) for value in values)
+        assert len(set(values)) == 100
+        values = [engine.next_date() for _ in range(100)]
+        assert all(type(value) is datetime.date and 2000 <= value.year <= 2037 for value in values)
+        values = [engine.next_decimal() for _ in range(100)]
+        assert all(decimal.Decimal(0) <= value <= decimal.Decimal(100) for value in values)
+        assert all(value.as_tuple().exponent == -2 for value in values)
+
+        other = tm.ScalarEngine(rng=random.Random(1), block_size=16)
+        assert [other.next_bytes() for _ in range(100)] == raw
+
+    def test_take(self):
+        engine = tm.ScalarEngine(rng=random.Random(1), block_size=16)
+        values = engine.take_ints(100)
+        assert len(values) == 100 and all(0 <= value <= 10000 for value in values)
+        assert engine.take_strs(0) == [] and len(engine.take_strs(40)) == 40
+        assert len(set(engine.take_uuids(50))) == 50
+        assert all(0.0 <= value < 10000.0 for value in engine.take_floats(10))
+
+        other = tm.ScalarEngine(rng=random.Random(1), block_size=16)
+        assert other.take_ints(100) == values
+
+    def test_take__pools(self):
+        engine = tm.ScalarEngine(rng=random.Random(1), block_size=16)
+        values = engine.take_bytes(40)
+        assert len(values) == 40 and all(len(value) == 8 for value in values)
+        assert tm.ScalarEngine(rng=random.Random(1), block_size=16).take_bytes(40) == values
+        values = engine.take_datetimes(40)
+        assert all(datetime.datetime(2000, 1, 1) <= value < datetime.datetime(2038, 1, 1) for value in values)
+        values = engine.take_dates(40)
+        assert len(values) == 40 and all(type(value) is datetime.date for value in values)
+        values = engine.take_decimals(40)
+        assert len(values) == 40 and all(decimal.Decimal(0) <= value <= decimal.Decimal(100) for value in values)
+
+    def test_random_array__big_endian(self):
+        with patch.object(tm.sys, 'byteorder', 'little'):
+            little = tm.ScalarEngine(rng=random.Random(1))._random_array('H', 8)
+
+        with patch.object(tm.sys, 'byteorder', 'big'):
+            big = tm.ScalarEngine(rng=random.Random(1))._random_array('H', 8)
+
+        big.byteswap()  # numbers of the same little endian bytes are swapped on big endian platforms
+        assert big == little
@@ -0,0 +1,127 @@
+import json
+import uuid
+import typing
+import decimal
+import sqlite3
+import dataclasses
+import pytest
+import fixtures_generator.sqlite_loader as tm
+from fixtures_generator.dataclass_fixtures_generator import DataclassFixturesGenerator
+from fixtures_generator.dataclass_fixtures import (
+    OptionalDataclass,
+    SubtypesDataclass,
+    TreeDataclass,
+    FlagsDataclass,
+    OneTwo,
+)
+from fixtures_generator.attrs_fixtures import OptionalAttrs
+from fixtures_generator.pydantic_fixtures import OptionalPydantic
+
+
+@dataclasses.dataclass
+class ValuesDataclass:
+    price: decimal.Decimal
+    key: uuid.UUID
+    data: bytes
+    kind: typing.Literal['a', 'b']
+    one_two: typing.Optional[OneTwo]
+
+
+@dataclasses.dataclass
+class OneColumnDataclass:
+    flag: bool
+
+
+def _get_schema(conn, table):
+    return conn.execute('SELECT sql FROM sqlite_master WHERE name = ?', (table,)).fetchone()[0]
+
+
+class TestSqliteLoader:
+    def test_load_into_sqlite(self):
+        conn = sqlite3.connect(':memory:')
+        generator = DataclassFixturesGenerator.configure(seed=1)
+        assert tm.load_into_sqlite(conn, OptionalDataclass, generator=generator) == 4
+        assert _get_schema(conn, 'OptionalDataclass') == (
+            'CREATE TABLE "OptionalDataclass" ("x" INTEGER, "y" REAL, "z" TEXT, "d" TEXT, '
+            '"s.x" INTEGER, "s.y" REAL, "s.z" TEXT)'
+        )
+        rows = conn.execute('SELECT * FROM "OptionalDataclass"').fetchall()
+        fixtures = DataclassFixturesGenerator.configure(seed=1).iter_fixtures(cls_=OptionalDataclass)
+        assert rows == [
+            (f.x, f.y, json.dumps(f.z), json.dumps(f.d), f.s.x, f.s.y, f.s.z) for f in fixtures
+        ]
+
+        assert tm.load_into_sqlite(conn, OptionalDataclass, batch_size=3) == 4  # the table exists already
+        assert conn.execute('SELECT count(*) FROM "OptionalDataclass"').fetchone() == (8,)
+
+    def test_load_into_sqlite__types(self):
+        conn = sqlite3.connect(':memory:', isolation_level=None)  # autocommit
+        assert tm.load_into_sqlite(conn, SubtypesDataclass, table='subtypes') == 1
+        assert _get_schema(conn, 'subtypes') == (
+            'CREATE TABLE "subtypes" ("x" INTEGER, "y" REAL, "z" TEXT, "one_two" TEXT, "first_second" INTEGER, '
+            '"simple.x" INTEGER, "simple.y" REAL, "simple.z" TEXT)'
+        )
+        assert conn.execute('SELECT one_two, first_second FROM subtypes').fetchone() in {
+            ('one', 1), ('one', 2), ('two', 1), ('two', 2),
+        }
+
+        count = DataclassFixturesGenerator.count_fixtures(cls_=TreeDataclass)
+        assert tm.load_into_sqlite(conn, TreeDataclass, limit=10) == 10
+        assert count > 10
+        parent, children = conn.execute('SELECT parent, children FROM "TreeDataclass"').fetchone()
+        assert isinstance(json.loads(parent), dict) and isinstance(json.loads(children), list)
+        assert not conn.in_transaction
+
+    def test_load_into_sqlite__backends(self):
+        conn = sqlite3.connect(':memory:')
+        assert tm.load_into_sqlite(conn, OptionalAttrs) == 4
+        assert tm.load_into_sqlite(conn, OptionalPydantic) == 4
+        assert 's.xx' in _get_schema(conn, 'OptionalAttrs')
+
+    def test_load_into_sqlite__rollback(self):
+        conn = sqlite3.connect(':memory:')
+        conn.execute('CREATE TABLE "FlagsDataclass" (a INTEGER)')
+        conn.commit()
+        with pytest.raises(sqlite3.OperationalError):
+            tm.load_into_sqlite(conn, FlagsDataclass)
+
+        assert conn.execute('SELECT count(*) FROM "FlagsDataclass"').fetchone() == (0,)
+
+        with pytest.raises(ValueError):
+            tm.load_into_sqlite(conn, FlagsDataclass, batch_size=0)
+
+    def test_load_into_sqlite__values(self):
+        conn = sqlite3.connect(':memory:')
+        assert tm.load_into_sqlite(conn, ValuesDataclass) == 2 * 2
+        assert _get_schema(conn, 'ValuesDataclass') == (
+            'CREATE TABLE "ValuesDataclass" ("price" TEXT, "key" TEXT, "data" BLOB, "kind" TEXT, "one_two" TEXT)'
+        )
+        rows = conn.execute('SELECT price, key, data, kind, one_two FROM "ValuesDataclass"').fetchall()
+        assert {row[3] for row in rows} == {'a', 'b'}
+        assert {row[4] for row in rows} - {'one', 'two'} == {None}
+        price, key, data, _kind, _one_two = rows[0]
+        assert decimal.Decimal(price) and uuid.UUID(key) and isinstance(data, bytes)
+
+        assert tm.load_into_sqlite(conn, OneColumnDataclass) == 2
+        assert conn.execute('SELECT flag FROM "OneColumnDataclass"').fetchall() == [(1,), (0,)]
+
+    def test_load_into_sqlite__transaction(self):
+        conn = sqlite3.connect(':memory:')
+        conn.execute('CREATE TABLE log (message TEXT)')
+        conn.execute("INSERT INTO log VALUES ('started')")
+        assert conn.in_transaction
+        assert tm.load_into_sqlite(conn, FlagsDataclass) == 96
+        assert conn.in_transaction  # the transaction of the caller is not committed
+        conn.rollback()
+        assert conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall() == [('log',)]
+        assert conn.execute('SELECT message FROM log').fetchall() == []
+
+        conn.execute('CREATE TABLE "FlagsDataclass" (a INTEGER)')
+        conn.execute("INSERT INTO log VALUES ('started')")
+        with pytest.raises(sqlite3.OperationalError):
+            tm.load_into_sqlite(conn, FlagsDataclass)
+
+        assert conn.in_transaction  # only the rows of the loader are rolled back
+        conn.commit()
+        assert conn.execute('SELECT message FROM log').fetchall() == [('started',)]
+        assert conn.execute('SELECT count(*) FROM "FlagsDataclass"').fetchone() == (0,)